@@ -4,7 +4,9 @@ import argparse
 import io
 import logging
 import os
+import shutil
 import statistics
+import subprocess
 import sys
 import tempfile
 import time
@@ -17,7 +19,9 @@ sys.path.insert(0, str(StdlibPath(__file__).parent.parent / "src"))
 from jinja2 import Environment
 
 from yaconfiglib.loader import ConfigLoader, ConfigLoaderMergeMethod, DotAccessibleDict
+from yaconfiglib.backends.command import CommandBackend
 from yaconfiglib.backends.env import EnvVarBackend
+from yaconfiglib.backends.yaml import YamlConfig
 from yaconfiglib.utils import jinja2
 from yaconfiglib.utils.merge import MergeMethod
 from yaconfiglib.utils.source import has_glob_pattern, parse_sources
@@ -113,6 +117,33 @@ def benchmark_sources() -> BenchmarkRows:
             )
         )
 
+        # In-memory documents are parsed by the backend's loads() directly,
+        # with no MemPath written and read back per document.
+        memory_loader = ConfigLoader(interpolate=False)
+        rows.append(
+            (
+                "in-memory '#!' JSON docs through load() (2000)",
+                _measure(
+                    lambda: [memory_loader.load('#!doc.json\n{"inline": true}') for _ in range(2000)],
+                    repeat=5,
+                ),
+            )
+        )
+
+        # Command output with no +fmt or shebang: the sniffer picks the
+        # backend from the first line instead of failing through json/yaml.
+        command_backend = CommandBackend()
+        for fmt, output in (("toml", 'token = "abc"\nttl = 30\n'), ("dotenv", "export TOKEN=abc\nTTL=30\n")):
+            rows.append(
+                (
+                    f"sniff command output, {fmt} (2000)",
+                    _measure(
+                        lambda output=output: [command_backend._parse_output(output, None, {}) for _ in range(2000)],
+                        repeat=5,
+                    ),
+                )
+            )
+
         duplicate_count = len(list(parse_sources(["a.yaml", "a.yaml"], base_dir=root)))
         nested_count = len(list(parse_sources([["a.yaml", "b.yaml"], "c.yaml"], base_dir=root)))
         command_path = next(parse_sources(["cmd+json://echo {\"x\":[1]}"], base_dir=root))
@@ -134,6 +165,22 @@ def benchmark_sources() -> BenchmarkRows:
             ),
         )
     )
+
+    # The same YAML tree through libyaml's CSafeLoader and pure-Python SafeLoader.
+    yaml_text = "".join(
+        f"service_{i}:\n  host: host-{i}.internal\n  port: {8000 + i}\n"
+        f"  tags: [a, b, c]\n  limits: {{cpu: {i % 8}, mem: {i * 16}}}\n"
+        for i in range(2_500)
+    )
+    backend = YamlConfig()
+    size = f"{len(yaml_text) / 1024:.0f} KiB"
+    if YamlConfig.USE_LIBYAML:
+        rows.append((f"YAML loads, libyaml ({size})", _measure(lambda: backend.loads(yaml_text), repeat=3)))
+    YamlConfig.USE_LIBYAML, use_libyaml = False, YamlConfig.USE_LIBYAML
+    try:
+        rows.append((f"YAML loads, pure Python ({size})", _measure(lambda: backend.loads(yaml_text), repeat=3)))
+    finally:
+        YamlConfig.USE_LIBYAML = use_libyaml
     return rows
 
 
@@ -177,7 +224,83 @@ def benchmark_merge() -> BenchmarkRows:
         for _ in range(200):
             loader.load(*docs)
 
+    def allowlists(size: int) -> tuple[list, list]:
+        # Two overlapping allowlists of CIDR strings, half of b already in a.
+        ranges = [f"10.{i // 65536}.{i // 256 % 256}.{i % 256}/32" for i in range(size * 3 // 2)]
+        return ranges[:size], ranges[size // 2 :]
+
+    list_rows: BenchmarkRows = []
+    for size in (1_000, 5_000, 20_000):
+        a, b = allowlists(size)
+        list_rows.append(
+            (
+                f"deep merge, unique lists ({size // 1000}k + {size // 1000}k)",
+                _measure(lambda: MergeMethod.Deep(list(a), b), repeat=3),
+            )
+        )
+
+    def layer(i: int) -> dict:
+        return {
+            "db": {"port": i, f"opt{i % 7}": True},
+            "services": {f"svc{j}": {"replicas": i, "tags": [j]} for j in range(i % 5, 20, 5)},
+            f"key{i}": i,
+        }
+
+    layer_rows: BenchmarkRows = []
+    for count in (10, 50, 200):
+        layers = [layer(i) for i in range(count)]
+
+        # structural_sharing leaves the layers intact, so they can be reused.
+        def pairwise(layers=layers) -> None:
+            result = None
+            for doc in layers:
+                result = MergeMethod.Deep(result, doc, structural_sharing=True)
+
+        def n_way(layers=layers) -> None:
+            MergeMethod.Deep.merge_many(layers, structural_sharing=True)
+
+        layer_rows.append((f"deep merge, pairwise fold ({count} layers)", _measure(pairwise, repeat=5)))
+        layer_rows.append((f"deep merge, merge_many ({count} layers)", _measure(n_way, repeat=5)))
+
+    def servers(count: int, port: int) -> list[dict]:
+        return [{"name": f"srv{i}", "port": port} for i in range(count)]
+
+    # Overlay in reverse order: positional matching pairs the wrong records.
+    keyed_rows: BenchmarkRows = []
+    for count in (1_000, 5_000):
+        base, overlay = servers(count, 80), servers(count, 8080)[::-1]
+        keyed_rows.append(
+            (
+                f"deep merge, servers by merge_key ({count // 1000}k)",
+                _measure(lambda: MergeMethod.Deep(base, overlay, merge_key="name", structural_sharing=True), repeat=3),
+            )
+        )
+        keyed_rows.append(
+            (
+                f"deep merge, servers by mergelists ({count // 1000}k)",
+                _measure(lambda: MergeMethod.Deep(base, overlay, mergelists=True, structural_sharing=True), repeat=3),
+            )
+        )
+
+    # One base service block aliased 300 times, overlaid by an aliased patch.
+    anchored = (
+        "#!.yaml\nbase: &base\n  image: app\n  ports: [{port: 80}]\n  env: {A: '1', B: '2'}\nservices:\n"
+        + "".join(f"  svc{i}: *base\n" for i in range(300)),
+        "#!.yaml\npatch: &patch\n  ports: [{port: 443}]\n  env: {B: '3'}\nservices:\n"
+        + "".join(f"  svc{i}: *patch\n" for i in range(300)),
+    )
+
+    anchored_base, anchored_patch = (ConfigLoader().load(doc) for doc in anchored)
+
+    def merge_anchored() -> None:
+        for _ in range(20):
+            MergeMethod.Deep(anchored_base, anchored_patch, structural_sharing=True)
+
     return [
+        *list_rows,
+        *layer_rows,
+        *keyed_rows,
+        ("deep merge, anchored services (300 aliases x20)", _measure(merge_anchored, repeat=5)),
         ("deep merge, append list dicts (1k)", _measure(lambda: deep_merge_many(False), repeat=5)),
         ("deep merge, positional list dicts (1k)", _measure(lambda: deep_merge_many(True), repeat=5)),
         ("loader deep merge_options mergelists (200)", _measure(load_merge_options_many, repeat=5)),
@@ -215,8 +338,45 @@ def benchmark_jinja() -> BenchmarkRows:
         for _ in range(100):
             jinja2.interpolate(data, globals=context, environment=env)
 
+    def sparse_tree() -> dict:
+        tree = {f"svc{i}": {f"k{j}": f"value {i} {j}" for j in range(100)} for i in range(1_000)}
+        tree["svc1"]["k1"] = "{{ host }}"
+        tree["svc500"]["k2"] = "url://{{ host }}:{{ port }}"
+        tree["svc999"]["k3"] = "{{ port }}"
+        return tree
+
+    sparse = sparse_tree()
+
+    sources = [f"{{% for x in items %}}{{{{ x.name }}}}-{i}{{% endfor %}}{{{{ port + {i} }}}}" for i in range(500)]
+
+    def compile_all(cache: str | None) -> Callable[[], None]:
+        def run() -> None:
+            # An empty LRU, as in a freshly forked worker.
+            jinja2._COMPILE_CACHE.clear()
+            previous = jinja2.BYTECODE_CACHE
+            jinja2.set_bytecode_cache(cache)
+            try:
+                for source in sources:
+                    jinja2.compile(source)
+            finally:
+                jinja2.set_bytecode_cache(previous)
+
+        return run
+
+    with tempfile.TemporaryDirectory() as bytecode_dir:
+        compile_all(bytecode_dir)()  # populate the bytecode cache
+        compile_rows: BenchmarkRows = [
+            ("compile 500 templates, cold", _measure(compile_all(None), repeat=3)),
+            ("compile 500 templates, bytecode cache", _measure(compile_all(bytecode_dir), repeat=3)),
+        ]
+
     return [
         ("interpolate nested structure (100)", _measure(interpolate_many, repeat=5)),
+        *compile_rows,
+        (
+            "interpolate 100k plain values + 3 templates",
+            _measure(lambda: jinja2.interpolate(sparse, globals=context, environment=env), repeat=5),
+        ),
         (
             "load_all inline docs with interpolate (5 x 50 docs)",
             _measure(lambda: [list(loader.load_all(docs)) for _ in range(5)], repeat=3),
@@ -306,6 +466,166 @@ def benchmark_env() -> BenchmarkRows:
     return rows
 
 
+def _startup_time(script: str, *, repeat: int = 3) -> float:
+    """Median wall time of a fresh interpreter running *script*."""
+    src = str(StdlibPath(__file__).parent.parent / "src")
+    env = dict(os.environ, PYTHONPATH=src)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", script], check=True, env=env)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark_cache() -> BenchmarkRows:
+    from yaconfiglib.utils.cache import CommandCache, DocumentCache
+
+    rows: BenchmarkRows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = StdlibPath(tmpdir)
+        big = root / "big.yaml"
+        big.write_text(
+            "".join(
+                f"service_{i}:\n  host: host-{i}.internal\n  port: {8000 + i}\n"
+                f"  tags: [a, b, c]\n  limits: {{cpu: {i % 8}, mem: {i * 16}}}\n"
+                for i in range(2_000)
+            ),
+            encoding="utf-8",
+        )
+        rows.append(("source size", f"{big.stat().st_size / 1024:.0f} KiB"))
+
+        uncached = ConfigLoader(base_dir=root)
+        cached = ConfigLoader(base_dir=root, cache=DocumentCache())
+        rows.append(("load, no cache", _measure(lambda: uncached.load("big.yaml"), repeat=3)))
+        rows.append(("load, memory cache hit", _measure(lambda: cached.load("big.yaml"), repeat=3)))
+
+        # A hit hands out a private copy (thaw), so its cost grows with the
+        # document, though far more slowly than a parse.
+        for count in (200, 2_000, 20_000):
+            doc = root / f"doc{count}.yaml"
+            doc.write_text(
+                "".join(
+                    f"service_{i}:\n  host: host-{i}.internal\n  port: {8000 + i}\n"
+                    f"  tags: [a, b, c]\n  limits: {{cpu: {i % 8}, mem: {i * 16}}}\n"
+                    for i in range(count)
+                ),
+                encoding="utf-8",
+            )
+            size = f"{doc.stat().st_size / 1024:.0f} KiB"
+            rows.append((f"parse, {size}", _measure(lambda: uncached.load(doc.name), repeat=3)))
+            rows.append((f"cache hit (copy out), {size}", _measure(lambda: cached.load(doc.name), repeat=3)))
+
+        cache_dir = root / "cache"
+        script = (
+            "from yaconfiglib import ConfigLoader; "
+            f"ConfigLoader(base_dir={str(root)!r}, cache_dir=%s).load('big.yaml')"
+        )
+        rows.append(("startup, no cache_dir", _startup_time(script % "None")))
+        cold_samples = []
+        for _ in range(3):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold_samples.append(_startup_time(script % repr(str(cache_dir)), repeat=1))
+        rows.append(("startup, cold cache_dir", statistics.median(cold_samples)))
+        rows.append(("startup, warm cache_dir", _startup_time(script % repr(str(cache_dir)))))
+
+    # The same secret command !include'd from 5 files, each loaded 4 times (reloads).
+    # memoize_includes=False so each include reaches the command backend.
+    command = f"cmd+json://\"{sys.executable}\" -c \"print('{{}}')\""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = StdlibPath(tmpdir)
+        files = [f"app{i}.yaml" for i in range(5)]
+        for name in files:
+            (root / name).write_text("secret: !include '%s'\n" % command.replace("'", "''"), encoding="utf-8")
+        for label, command_cache in (("no command_cache", None), ("command_cache", CommandCache())):
+            loader = ConfigLoader(base_dir=root, command_cache=command_cache, memoize_includes=False)
+            rows.append((f"included command x20, {label}", _measure(lambda: [loader.load(name) for _ in range(4) for name in files], repeat=1, warmup=False)))
+    return rows
+
+
+_COPROCESS_HELPER = """\
+import json, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    output = json.dumps({"secret": message["request"]})
+    print(json.dumps({"id": message["id"], "output": output}), flush=True)
+"""
+
+
+def benchmark_commands() -> BenchmarkRows:
+    rows: BenchmarkRows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        helper = StdlibPath(tmpdir) / "helper.py"
+        helper.write_text(_COPROCESS_HELPER, encoding="utf-8")
+        secret = StdlibPath(tmpdir) / "secret.py"
+        secret.write_text("import json, sys\nprint(json.dumps({'secret': sys.argv[1]}))\n", encoding="utf-8")
+        loader = ConfigLoader(interpolate=False)
+
+        # 100 secrets: one process per source vs one long-lived helper.
+        rows.append(("cmd+json:// secrets (100)", _measure(lambda: [loader.load(f"cmd+json://python {secret.as_posix()} s{i}") for i in range(100)], repeat=1, warmup=False)))
+        rows.append(("coproc+json:// secrets (100)", _measure(lambda: [loader.load(f"coproc+json://python {helper.as_posix()}#s{i}") for i in range(100)], repeat=3)))
+        CommandBackend.close_coprocesses()
+
+    # Spawn latency: the same trivial command through /bin/sh vs started directly.
+    rows.append(("cmd+json://echo {} via shell (100)", _measure(lambda: [loader.load("cmd+json://echo {}") for _ in range(100)], repeat=3)))
+    rows.append(("exec+json://echo {} direct (100)", _measure(lambda: [loader.load("exec+json://echo {}") for _ in range(100)], repeat=3)))
+    return rows
+
+
+def _import_times(script: str) -> dict[str, int]:
+    """Cumulative ``-X importtime`` microseconds per module for a fresh interpreter running *script*."""
+    src = str(StdlibPath(__file__).parent.parent / "src")
+    env = dict(os.environ, PYTHONPATH=src)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        check=True,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def benchmark_import() -> BenchmarkRows:
+    rows: BenchmarkRows = []
+    rows.append(("startup, import yaconfiglib", _startup_time("import yaconfiglib", repeat=5)))
+    samples = [_import_times("import yaconfiglib") for _ in range(5)]
+    rows.append(
+        ("importtime, yaconfiglib", statistics.median(s["yaconfiglib"] for s in samples) / 1e6)
+    )
+    # Breakdown of the heaviest dependencies; "-" means not imported at all.
+    breakdown = samples[-1]
+    for module in (
+        "pathlib_next",
+        "yaconfiglib.loader",
+        "yaconfiglib.backends",
+        "yaml",
+        "jinja2",
+        "subprocess",
+    ):
+        value = breakdown.get(module)
+        rows.append((f"importtime, {module}", value / 1e6 if value is not None else "-"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = StdlibPath(tmpdir) / "settings.json"
+        source.write_text('{"debug": true}', encoding="utf-8")
+        script = f"import yaconfiglib; yaconfiglib.load({str(source)!r})"
+        rows.append(("startup, load one JSON file", _startup_time(script, repeat=5)))
+        loaded = _import_times(script)
+        rows.append(
+            (
+                "JSON load imports yaml/jinja2",
+                ", ".join(m for m in ("yaml", "jinja2") if m in loaded) or "no",
+            )
+        )
+    return rows
+
+
 def collect_rows(command: str) -> list[tuple[str, BenchmarkRows]]:
     suites = {
         "sources": benchmark_sources,
@@ -313,6 +633,9 @@ def collect_rows(command: str) -> list[tuple[str, BenchmarkRows]]:
         "jinja": benchmark_jinja,
         "dot": benchmark_dot_access,
         "env": benchmark_env,
+        "cache": benchmark_cache,
+        "commands": benchmark_commands,
+        "import": benchmark_import,
     }
     if command == "all":
         return [(name, benchmark()) for name, benchmark in suites.items()]
@@ -325,7 +648,7 @@ def cli(argv: list[str] | None = None) -> None:
     parser.add_argument(
         "command",
         nargs="?",
-        choices=["all", "sources", "merge", "jinja", "dot", "env"],
+        choices=["all", "sources", "merge", "jinja", "dot", "env", "cache", "commands", "import"],
         default="all",
         help="benchmark suite to run",
     )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from .backends import ConfigBackend as ConfigBackend
 from .loader import (
+    ConfigHandle as ConfigHandle,
     ConfigLoader as ConfigLoader,
     ConfigLoaderMergeMethod as ConfigLoaderMergeMethod,
     CommandsDisabledError as CommandsDisabledError,
@@ -19,6 +20,7 @@ from .utils.merge import (
 )
 
 __all__ = [
+    "ConfigHandle",
     "ConfigLoader",
     "ConfigLoaderMergeMethod",
     "CommandsDisabledError",
@@ -1,24 +1,41 @@
 from __future__ import annotations
 
+import typing as _ty
+
+from .base import BUILTIN_BACKENDS as _BUILTIN_BACKENDS
+from .base import BackendSpec as BackendSpec
 from .base import ConfigBackend as ConfigBackend
-from .command import CommandBackend as CommandBackend
-from .dotenv import DotenvBackend as DotenvBackend
-from .env import EnvVarBackend as EnvVarBackend
-from .ini import IniConfig as IniConfig
-from .json import JsonConfig as JsonConfig
-from .python_backend import PythonBackend as PythonBackend
-
-try:
-    from .jinja2 import Jinja2ConfigLoader as Jinja2ConfigLoader
-except ImportError:
-    pass
 
-try:
+if _ty.TYPE_CHECKING:
+    from .command import CommandBackend as CommandBackend
+    from .dotenv import DotenvBackend as DotenvBackend
+    from .env import EnvVarBackend as EnvVarBackend
+    from .ini import IniConfig as IniConfig
+    from .jinja2 import Jinja2ConfigLoader as Jinja2ConfigLoader
+    from .json import JsonConfig as JsonConfig
+    from .python_backend import PythonBackend as PythonBackend
     from .toml import TomlConfig as TomlConfig
-except ImportError:
-    pass
-
-try:
     from .yaml import YamlConfig as YamlConfig
-except ImportError:
-    pass
+
+# Backend classes are exported lazily (PEP 562): importing this package does
+# not import PyYAML, Jinja2, tomllib or subprocess until a backend is used.
+_EXPORTS = {spec.attribute: spec for spec in _BUILTIN_BACKENDS}
+
+
+def __getattr__(name: str) -> object:
+    spec = _EXPORTS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = spec.load()
+    except ImportError as error:
+        # An optional dependency is missing: behave as if never exported.
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({error})"
+        ) from error
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import importlib as _importlib
 import re as _re
+import sys as _sys
 import typing as _ty
+import weakref as _weakref
 
 try:
     from pathlib_next import LocalPath as _LocalPath
@@ -15,13 +18,90 @@ except ImportError:
 
 if _ty.TYPE_CHECKING:
     import yaml as _yaml
-else:
 
-    try:
-        import yaml as _yaml
-    except ImportError:
-        _yaml = None
-        ...
+    from yaconfiglib.utils.source import TextLike
+
+
+class BackendSpec(_ty.NamedTuple):
+    """What dispatch needs to know about a built-in backend before importing it.
+
+    Attributes:
+        name: The backend's registry name (``loader="yaml"``).
+        module: Module under ``yaconfiglib.backends`` defining the backend.
+        attribute: Name of the backend class in that module.
+        pattern: The backend's :attr:`ConfigBackend.PATHNAME_REGEX`, or
+            ``None`` for backends only selected by name.
+    """
+
+    name: str
+    module: str
+    attribute: str
+    pattern: _re.Pattern | None = None
+
+    def load(self) -> type[ConfigBackend]:
+        """Import the backend's module and return the backend class."""
+        module = _importlib.import_module(f".{self.module}", __package__)
+        return getattr(module, self.attribute)
+
+
+#: The built-in backends, in dispatch order. Their modules are imported the
+#: first time a path or name lookup could select them, so importing
+#: ``yaconfiglib`` does not pay for PyYAML, Jinja2, ``subprocess`` and friends.
+BUILTIN_BACKENDS: tuple[BackendSpec, ...] = (
+    BackendSpec(
+        "command",
+        "command",
+        "CommandBackend",
+        _re.compile(
+            r"^(exec|cmd|sh|coproc|exec\+\w+|cmd\+\w+|coproc\+\w+)(://|:\\|:/|:).*"
+            r"|.*?\.(sh|bat|ps1|cmd)$",
+            _re.IGNORECASE,
+        ),
+    ),
+    BackendSpec(
+        "dotenv",
+        "dotenv",
+        "DotenvBackend",
+        _re.compile(r".*\.env(\..+)?$", _re.IGNORECASE),
+    ),
+    BackendSpec("env", "env", "EnvVarBackend"),
+    BackendSpec("ini", "ini", "IniConfig", _re.compile(r".*\.ini$", _re.IGNORECASE)),
+    BackendSpec(
+        "json", "json", "JsonConfig", _re.compile(r".*\.json$", _re.IGNORECASE)
+    ),
+    BackendSpec("python", "python_backend", "PythonBackend"),
+    BackendSpec(
+        "jinja2",
+        "jinja2",
+        "Jinja2ConfigLoader",
+        _re.compile(r".*\.((j2)|(jinja2))$", _re.IGNORECASE),
+    ),
+    BackendSpec(
+        "toml", "toml", "TomlConfig", _re.compile(r".*\.toml$", _re.IGNORECASE)
+    ),
+    BackendSpec(
+        "yaml",
+        "yaml",
+        "YamlConfig",
+        _re.compile(r".*\.((yaml)|(yml))$", _re.IGNORECASE),
+    ),
+)
+
+# Built-ins not imported yet, by name, and a combined pattern over the
+# file-based ones (rebuilt when the set shrinks). Entries are only ever
+# popped, so concurrent lookups at worst import a module twice.
+_PENDING: dict[str, BackendSpec] = {spec.name: spec for spec in BUILTIN_BACKENDS}
+_PENDING_PATTERN: list = [None, None]
+
+# Dispatch indexes per lookup root (see ConfigBackend._index). Cleared whenever
+# a backend class is defined, so the next lookup rebuilds from scratch.
+_INDEXES: dict[type, _BackendIndex] = {}
+
+# A PATHNAME_REGEX of the form ``.*\.ext$`` or ``.*\.((ext1)|(ext2))$``: a
+# plain case-insensitive suffix test that can go through a dict lookup.
+_SUFFIX_REGEX = _re.compile(
+    r"\.\*\\\.(?:(?P<one>\w+)|\((?P<many>\(?\w+\)?(?:\|\(?\w+\)?)*)\))\$", _re.ASCII
+)
 
 
 class ConfigBackend(_ty.Protocol):
@@ -35,13 +115,25 @@ class ConfigBackend(_ty.Protocol):
     :attr:`PATHNAME_REGEX` against the source path.
 
     To implement a new backend, subclass :class:`ConfigBackend` and override
-    :meth:`load` (required) and optionally :meth:`dumps` (for round-trip
+    :meth:`load` (required), optionally :meth:`loads` (to parse in-memory
+    text without going through a path) and :meth:`dumps` (for round-trip
     serialization support). Subclasses are auto-discovered — simply
     importing the module that defines the subclass registers it; no
     explicit registry call is needed. See ``yaconfiglib.backends`` for the
     built-in implementations (YAML, TOML, JSON, INI, dotenv, env, command,
     python, jinja2).
 
+    The built-in backends listed in :data:`BUILTIN_BACKENDS` are imported
+    on demand: a lookup imports a built-in's module only when its name or
+    pattern could select it, and dispatch ranks the built-ins in that
+    table's order no matter which was imported first.
+
+    Path and name lookups go through an index that is rebuilt lazily after
+    a new backend class is defined: suffix-only regexes (``.*\\.json$``)
+    become dict lookups, the remaining regexes are combined into a single
+    alternation, and backends overriding :meth:`can_load_path` are asked in
+    turn. The first-match order of :meth:`__subclasses__` is preserved.
+
     Class attributes:
         PATHNAME_REGEX: Compiled regex matched against a path's filename
             (or, for scheme-based backends like ``CommandBackend``, the
@@ -51,6 +143,14 @@ class ConfigBackend(_ty.Protocol):
         NAME: Explicit registry name used by ``loader="name"`` lookups. If
             unset, the name is derived from the class name by lowercasing
             it and stripping a trailing ``Loader``/``Config`` suffix.
+        CACHEABLE: Whether a parsed document depends only on the file's
+            bytes and the reader options, letting
+            :class:`~yaconfiglib.utils.cache.DocumentCache` reuse it while
+            the file is unchanged. Leave False for backends that run
+            commands, read the environment, or render templates.
+        CACHE_VERSION: Version tag of the underlying parser, folded into
+            :class:`~yaconfiglib.utils.cache.DiskCache` keys so upgrading
+            the parser library invalidates persisted parse results.
         DEFAULT_ENCODING: Text encoding used when a backend reads a file
             and no explicit ``encoding=`` is supplied.
         DEFAULT_PATH_FACTORY: Path constructor used to build path objects
@@ -59,9 +159,15 @@ class ConfigBackend(_ty.Protocol):
 
     PATHNAME_REGEX: _re.Pattern = None
     NAME: str = None
+    CACHEABLE = False
+    CACHE_VERSION: str = None
     DEFAULT_ENCODING = "utf-8"
     DEFAULT_PATH_FACTORY = _LocalPath
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _INDEXES.clear()
+
     def __call__(self, *args, **kwds):
         """Dispatch to :meth:`_yaml_tag_constructor` when used as a PyYAML tag constructor.
 
@@ -70,10 +176,13 @@ class ConfigBackend(_ty.Protocol):
         tags) — PyYAML calls constructors as ``constructor(loader, node)``,
         which this method recognizes and routes accordingly.
         """
+        # PyYAML is only imported by the YAML backend; if it isn't loaded,
+        # nothing can be calling us as a tag constructor.
+        yaml = _sys.modules.get("yaml")
         if (
             len(args) == 2
-            and _yaml is not None
-            and isinstance(args[0], _yaml.constructor.BaseConstructor)
+            and yaml is not None
+            and isinstance(args[0], yaml.constructor.BaseConstructor)
         ):
             return self._yaml_tag_constructor(*args, **kwds)
 
@@ -86,6 +195,8 @@ class ConfigBackend(_ty.Protocol):
         equivalent ``self.load(pathname, *args, **kwargs, master=loader)``
         call.
         """
+        import yaml as _yaml
+
         args = ()
         kwargs = {}
         pathname: str | _Pathname | _ty.Sequence[str | _Pathname]
@@ -112,6 +223,46 @@ class ConfigBackend(_ty.Protocol):
         """
         raise NotImplementedError()
 
+    def loads(self, data: TextLike, *, name: str = None, **options) -> object:
+        """Parse in-memory *data* and return the configuration object.
+
+        :class:`~yaconfiglib.loader.ConfigLoader` calls this for in-memory
+        sources (``loads()``, ``#!`` documents, streams), rendered templates
+        and command output, so none of them is written to a file first.
+        *data* may be ``str``, ``bytes``, ``bytearray`` or ``memoryview``;
+        binary data is decoded with the ``encoding`` option straight from
+        the buffer. *name* is the document's (virtual) filename, used in
+        error messages and by backends that dispatch on it.
+
+        The built-in text formats implement this natively. The default
+        wraps *data* in a :class:`~yaconfiglib.utils.source.MemorySource`
+        and calls :meth:`load` with it, which suits backends that read
+        their source through ``path.read_text()``/``path.read_bytes()`` or
+        ``path.open()`` and check it with ``path.exists()``/``is_file()``.
+        Other filesystem calls (``stat()``, ``resolve()``, ...) are not
+        available on it.
+        """
+        from yaconfiglib.utils.source import memory_source
+
+        return self.load(memory_source(data, name, options.get("encoding")), **options)
+
+    def _text(self, data: TextLike, encoding: str = None) -> str:
+        """Return *data* as text; binary buffers are decoded in place, not copied."""
+        if isinstance(data, str):
+            return data
+        return str(data, encoding or self.DEFAULT_ENCODING)
+
+    async def aload(self, path: _Path, **options) -> object:
+        """Asynchronously read *path*; used by :meth:`~yaconfiglib.loader.ConfigLoader.aload`.
+
+        The default implementation runs :meth:`load` on a worker thread so it
+        never blocks the event loop. Backends with a native asynchronous path
+        (e.g. ``CommandBackend``'s subprocess) override this.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load, path, **options)
+
     def load_all(self, path: _Path, **options) -> _ty.Iterable[object]:
         """Yield one or more parsed documents from *path*.
 
@@ -147,14 +298,23 @@ class ConfigBackend(_ty.Protocol):
         # get_class_by_path()'s "first match wins" depend on hash order —
         # backend resolution could differ between runs when two backends'
         # regexes both matched a path.
-        ordered: list[type[_ty.Self]] = []
-        for scls in direct:
+        ordered: dict[type[_ty.Self], None] = {}
+        pending = list(reversed(direct))
+        while pending:
+            scls = pending.pop()
             if scls not in ordered:
-                ordered.append(scls)
-            for nested in scls.__subclasses__(recursive=True):
-                if nested not in ordered:
-                    ordered.append(nested)
-        return ordered
+                ordered[scls] = None
+                pending.extend(reversed(type.__subclasses__(scls)))
+        return list(ordered)
+
+    @classmethod
+    def _index(cls) -> _BackendIndex:
+        index = _INDEXES.get(cls)
+        if index is None or not index.alive():
+            index = _INDEXES[cls] = _BackendIndex(
+                _builtins_first(cls.__subclasses__(recursive=True))
+            )
+        return index
 
     @classmethod
     def get_class_by_name(cls, name: str) -> type[_ty.Self]:
@@ -165,14 +325,10 @@ class ConfigBackend(_ty.Protocol):
         don't set :attr:`NAME` explicitly. Used when a caller passes
         ``loader="yaml"`` (or similar) instead of a backend instance.
         """
-        for scls in cls.__subclasses__(recursive=True):
-            _name = getattr(scls, "NAME", None)
-            if not _name:
-                _name = (
-                    scls.__name__.lower().removesuffix("loader").removesuffix("config")
-                )
-            if _name == name:
-                return scls
+        if name in _PENDING:
+            _import_builtin(_PENDING[name])
+        ref = cls._index().names.get(name)
+        return ref() if ref is not None else None
 
     @classmethod
     def can_load_path(cls, path: _Path) -> bool:
@@ -190,7 +346,175 @@ class ConfigBackend(_ty.Protocol):
         Raises:
             NotImplementedError: If no registered backend claims *path*.
         """
-        for scls in cls.__subclasses__(recursive=True):
-            if scls.can_load_path(path):
-                return scls
-        raise NotImplementedError(f"Not reader for {path}")
+        while _PENDING and (spec := _pending_match(path)) is not None:
+            _import_builtin(spec)
+        scls = cls._index().match(path)
+        if scls is None:
+            raise NotImplementedError(f"Not reader for {path}")
+        return scls
+
+
+def _import_builtin(spec: BackendSpec) -> None:
+    try:
+        spec.load()
+    except ImportError:
+        pass  # Optional dependency missing: the backend is simply unavailable.
+    _PENDING.pop(spec.name, None)
+
+
+def _pending_pattern() -> _re.Pattern | None:
+    count, pattern = _PENDING_PATTERN
+    if count != len(_PENDING):
+        alternatives = [
+            f"(?P<{spec.name}>"
+            f"{'(?i:' if spec.pattern.flags & _re.IGNORECASE else '(?:'}"
+            f"{spec.pattern.pattern}))"
+            for spec in BUILTIN_BACKENDS
+            if spec.name in _PENDING and spec.pattern is not None
+        ]
+        pattern = _re.compile("|".join(alternatives)) if alternatives else None
+        _PENDING_PATTERN[:] = len(_PENDING), pattern
+    return pattern
+
+
+def _pending_match(path: _Path) -> BackendSpec | None:
+    """Return the first not-yet-imported built-in whose pattern matches *path*."""
+    pattern = _pending_pattern()
+    if pattern is None:
+        return None
+    # Like CommandBackend.can_load_path, try both the filename and the full path.
+    found = [
+        _PENDING.get(match.lastgroup)
+        for match in (pattern.match(path.name), pattern.match(str(path)))
+        if match is not None
+    ]
+    return min(filter(None, found), key=BUILTIN_BACKENDS.index, default=None)
+
+
+def _builtins_first(classes: list[type[ConfigBackend]]) -> list[type[ConfigBackend]]:
+    """Stable-sort *classes* so built-ins (and their subclasses) follow :data:`BUILTIN_BACKENDS`.
+
+    Built-ins are imported lazily and in any order; ranking them by the
+    table keeps first-match dispatch the same as when they were all
+    imported up front, ahead of any backend defined elsewhere.
+    """
+    ranks = {
+        (f"{__package__}.{spec.module}", spec.attribute): rank
+        for rank, spec in enumerate(BUILTIN_BACKENDS)
+    }
+
+    def rank(scls: type) -> int:
+        for base in scls.__mro__:
+            found = ranks.get((base.__module__, base.__qualname__))
+            if found is not None:
+                return found
+        return len(ranks)
+
+    return sorted(classes, key=rank)
+
+
+def _backend_name(scls: type[ConfigBackend]) -> str:
+    return getattr(scls, "NAME", None) or (
+        scls.__name__.lower().removesuffix("loader").removesuffix("config")
+    )
+
+
+def _suffixes(regex: _re.Pattern) -> list[str] | None:
+    """Return the lowercased suffixes *regex* tests for, or None if it is not a plain suffix test."""
+    if (
+        not isinstance(regex.pattern, str)
+        or regex.flags & ~_re.UNICODE != _re.IGNORECASE
+    ):
+        return None
+    match = _SUFFIX_REGEX.fullmatch(regex.pattern)
+    if match is None:
+        return None
+    if match["one"]:
+        return [match["one"].lower()]
+    suffixes = []
+    for part in match["many"].split("|"):
+        if part.startswith("(") != part.endswith(")"):
+            return None
+        suffixes.append(part.strip("()").lower())
+    return suffixes
+
+
+def _combinable(regex: _re.Pattern) -> bool:
+    """Whether *regex* can be embedded in a larger alternation unchanged."""
+    return (
+        isinstance(regex.pattern, str)
+        and not regex.groupindex
+        and regex.flags & ~(_re.UNICODE | _re.IGNORECASE) == 0
+        and _re.search(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)", regex.pattern) is None
+    )
+
+
+class _BackendIndex:
+    """Lookup tables answering "first backend in *classes* that can load this path".
+
+    Backends are split three ways: plain suffix regexes go into
+    :attr:`suffixes` (suffix -> position), other regexes into one combined
+    alternation whose named groups record positions (``re`` tries
+    alternatives left to right, so the first group to match is the earliest
+    backend), and backends overriding :meth:`ConfigBackend.can_load_path`
+    are kept in :attr:`custom` and consulted in order, but only ahead of the
+    best indexed match. Classes are held by weak reference so the index does
+    not keep discarded backends alive.
+    """
+
+    __slots__ = ("classes", "names", "suffixes", "pattern", "custom")
+
+    def __init__(self, classes: _ty.Sequence[type[ConfigBackend]]) -> None:
+        self.classes = tuple(_weakref.ref(scls) for scls in classes)
+        self.names: dict[str, _weakref.ref] = {}
+        self.suffixes: dict[str, int] = {}
+        self.custom: list[tuple[int, _weakref.ref]] = []
+        alternatives = []
+        default = ConfigBackend.can_load_path.__func__
+        for position, (scls, ref) in enumerate(zip(classes, self.classes)):
+            self.names.setdefault(_backend_name(scls), ref)
+            regex = scls.PATHNAME_REGEX
+            if getattr(scls.can_load_path, "__func__", None) is not default:
+                self.custom.append((position, ref))
+            elif not regex:
+                continue
+            elif (suffixes := _suffixes(regex)) is not None:
+                for suffix in suffixes:
+                    self.suffixes.setdefault(suffix, position)
+            elif _combinable(regex):
+                flags = "(?i:{})" if regex.flags & _re.IGNORECASE else "(?:{})"
+                alternatives.append(f"(?P<b{position}>{flags.format(regex.pattern)})")
+            else:
+                self.custom.append((position, ref))
+        self.pattern = _re.compile("|".join(alternatives)) if alternatives else None
+
+    def alive(self) -> bool:
+        return all(ref() is not None for ref in self.classes)
+
+    def match(self, path: _Path) -> type[ConfigBackend] | None:
+        name = path.name
+        best = len(self.classes)
+        if self.suffixes and "\n" not in name:
+            lowered = name.lower()
+            dot = lowered.find(".")
+            while dot != -1:
+                position = self.suffixes.get(lowered[dot + 1 :])
+                if position is not None and position < best:
+                    best = position
+                dot = lowered.find(".", dot + 1)
+        elif self.suffixes:
+            # ``.*`` stops at a newline, so ask the suffix backends directly.
+            for position in sorted(set(self.suffixes.values())):
+                if self.classes[position]().can_load_path(path):
+                    best = position
+                    break
+        if self.pattern is not None:
+            match = self.pattern.match(name)
+            if match is not None:
+                best = min(best, int(match.lastgroup[1:]))
+        for position, ref in self.custom:
+            if position >= best:
+                break
+            if ref().can_load_path(path):
+                return ref()
+        return self.classes[best]() if best < len(self.classes) else None
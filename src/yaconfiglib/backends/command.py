@@ -2,18 +2,271 @@
 
 from __future__ import annotations
 
+import atexit
+import itertools
+import json
+import logging
+import os
 import re
+import shlex
 import subprocess
+import threading
+import time
 import typing
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as _FutureTimeout
 
 try:
     from pathlib_next import Path
 except ImportError:
     from pathlib import Path
 
+from ..utils import cache as _cache
 from .base import ConfigBackend
 
-__all__ = ["CommandBackend"]
+logger = logging.getLogger(__name__)
+
+__all__ = ["CommandBackend", "CoprocessError"]
+
+_COPROC_SCHEME = re.compile(r"^coproc(\+\w+)?(://|:\\|:/|:)", re.IGNORECASE)
+_EXEC_SCHEME = re.compile(r"^exec(\+\w+)?(://|:\\|:/|:)", re.IGNORECASE)
+
+#: Formats tried, in order, when a command names no output format.
+_SNIFF_ORDER = ("json", "yaml", "toml", "dotenv", "ini")
+
+# Skips leading blank and comment lines; group 1 is the first line of content.
+_FIRST_LINE = re.compile(r"(?:[ \t]*(?:[#;].*)?\n)*[ \t]*(.*)")
+_SECTION_LINE = re.compile(r"\[\[?[ \t]*[A-Za-z_][\w.\- ]*\]\]?[ \t]*$")
+_ASSIGNMENT_LINE = re.compile(r"(export[ \t]+)?[A-Za-z_][\w.\-]*[ \t]*=")
+_YAML_LINE = re.compile(r"-(?:[ \t]|$)|---|[^\s:=#][^:=]*:(?:[ \t]|$)")
+
+
+def _sniff_formats(output: str) -> tuple[str, ...]:
+    """Order :data:`_SNIFF_ORDER` so the format *output* most likely is comes first.
+
+    Looks only at the first line of content: ``{`` means JSON, a
+    ``[section]`` header followed by more lines means TOML or INI,
+    ``key = value`` means TOML or dotenv (``export KEY=...`` dotenv alone),
+    and ``key: value`` or ``- item`` means YAML. Anything else keeps the
+    default order.
+    """
+    match = _FIRST_LINE.match(output)
+    line = match[1]
+    if line.startswith("{"):
+        likely = ("json", "yaml")
+    elif _SECTION_LINE.match(line) and "\n" in output[match.end(1) :]:
+        likely = ("toml", "ini")
+    elif (assignment := _ASSIGNMENT_LINE.match(line)) is not None:
+        likely = ("dotenv",) if assignment[1] else ("toml", "dotenv")
+    elif _YAML_LINE.match(line):
+        likely = ("yaml",)
+    else:
+        return _SNIFF_ORDER
+    return likely + tuple(fmt for fmt in _SNIFF_ORDER if fmt not in likely)
+
+
+class CoprocessError(RuntimeError):
+    """A ``coproc://`` helper answered with an error, or could not answer."""
+
+
+class _CoprocessExited(CoprocessError):
+    """The helper process went away before answering (the request may be retried)."""
+
+
+class _Coprocess:
+    """One long-lived helper process answering JSON-line requests.
+
+    Requests are written to the helper's stdin as ``{"id": n, "request":
+    ...}`` lines and matched to ``{"id": n, "output": "..."}`` (or
+    ``{"id": n, "error": "..."}``) lines read back from its stdout by a
+    reader thread, so any number of threads can have requests in flight and
+    the helper may answer them in any order. A watchdog thread closes the
+    helper's stdin once it has had nothing to do for *idle_timeout* seconds.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        encoding: str,
+        idle_timeout: float,
+        on_exit: typing.Callable[[_Coprocess], None],
+    ) -> None:
+        self.command = command
+        self.idle_timeout = idle_timeout
+        self.alive = True
+        self._on_exit = on_exit
+        self._lock = threading.Lock()
+        # Writes can block on a full pipe; they must not hold _lock, which the
+        # reader needs to hand out responses.
+        self._write_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._pending: dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._last_used = time.monotonic()
+        self._process = subprocess.Popen(
+            command,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding=encoding,
+            errors="replace",
+            bufsize=1,
+        )
+        for target, name in ((self._read, "reader"), (self._watch, "watchdog")):
+            threading.Thread(
+                target=target, name=f"yaconfiglib-coproc-{name}", daemon=True
+            ).start()
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    def request(self, payload: object, timeout: float = None) -> str:
+        """Send *payload* and return the helper's ``output`` for it."""
+        future: Future = Future()
+        line = None
+        with self._lock:
+            if self.alive:
+                request_id = next(self._ids)
+                # Serialize first: a payload JSON can't encode must not leave
+                # a pending entry behind, or the helper never looks idle.
+                line = json.dumps({"id": request_id, "request": payload}) + "\n"
+                self._pending[request_id] = future
+                self._last_used = time.monotonic()
+        if line is None:
+            raise _CoprocessExited(f"coprocess {self.command!r} has exited")
+        try:
+            with self._write_lock:
+                self._process.stdin.write(line)
+                self._process.stdin.flush()
+        except (OSError, ValueError) as error:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise _CoprocessExited(f"coprocess {self.command!r} has exited") from error
+        try:
+            return future.result(timeout)
+        except _FutureTimeout:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise TimeoutError(
+                f"coprocess {self.command!r} did not answer within {timeout}s"
+            ) from None
+
+    def close(self) -> None:
+        """Ask the helper to exit by closing its stdin; kill it if it lingers."""
+        with self._lock:
+            self.alive = False
+        self._closed.set()
+        with self._write_lock:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+    def _read(self) -> None:
+        for line in self._process.stdout:
+            try:
+                message = json.loads(line)
+                request_id = message["id"]
+                with self._lock:
+                    future = self._pending.pop(request_id, None)
+                    self._last_used = time.monotonic()
+            except (ValueError, TypeError, KeyError):
+                logger.warning(
+                    "ignoring malformed line from coprocess %r: %r", self.command, line
+                )
+                continue
+            if future is None:
+                continue  # The caller timed out and stopped waiting.
+            if "error" in message:
+                future.set_exception(CoprocessError(str(message["error"])))
+            else:
+                future.set_result(str(message.get("output", "")))
+        with self._lock:
+            self.alive = False
+            pending, self._pending = self._pending, {}
+        self._closed.set()
+        for future in pending.values():
+            future.set_exception(
+                _CoprocessExited(f"coprocess {self.command!r} exited unexpectedly")
+            )
+        with self._write_lock:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        self._process.stdout.close()
+        self._process.wait()
+        self._on_exit(self)
+
+    def _watch(self) -> None:
+        while True:
+            with self._lock:
+                if not self.alive:
+                    return
+                if self._pending:
+                    wait = self.idle_timeout
+                else:
+                    wait = self.idle_timeout - (time.monotonic() - self._last_used)
+                    if wait <= 0:
+                        # Refuse new requests from here on; they start a new helper.
+                        self.alive = False
+                        break
+            if self._closed.wait(wait):
+                return
+        logger.debug("closing idle coprocess %r", self.command)
+        self.close()
+
+
+# Options left out of a command cache key: the driving loader and path
+# factory only steer nested includes, ``master`` is the including YAML
+# document's own parser and ``interpolate`` is the caller's setting, none of
+# which change the command's output.
+_UNKEYED_OPTIONS = frozenset(("loader", "path_factory", "master", "interpolate"))
+
+# Running helpers by (command, encoding), shared by every CommandBackend.
+_COPROCESSES: dict[tuple[str, str], _Coprocess] = {}
+_COPROCESSES_LOCK = threading.Lock()
+
+
+def _forget_coprocess(coprocess: _Coprocess) -> None:
+    with _COPROCESSES_LOCK:
+        for key, running in list(_COPROCESSES.items()):
+            if running is coprocess:
+                del _COPROCESSES[key]
+
+
+@atexit.register
+def _close_coprocesses() -> None:
+    with _COPROCESSES_LOCK:
+        running = list(_COPROCESSES.values())
+        _COPROCESSES.clear()
+    for coprocess in running:
+        coprocess.close()
+
+
+def _forget_coprocesses_in_child() -> None:
+    """Start over after ``os.fork()``: the parent's helpers are not ours.
+
+    Their reader and watchdog threads did not survive the fork, and their
+    pipes are shared with the parent, so a request from the child would be
+    answered to the parent. The child starts its own helpers on demand.
+    """
+    global _COPROCESSES_LOCK
+    # The lock may have been held by another thread at fork time.
+    _COPROCESSES_LOCK = threading.Lock()
+    for coprocess in _COPROCESSES.values():
+        coprocess.alive = False
+    _COPROCESSES.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_coprocesses_in_child)
 
 
 class CommandBackend(ConfigBackend):
@@ -25,23 +278,51 @@ class CommandBackend(ConfigBackend):
     is run through the shell and its stdout is parsed as configuration
     data — this makes it easy to source secrets or dynamic values from
     external tools, e.g. ``cmd+json://aws secretsmanager get-secret-value ...``.
+    ``exec://`` commands skip the shell: they are split into arguments with
+    :func:`shlex.split` and the program is started directly, which saves
+    the shell's startup time but means pipes, redirections and variable
+    expansion are not available (use ``sh://`` or ``cmd://`` for those).
 
     Output format resolution, in priority order:
 
     1. An explicit ``format=`` argument.
     2. The ``+fmt`` suffix on the scheme (e.g. ``cmd+yaml://...``).
     3. A ``#!fmt`` shebang line at the start of the command's stdout.
-    4. Sniffing: try json, yaml, toml, dotenv, ini in turn.
+    4. Sniffing: try json, yaml, toml, dotenv, ini in turn, after moving
+       the format the output's first line suggests to the front (``{`` for
+       JSON, ``[section]`` for TOML/INI, ``key = value`` for TOML/dotenv,
+       ``key: value`` for YAML).
 
     If parsing fails and no format was requested, the raw stdout string is
     returned as a fallback rather than raising.
+
+    ``coproc://`` (and ``coproc+fmt://``) sources talk to a long-lived
+    helper instead of running a command per source: ``coproc://vault-helper
+    --serve#db/password`` starts ``vault-helper --serve`` once and sends it
+    ``db/password``. Each request is one JSON line on the helper's stdin,
+    ``{"id": 1, "request": "db/password"}``, and the helper answers with one
+    line per request, ``{"id": 1, "output": "..."}`` or ``{"id": 1,
+    "error": "..."}``, in any order. ``output`` goes through the format
+    resolution above. A ``request=`` option replaces the ``#`` part and may
+    be any JSON value. Helpers are shared by every loader and thread, are
+    restarted if they exit (a request in flight is retried once) and are
+    closed after :attr:`COPROCESS_IDLE_TIMEOUT` idle seconds.
+
+    Class attributes:
+        COPROCESS_IDLE_TIMEOUT: Seconds a ``coproc://`` helper may sit idle
+            before its stdin is closed.
+        COPROCESS_TIMEOUT: Seconds to wait for a helper's answer before
+            raising :class:`TimeoutError`.
     """
 
     PATHNAME_REGEX = re.compile(
-        r"^(exec|cmd|sh|exec\+\w+|cmd\+\w+)(://|:\\|:/|:).*|.*?\.(sh|bat|ps1|cmd)$",
+        r"^(exec|cmd|sh|coproc|exec\+\w+|cmd\+\w+|coproc\+\w+)(://|:\\|:/|:).*"
+        r"|.*?\.(sh|bat|ps1|cmd)$",
         re.IGNORECASE,
     )
     NAME = "command"
+    COPROCESS_IDLE_TIMEOUT = 60.0
+    COPROCESS_TIMEOUT = 30.0
 
     @classmethod
     def can_load_path(cls, path: Path) -> bool:
@@ -59,6 +340,7 @@ class CommandBackend(ConfigBackend):
         encoding: str = None,
         format: str | list[str] = None,
         path_factory: typing.Callable[[str], Path] = None,
+        command_cache: _cache.CommandCache = None,
         **options,
     ) -> object:
         """Run the command encoded in *path* and parse its stdout.
@@ -74,6 +356,12 @@ class CommandBackend(ConfigBackend):
                 candidate formats to try in order. Overrides shebang
                 detection and sniffing.
             path_factory: Unused; accepted for interface consistency.
+            command_cache: A :class:`~yaconfiglib.utils.cache.CommandCache`
+                to reuse a recent result of the same command, format and
+                options from instead of running it again.
+            **options: Forwarded to the output's backend, except
+                ``request``: the JSON value sent to a ``coproc://`` helper,
+                replacing the part after ``#``.
 
         Returns:
             The parsed stdout, or the raw stripped stdout string if no
@@ -81,16 +369,266 @@ class CommandBackend(ConfigBackend):
 
         Raises:
             subprocess.CalledProcessError: If the command exits non-zero.
+            FileNotFoundError: If an ``exec://`` command's program does
+                not exist.
             ValueError: If an explicit *format*/shebang format is
                 requested but the output cannot be parsed as that format,
                 or output is empty while a format was requested.
+            CoprocessError: If a ``coproc://`` helper answers with an
+                error, or exits twice while handling the request.
+            TimeoutError: If a ``coproc://`` helper does not answer within
+                :attr:`COPROCESS_TIMEOUT` seconds.
         """
+        command, explicit_format = self._split_command(path, format)
+        mode = self._mode(path)
+        run = self._runner(mode, asynchronous=False)
+        key = self._cache_key(
+            command_cache, mode, command, explicit_format, encoding, options
+        )
+        if key is None:
+            return run(command, explicit_format, encoding, options)
+        return command_cache.load(
+            key, lambda: run(command, explicit_format, encoding, options)
+        )
+
+    @staticmethod
+    def _mode(path: Path | str) -> str:
+        """How *path*'s command runs: ``"coproc"``, ``"exec"`` or ``"shell"``."""
+        path_str = str(path)
+        if _COPROC_SCHEME.match(path_str):
+            return "coproc"
+        if _EXEC_SCHEME.match(path_str):
+            return "exec"
+        return "shell"
+
+    def _runner(self, mode: str, asynchronous: bool = False):
+        """Return the method that runs a command in *mode*."""
+        if mode == "coproc":
+            return self._arequest if asynchronous else self._request
+        if mode == "exec":
+            return self._aexec if asynchronous else self._exec
+        return self._arun if asynchronous else self._run
+
+    def _run(
+        self,
+        command: str,
+        explicit_format: str | list[str],
+        encoding: str,
+        options,
+        shell: bool = True,
+    ) -> object:
+        # 2. Execute command. Decode output explicitly: text=True alone uses
+        # the locale codec (cp1252 on Windows), which mangles UTF-8 output
+        # from tools like secret managers. errors="replace" keeps the
+        # format-sniffing path total instead of raising mid-decode.
+        result = subprocess.run(
+            command if shell else self._argv(command),
+            shell=shell,
+            capture_output=True,
+            encoding=encoding or "utf-8",
+            errors="replace",
+            check=True,
+        )
+        return self._parse_output(result.stdout, explicit_format, options)
+
+    def _exec(
+        self, command: str, explicit_format: str | list[str], encoding: str, options
+    ) -> object:
+        """Run an ``exec://`` *command* without a shell and parse its stdout."""
+        return self._run(command, explicit_format, encoding, options, shell=False)
+
+    async def aload(
+        self,
+        path: Path | str,
+        encoding: str = None,
+        format: str | list[str] = None,
+        path_factory: typing.Callable[[str], Path] = None,
+        command_cache: _cache.CommandCache = None,
+        **options,
+    ) -> object:
+        """Asynchronous :meth:`load`: runs the command via :func:`asyncio.create_subprocess_shell`.
+
+        ``exec://`` commands use :func:`asyncio.create_subprocess_exec`
+        instead.
+
+        Same arguments, result and errors as :meth:`load`. The command is
+        killed if the awaiting task is cancelled. ``coproc://`` requests
+        wait for their answer on a worker thread.
+        """
+        command, explicit_format = self._split_command(path, format)
+        mode = self._mode(path)
+        run = self._runner(mode, asynchronous=True)
+        key = self._cache_key(
+            command_cache, mode, command, explicit_format, encoding, options
+        )
+        if key is None:
+            return await run(command, explicit_format, encoding, options)
+        return await command_cache.aload(
+            key, lambda: run(command, explicit_format, encoding, options)
+        )
+
+    async def _arun(
+        self,
+        command: str,
+        explicit_format: str | list[str],
+        encoding: str,
+        options,
+        shell: bool = True,
+    ) -> object:
+        import asyncio
+
+        if shell:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *self._argv(command),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        stdout = self._decode(stdout, encoding)
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                command,
+                output=stdout,
+                stderr=self._decode(stderr, encoding),
+            )
+        return self._parse_output(stdout, explicit_format, options)
+
+    async def _aexec(
+        self, command: str, explicit_format: str | list[str], encoding: str, options
+    ) -> object:
+        return await self._arun(
+            command, explicit_format, encoding, options, shell=False
+        )
+
+    @staticmethod
+    def _argv(command: str) -> list[str]:
+        """Split an ``exec://`` *command* into the program and its arguments."""
+        if os.name == "nt":
+            # Non-POSIX splitting keeps backslashes in Windows paths; it
+            # leaves the quotes on, so strip them from each argument.
+            argv = [
+                arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg
+                for arg in shlex.split(command, posix=False)
+            ]
+        else:
+            argv = shlex.split(command)
+        if not argv:
+            raise ValueError(f"No program to execute in command: {command!r}")
+        return argv
+
+    def _request(
+        self, command: str, explicit_format: str | list[str], encoding: str, options
+    ) -> object:
+        """Ask the ``coproc://`` helper in *command* for its output and parse it."""
+        options = dict(options)
+        helper, separator, fragment = command.rpartition("#")
+        if not separator:
+            helper, fragment = fragment, None
+        request = options.pop("request", fragment)
+        helper = helper.strip()
+        encoding = encoding or "utf-8"
+        # A helper that exited (crash or idle shutdown) is replaced once.
+        for attempt in range(2):
+            coprocess = self._coprocess(helper, encoding)
+            try:
+                output = coprocess.request(request, self.COPROCESS_TIMEOUT)
+                break
+            except _CoprocessExited:
+                if attempt:
+                    raise
+        return self._parse_output(output, explicit_format, options)
+
+    async def _arequest(
+        self, command: str, explicit_format: str | list[str], encoding: str, options
+    ) -> object:
+        import asyncio
+
+        return await asyncio.to_thread(
+            self._request, command, explicit_format, encoding, options
+        )
+
+    def _coprocess(self, helper: str, encoding: str) -> _Coprocess:
+        """Return the running helper for *helper*, starting one if needed."""
+        with _COPROCESSES_LOCK:
+            coprocess = _COPROCESSES.get((helper, encoding))
+            if coprocess is None or not coprocess.alive:
+                coprocess = _COPROCESSES[(helper, encoding)] = _Coprocess(
+                    helper, encoding, self.COPROCESS_IDLE_TIMEOUT, _forget_coprocess
+                )
+            return coprocess
+
+    @staticmethod
+    def close_coprocesses() -> None:
+        """Shut down every running ``coproc://`` helper.
+
+        Called automatically at interpreter exit. Helpers are started again
+        on their next request.
+        """
+        _close_coprocesses()
+
+    def _cache_key(
+        self,
+        command_cache: _cache.CommandCache | None,
+        mode: str,
+        command: str,
+        explicit_format: str | list[str],
+        encoding: str,
+        options: dict,
+    ) -> typing.Hashable | None:
+        """Key *command*'s result in *command_cache*, or None to run uncached."""
+        if command_cache is None:
+            return None
+        try:
+            return (
+                type(self),
+                # exec:// and cmd:// may run the same text differently.
+                mode,
+                command,
+                _cache.freeze(explicit_format),
+                encoding,
+                # Per-call plumbing stays out, or a command reached through
+                # !include would never hit; base_dir, which decides where
+                # nested includes resolve, stays in.
+                _cache.freeze(
+                    {k: v for k, v in options.items() if k not in _UNKEYED_OPTIONS}
+                ),
+            )
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _decode(data: bytes, encoding: str = None) -> str:
+        # Mirror subprocess.run(encoding=..., errors="replace"), including
+        # its universal-newline translation, so load() and aload() agree.
+        text = data.decode(encoding or "utf-8", errors="replace")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    @staticmethod
+    def _split_command(
+        path: Path | str, format: str | list[str] = None
+    ) -> tuple[str, str | list[str]]:
+        """Return the shell command in *path* and the requested output format."""
         path_str = str(path)
         explicit_format = format
 
         # 1. Parse inline command schemes using regex to handle normalized slashes
         m = re.match(
-            r"^(exec|cmd|sh|exec\+\w+|cmd\+\w+)(://|:\\|:/|:)", path_str, re.IGNORECASE
+            r"^(exec|cmd|sh|coproc|exec\+\w+|cmd\+\w+|coproc\+\w+)(://|:\\|:/|:)",
+            path_str,
+            re.IGNORECASE,
         )
         if m:
             scheme = m.group(1)
@@ -101,20 +639,13 @@ class CommandBackend(ConfigBackend):
                     explicit_format = scheme_fmt
         else:
             command = path_str
+        return command, explicit_format
 
-        # 2. Execute command. Decode output explicitly: text=True alone uses
-        # the locale codec (cp1252 on Windows), which mangles UTF-8 output
-        # from tools like secret managers. errors="replace" keeps the
-        # format-sniffing path total instead of raising mid-decode.
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            encoding=encoding or "utf-8",
-            errors="replace",
-            check=True,
-        )
-        output = result.stdout.strip()
+    def _parse_output(
+        self, output: str, explicit_format: str | list[str], options: dict
+    ) -> object:
+        """Parse a command's decoded stdout (steps 3-4 of :meth:`load`)."""
+        output = output.strip()
 
         # 3. Parse shebang from output if present
         shebang_format = None
@@ -137,13 +668,15 @@ class CommandBackend(ConfigBackend):
                 )
             return ""
 
-        # 4. Parse content using yaconfiglib.loads
-        from yaconfiglib import loads
+        # 4. Parse content with each candidate backend's loads(): the output
+        # is handed over as text, never written to a file first. The loader's
+        # format/loader selection does not apply to the output; the parent
+        # ConfigLoader is passed on so nested includes resolve through it.
+        # Mappings come back as DotAccessibleDict, as ConfigLoader.load
+        # returned them when the output was parsed through yaconfiglib.loads.
+        from ..loader import DotAccessibleDict
 
-        # Strip loader/format argument to avoid infinite recursion
-        loads_options = {
-            k: v for k, v in options.items() if k not in ("loader", "format")
-        }
+        loads_options = {k: v for k, v in options.items() if k != "format"}
 
         candidates = []
         if explicit_format:
@@ -154,13 +687,21 @@ class CommandBackend(ConfigBackend):
         elif shebang_format:
             candidates = [shebang_format]
         else:
-            candidates = ["json", "yaml", "toml", "dotenv", "ini"]
+            # One cheap look at the output puts the likely format first, so
+            # it usually parses on the first attempt; the rest still follow.
+            candidates = _sniff_formats(output)
 
         for fmt in candidates:
             if fmt == "command":
                 continue
             try:
-                return loads(output, loader=fmt, **loads_options)
+                backend_cls = ConfigBackend.get_class_by_name(fmt)
+                if not backend_cls:
+                    raise ValueError(f"Unknown configuration format/loader: {fmt}")
+                result = backend_cls().loads(output, **loads_options)
+                if isinstance(result, dict):
+                    result = DotAccessibleDict(result)
+                return result
             except (
                 Exception
             ):  # noqa: BLE001 - format sniffing must survive ANY parse error
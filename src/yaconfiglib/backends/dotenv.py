@@ -12,6 +12,9 @@ except ImportError:
 
 from .base import ConfigBackend
 
+if _ty.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
+
 __all__ = ["DotenvBackend"]
 
 _COMMENT_RE = re.compile(r"^\s*#")
@@ -62,6 +65,8 @@ class DotenvBackend(ConfigBackend):
 
     PATHNAME_REGEX = re.compile(r".*\.env(\..+)?$", re.IGNORECASE)
     NAME = "dotenv"
+    CACHEABLE = True
+    CACHE_VERSION = "dotenv-1"
 
     def __init__(self, lowercase: bool = True) -> None:
         self.lowercase = lowercase
@@ -89,14 +94,28 @@ class DotenvBackend(ConfigBackend):
             result stays all-string, matching dotenv conventions.
         """
         encoding = encoding or self.DEFAULT_ENCODING
-        lowercase = self.lowercase if lowercase is None else lowercase
         if path_factory and not isinstance(path, _Path):
             path = path_factory(path)
         elif isinstance(path, str):
             path = (path_factory or self.DEFAULT_PATH_FACTORY)(path)
 
+        return self.loads(
+            path.read_text(encoding=encoding), name=path.name, lowercase=lowercase
+        )
+
+    def loads(
+        self,
+        data: TextLike,
+        *,
+        name: str = None,
+        encoding: str = None,
+        lowercase: bool | None = None,
+        **_options,
+    ) -> dict[str, str]:
+        """Parse in-memory dotenv *data*; options as for :meth:`load`."""
+        lowercase = self.lowercase if lowercase is None else lowercase
         result: dict[str, str] = {}
-        for line in path.read_text(encoding=encoding).splitlines():
+        for line in self._text(data, encoding).splitlines():
             # Skip blanks and comments
             if not line.strip() or _COMMENT_RE.match(line):
                 continue
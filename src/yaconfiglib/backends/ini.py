@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import re
+import typing
 from configparser import ConfigParser
 
 try:
@@ -8,6 +11,9 @@ except ImportError:
 
 from yaconfiglib.backends.base import ConfigBackend
 
+if typing.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
+
 __all__ = ["IniConfig"]
 
 
@@ -21,6 +27,8 @@ class IniConfig(ConfigBackend):
     """
 
     PATHNAME_REGEX = re.compile(r".*\.ini$", re.IGNORECASE)
+    CACHEABLE = True
+    CACHE_VERSION = "configparser"
     DEFAULT_SECTION = "DEFAULT"
 
     def load(
@@ -40,6 +48,17 @@ class IniConfig(ConfigBackend):
         """
         encoding = encoding or self.DEFAULT_ENCODING
 
+        return self.loads(path.read_text(encoding=encoding), name=path.name, **options)
+
+    def loads(
+        self,
+        data: TextLike,
+        *,
+        name: str = None,
+        encoding: str = None,
+        **options: object,
+    ) -> object:
+        """Parse in-memory INI *data*; options as for :meth:`load`."""
         parser_args = dict(
             default_section=options.setdefault(
                 "ini_default_section", self.DEFAULT_SECTION
@@ -47,7 +66,7 @@ class IniConfig(ConfigBackend):
         )
 
         parser = ConfigParser(**parser_args)
-        parser.read_string(path.read_text(encoding=encoding), path.name)
+        parser.read_string(self._text(data, encoding), name or "<string>")
         result = {}
         for section in parser.sections():
             d = result[section] = {}
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
 import re
+import typing
 
 from jinja2 import Environment
 
 try:
     from pathlib_next import Path, PosixPathname
-    from pathlib_next.mempath import MemPath
 except ImportError:
     from pathlib import Path
     from pathlib import PurePosixPath as PosixPathname  # type: ignore[no-redef]
 
-    MemPath = None  # type: ignore[assignment,misc]
-
 from yaconfiglib.backends.base import ConfigBackend
 from yaconfiglib.utils import jinja2
-from yaconfiglib.utils.source import _materialize_temp
+from yaconfiglib.utils.source import MemorySource
+
+if typing.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
 
 __all__ = ["Jinja2ConfigLoader"]
 
@@ -30,10 +31,10 @@ class Jinja2ConfigLoader(ConfigBackend):
     a ``.j2``/``.jinja2`` suffix, without needing a dedicated templated
     variant of each backend.
 
-    The rendered output is written to an in-memory path (``MemPath``, or a
-    real temp file when ``pathlib_next`` is unavailable) before being
-    handed to the resolved backend, so downstream backends see ordinary
-    file content and don't need any Jinja2-specific handling.
+    The rendered text is handed to the resolved backend's
+    :meth:`~ConfigBackend.loads` as-is — nothing is written to a
+    ``MemPath`` or temp file — so downstream backends don't need any
+    Jinja2-specific handling.
     """
 
     PATHNAME_REGEX = re.compile(r".*\.((j2)|(jinja2))$", re.IGNORECASE)
@@ -68,35 +69,55 @@ class Jinja2ConfigLoader(ConfigBackend):
             stripped).
         """
         encoding = encoding or self.DEFAULT_ENCODING
+        return self.loads(
+            path.read_text(encoding=encoding),
+            name=path.as_posix(),
+            encoding=encoding,
+            loader=loader,
+            environment=environment,
+            **kwargs,
+        )
+
+    def loads(
+        self,
+        data: TextLike,
+        *,
+        name: str = None,
+        encoding: str = None,
+        loader: ConfigBackend = None,
+        environment: Environment = None,
+        **kwargs,
+    ) -> object:
+        """Render in-memory template *data*, then parse it; options as for :meth:`load`.
+
+        *name* is the template's filename: it is exposed to the template as
+        ``pathname`` and, minus its ``.j2``/``.jinja2`` suffix, selects the
+        backend for the rendered text. Without one, the result is parsed as
+        YAML.
+        """
         environment = environment or kwargs.pop("envoriment", None)
         template = jinja2.load_template(
-            path.read_text(encoding=encoding),
+            self._text(data, encoding),
             environment=environment or jinja2.DEFAULT_ENV,
         )
-        pathname = PosixPathname(path.as_posix())
+        pathname = PosixPathname(name) if name else None
         rendered = template.render(pathname=pathname)
-        # Name the rendered document after the template minus its .j2/.jinja2
-        # suffix, so backend auto-detection resolves settings.yaml.j2 -> YAML.
-        rendered_name = path.with_name(path.stem).as_posix()
-        if MemPath is None:
-            # Without pathlib_next this used to call MemPath(...) anyway —
-            # TypeError: 'NoneType' object is not callable for any .j2 source —
-            # despite this class's own docstring promising "a real temp file
-            # when pathlib_next is unavailable". Reuse source.py's existing
-            # temp-file materializer, which keeps the rendered basename as the
-            # temp file's suffix so auto-detection still works.
-            target = _materialize_temp(rendered, encoding, rendered_name)
+        if name:
+            # Name the rendered document after the template minus its
+            # .j2/.jinja2 suffix, so auto-detection resolves settings.yaml.j2
+            # -> YAML.
+            rendered_name = MemorySource(name).with_suffix("").as_posix()
+            rendered_loader = ConfigBackend.get_class_by_path(
+                MemorySource(rendered_name)
+            )()
         else:
-            target = MemPath(rendered_name)
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(rendered, encoding=encoding)
-        parent_loader = loader
-        rendered_loader = ConfigBackend.get_class_by_path(target)()
-
-        rendered = rendered_loader.load(
-            target,
+            rendered_name = None
+            rendered_loader = ConfigBackend.get_class_by_name("yaml")()
+
+        return rendered_loader.loads(
+            rendered,
+            name=rendered_name,
             encoding=encoding,
-            loader=parent_loader,
+            loader=loader,
             **kwargs,
         )
-        return rendered
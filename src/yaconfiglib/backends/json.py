@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import json
 import re
+import typing
 
 try:
     from pathlib_next import Path
@@ -8,6 +11,9 @@ except ImportError:
 
 from yaconfiglib.backends.base import ConfigBackend
 
+if typing.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
+
 __all__ = ["JsonConfig"]
 
 
@@ -15,6 +21,8 @@ class JsonConfig(ConfigBackend):
     """Backend for ``*.json`` files, parsed via the standard library :mod:`json` module."""
 
     PATHNAME_REGEX = re.compile(r".*\.json$", re.IGNORECASE)
+    CACHEABLE = True
+    CACHE_VERSION = f"json-{json.__version__}"
 
     def load(
         self,
@@ -33,10 +41,24 @@ class JsonConfig(ConfigBackend):
         """
         encoding = encoding or self.DEFAULT_ENCODING
 
-        return json.loads(
-            path.read_text(encoding=encoding), **(json_decoder_options or {})
+        return self.loads(
+            path.read_text(encoding=encoding),
+            name=path.name,
+            json_decoder_options=json_decoder_options,
         )
 
+    def loads(
+        self,
+        data: TextLike,
+        *,
+        name: str = None,
+        encoding: str = None,
+        json_decoder_options: dict = None,
+        **options,
+    ) -> object:
+        """Parse in-memory JSON *data*; options as for :meth:`load`."""
+        return json.loads(self._text(data, encoding), **(json_decoder_options or {}))
+
     def dumps(self, data: str, **options) -> str:
         """Serialize *data* to a JSON string via :func:`json.dumps`."""
         return json.dumps(data, **options)
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import re
+import typing
 
 try:
     import tomllib as toml
@@ -12,6 +15,9 @@ except ImportError:
 
 from yaconfiglib.backends.base import ConfigBackend
 
+if typing.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
+
 __all__ = ["TomlConfig"]
 
 
@@ -23,7 +29,17 @@ class TomlConfig(ConfigBackend):
     """
 
     PATHNAME_REGEX = re.compile(r".*\.toml$", re.IGNORECASE)
+    CACHEABLE = True
+    CACHE_VERSION = f"{toml.__name__}-{getattr(toml, '__version__', 'stdlib')}"
 
     def load(self, path: Path, encoding: str, **kwargs):
         """Parse *path* as TOML and return the resulting dict."""
-        return toml.loads(path.read_text(encoding=encoding or self.DEFAULT_ENCODING))
+        return self.loads(
+            path.read_text(encoding=encoding or self.DEFAULT_ENCODING), name=path.name
+        )
+
+    def loads(
+        self, data: TextLike, *, name: str = None, encoding: str = None, **kwargs
+    ):
+        """Parse in-memory TOML *data* and return the resulting dict."""
+        return toml.loads(self._text(data, encoding))
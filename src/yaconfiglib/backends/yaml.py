@@ -14,6 +14,10 @@ except ImportError:
     Pathname = Path
 
 from yaconfiglib.backends.base import ConfigBackend
+from yaconfiglib.utils import cache as _cache
+
+if typing.TYPE_CHECKING:
+    from yaconfiglib.utils.source import TextLike
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,30 @@ __all__ = ["YamlConfig"]
 # without manual loader setup.
 _INCLUDE_TAGS = ("!include", "!load")
 
+_LIBYAML = getattr(yaml, "__with_libyaml__", False)
+
+
+def _extended(loader_cls: type[yaml.Loader]) -> bool:
+    """Whether constructors or resolvers were added to *loader_cls* itself.
+
+    The include tags don't count: they are registered on the libyaml loader
+    as well. Anything else (``SafeLoader.add_constructor("!env", ...)``)
+    would be missing from ``CSafeLoader``.
+    """
+    own = vars(loader_cls)
+    safe = yaml.constructor.SafeConstructor.yaml_constructors
+    resolvers = yaml.resolver.Resolver.yaml_implicit_resolvers
+    return (
+        any(
+            safe.get(tag) is not constructor
+            for tag, constructor in own.get("yaml_constructors", {}).items()
+            if tag not in _INCLUDE_TAGS
+        )
+        or bool(own.get("yaml_multi_constructors"))
+        or own.get("yaml_implicit_resolvers", resolvers) != resolvers
+        or bool(own.get("yaml_path_resolvers"))
+    )
+
 
 class YamlConfig(ConfigBackend):
     """Backend for ``*.yaml``/``*.yml`` files.
@@ -35,8 +63,14 @@ class YamlConfig(ConfigBackend):
     """
 
     PATHNAME_REGEX = re.compile(r".*\.((yaml)|(yml))$", re.IGNORECASE)
+    CACHEABLE = True
+    CACHE_VERSION = f"pyyaml-{yaml.__version__}"
     DEFAULT_LOADER_CLS = yaml.SafeLoader
     DEFAULT_DUMPER_CLS = yaml.Dumper
+    #: Swap the default loader/dumper for their libyaml (C) counterparts,
+    #: ``yaml.CSafeLoader`` and ``yaml.CDumper``, when PyYAML was built with
+    #: libyaml. Set to ``False`` to force the pure-Python classes.
+    USE_LIBYAML = _LIBYAML
 
     def load(
         self,
@@ -58,7 +92,8 @@ class YamlConfig(ConfigBackend):
                 anchors/aliases from — used when this call originates from
                 a ``!include``/``!load`` tag within another YAML document.
             loader_cls: PyYAML loader class to use. Defaults to *master*'s
-                class if given, else :attr:`DEFAULT_LOADER_CLS`.
+                class if given, else :attr:`DEFAULT_LOADER_CLS` (its libyaml
+                counterpart if :attr:`USE_LIBYAML` is set).
             path_factory: Path constructor used when *path* is a string.
             loader: The parent :class:`~yaconfiglib.loader.ConfigLoader`.
                 When supplied, ``!include``/``!load`` tags are registered
@@ -74,30 +109,72 @@ class YamlConfig(ConfigBackend):
             path_factory = self.DEFAULT_PATH_FACTORY
         if isinstance(path, str):
             path = path_factory(path)
+        return self.loads(
+            path.read_text(encoding=encoding),
+            name=path.name,
+            master=master,
+            loader_cls=loader_cls,
+            path_factory=path_factory,
+            loader=loader,
+        )
+
+    def loads(
+        self,
+        data: TextLike,
+        *,
+        name: str = None,
+        encoding: str = None,
+        master: yaml.Loader = None,
+        loader_cls: type[yaml.Loader] = None,
+        path_factory: type[Path] = None,
+        loader: ConfigBackend = None,
+        **options,
+    ) -> object:
+        """Parse in-memory YAML *data*; options as for :meth:`load`."""
+        if path_factory is None:
+            path_factory = self.DEFAULT_PATH_FACTORY
         if master and not loader_cls:
             loader_cls = type(master)
         if loader_cls is None:
-            loader_cls = self.DEFAULT_LOADER_CLS
+            loader_cls = self._default_loader_cls()
 
         # Auto-register !include / !load tags if a loader is provided
         # and the tags haven't already been registered on this loader class.
         if loader is not None:
             self._register_include_tags(loader_cls, loader, path_factory)
 
-        loader_instance = loader_cls(path.read_text(encoding=encoding))
+        loader_instance = loader_cls(self._text(data, encoding))
         # Make the driving ConfigLoader reachable from the include constructor
         # (see _register_include_tags._construct) so nested !include/!load
         # resolve through THIS loader's settings, not the first one registered.
         if loader is not None:
             loader_instance._yaconfiglib_config_loader = loader
         try:
-            if master:
+            # libyaml loaders keep their anchors internal; there is nothing
+            # to hand over (or to receive) there.
+            if hasattr(master, "anchors") and hasattr(loader_instance, "anchors"):
                 loader_instance.anchors = master.anchors
             data = loader_instance.get_single_data()
             return data
         finally:
             loader_instance.dispose()
 
+    def _default_loader_cls(self) -> type[yaml.Loader]:
+        """:attr:`DEFAULT_LOADER_CLS`, or ``yaml.CSafeLoader`` in its place.
+
+        The C loader is only used for a stock ``yaml.SafeLoader`` default:
+        a custom default class, or one extended with its own constructors or
+        resolvers, stays on the pure-Python path.
+        """
+        loader_cls = self.DEFAULT_LOADER_CLS
+        if (
+            self.USE_LIBYAML
+            and loader_cls is yaml.SafeLoader
+            and not _extended(loader_cls)
+        ):
+            return yaml.CSafeLoader
+        return loader_cls
+
     @staticmethod
     def _register_include_tags(
         loader_cls: type[yaml.Loader],
@@ -157,7 +234,36 @@ class YamlConfig(ConfigBackend):
             # merge, ...) — a cross-loader state leak, and a hole in
             # allow_commands=False against `!include 'cmd://...'`.
             active = getattr(ldr, "_yaconfiglib_config_loader", loader)
-            return active.load(pathname, *args, **kwargs)
+            memo = _cache.include_memo()
+            if memo is None or not getattr(active, "memoize_includes", False):
+                return active.load(pathname, *args, **kwargs)
+
+            # The same target included many times in one top-level load is
+            # parsed once. Keyed on the loader (which fixes base_dir and every
+            # other setting the include resolves through) plus the include's
+            # own arguments; ``master`` only carries anchors and is left out.
+            try:
+                key = (
+                    id(active),
+                    _cache.freeze(pathname),
+                    _cache.freeze(args),
+                    _cache.freeze({k: v for k, v in kwargs.items() if k != "master"}),
+                )
+            except TypeError:
+                return active.load(pathname, *args, **kwargs)
+            hit = memo.get(key)
+            if hit is None:
+                with _cache.track_dependencies() as deps:
+                    value = active.load(pathname, *args, **kwargs)
+                hit = memo[key] = (active, value, tuple(deps))
+            else:
+                # Report the memoized include's sources again so dependency
+                # tracking (document caching, reload) still sees them.
+                for dep in hit[2]:
+                    _cache.note_dependency(dep)
+            if active.share_includes:
+                return hit[1]
+            return _cache.thaw(hit[1])
 
         for tag in _INCLUDE_TAGS:
             loader_cls.add_constructor(tag, _construct)
@@ -166,5 +272,9 @@ class YamlConfig(ConfigBackend):
 
     def dumps(self, data: str, dumper_cls: yaml.Dumper = None, **options) -> str:
         """Serialize *data* to a YAML string using *dumper_cls* (defaults to :attr:`DEFAULT_DUMPER_CLS`)."""
-        options.setdefault("Dumper", dumper_cls or self.DEFAULT_DUMPER_CLS)
+        if dumper_cls is None:
+            dumper_cls = self.DEFAULT_DUMPER_CLS
+            if self.USE_LIBYAML and dumper_cls is yaml.Dumper:
+                dumper_cls = yaml.CDumper
+        options.setdefault("Dumper", dumper_cls)
         return yaml.dump(data, **options)
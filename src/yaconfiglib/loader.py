@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import logging
+import threading
 import typing
 
 try:
@@ -10,18 +13,28 @@ except ImportError:
 
 from pathlib import PurePosixPath
 
-try:
-    from .utils import jinja2
-except ImportError:
-    jinja2 = None
-
 from .backends import ConfigBackend
+from .utils import cache as _cache
 from .utils.enum import IntEnum
+from .utils.lazy import LAZY_MERGE_METHODS, LazyMergeView
 from .utils.log import LogLevel
 from .utils.merge import Merge, MergeMethod, is_array
-from .utils.source import SourceLike, parse_sources
+from .utils.source import (
+    MemorySource,
+    SourceLike,
+    TextLike,
+    expand_glob,
+    glob_signature,
+    is_glob_source,
+    memory_source,
+    parse_sources,
+)
+
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 __all__ = [
+    "ConfigHandle",
     "ConfigLoader",
     "ConfigLoaderMergeMethod",
     "CommandsDisabledError",
@@ -39,6 +52,17 @@ T = typing.TypeVar("T")
 _JINJA_ENVS = {}
 
 
+def _jinja2():
+    """Import :mod:`yaconfiglib.utils.jinja2` on first use.
+
+    Jinja2 is only needed for ``interpolate``, ``transform``, ``%`` key
+    factories and ``.j2`` sources, so it is kept out of ``import yaconfiglib``.
+    """
+    from .utils import jinja2
+
+    return jinja2
+
+
 def _get_jinja_env(strict: bool, sandbox: bool = False) -> object:
     key = (strict, sandbox)
     if key not in _JINJA_ENVS:
@@ -142,6 +166,118 @@ else:
     )
 
 
+#: ``load()`` keywords resolved by ``ConfigLoader._plan`` rather than per source.
+_PLAN_ARGS = frozenset(
+    (
+        "recursive",
+        "encoding",
+        "interpolate",
+        "sandbox",
+        "merge",
+        "merge_options",
+        "lazy",
+        "max_workers",
+        "executor",
+    )
+)
+
+
+#: Merge strategies whose ``merge_many`` walks all layers together (others
+#: just fold pairwise, so load() keeps merging them as sources arrive).
+_N_WAY_MERGES = frozenset(("Deep", "Substitute"))
+#: Below this many sources, folding in place is as fast as the N-way walk.
+_N_WAY_MIN_SOURCES = 16
+
+
+class _LoadPlan(typing.NamedTuple):
+    """Per-call settings of one :meth:`ConfigLoader.load`/:meth:`~ConfigLoader.aload`."""
+
+    sources: typing.Iterator[Path]
+    encoding: str
+    recursive: bool
+    interpolate: bool
+    sandbox: bool
+    merge: Merge
+    lazy: bool
+    merge_options: dict[str]
+    max_workers: int
+    executor: Executor
+
+
+def _resolve_merge(merge: object, lazy: bool) -> tuple[Merge, bool]:
+    """Normalize a ``merge=``/``lazy=`` pair; ``merge="lazy"`` means lazy ``Deep``."""
+    if isinstance(merge, str) and merge.lower() == "lazy":
+        merge, lazy = ConfigLoaderMergeMethod.Deep, True
+    elif not isinstance(merge, Merge):
+        merge = ConfigLoaderMergeMethod(merge)
+    lazy = bool(lazy)
+    if lazy and not (
+        isinstance(merge, (MergeMethod, ConfigLoaderMergeMethod))
+        and merge.name in LAZY_MERGE_METHODS
+    ):
+        raise ValueError(
+            f"lazy merging supports {sorted(LAZY_MERGE_METHODS)}, not {merge!r}"
+        )
+    return merge, lazy
+
+
+def _interpolate_mode(interpolate: object) -> bool | str:
+    """Normalize ``interpolate=`` to False, True or ``"lazy"``."""
+    if isinstance(interpolate, str) and interpolate.lower() == "lazy":
+        return "lazy"
+    return bool(interpolate)
+
+
+class _LazyLayers(list):
+    """Parsed documents gathered, in order, for a lazy merge."""
+
+
+def _lazy_merge(layers: _LazyLayers, merge: Merge, merge_options: dict) -> object:
+    present = [layer for layer in layers if layer is not None]
+    if not present:
+        return None
+    if all(isinstance(layer, typing.Mapping) for layer in present):
+        return LazyMergeView(present, merge, **merge_options)
+    # Only mappings can be viewed lazily; anything else merges as usual.
+    result = layers[0]
+    for layer in layers[1:]:
+        result = merge(result, layer, **merge_options)
+    return result
+
+
+class _SourceGroup(typing.NamedTuple):
+    """Resolved sources of one top-level source, remembered by :class:`ConfigHandle`."""
+
+    #: The glob pattern the paths were expanded from, or None for a plain source.
+    pattern: Path | None
+    #: :func:`~yaconfiglib.utils.source.glob_signature` of *pattern* at expansion.
+    signature: tuple | None
+    paths: list[Path]
+
+
+class _Layer(typing.NamedTuple):
+    """One parsed source of a :class:`ConfigHandle`, in merge order."""
+
+    path: Path
+    #: ``(key, value)`` as parsed (never merged into), or the ignored error.
+    outcome: tuple[str, object] | Exception
+    #: ``(dependency, stat_signature)`` for the source and everything it included.
+    fingerprint: tuple[tuple[Path, tuple | None], ...]
+    #: Private copy of the merge state right after this layer.
+    snapshot: tuple[object, bool] = None
+
+
+async def _to_thread(
+    executor: Executor, func: typing.Callable[..., T], /, *args, **kwargs
+) -> T:
+    """Run *func* on *executor* (asyncio's default if None) in a copy of the current context."""
+    import asyncio
+    import functools
+
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
 class _IgnoreError(typing.Protocol):
     def __call__(self, error: Exception, *args, **kwargs) -> bool: ...
 
@@ -179,11 +315,19 @@ class ConfigLoader(ConfigBackend):
         interpolate: bool = None,
         merge: ConfigLoaderMergeMethod | Merge = ConfigLoaderMergeMethod.Simple,
         merge_options: dict[str] = None,
+        lazy: bool = None,
         ignore_error: _IgnoreError | bool = False,
         inject_env: bool = False,
         strict: bool = False,
         allow_commands: bool = True,
         sandbox: bool = False,
+        cache: _cache.DocumentCache | bool = None,
+        cache_dir: str | Path = None,
+        command_cache: _cache.CommandCache | bool = None,
+        memoize_includes: bool = True,
+        share_includes: bool = False,
+        max_workers: int = None,
+        executor: Executor = None,
     ) -> None:
         """Configure a reusable loader.
 
@@ -207,11 +351,21 @@ class ConfigLoader(ConfigBackend):
             log_level: Logging verbosity for this loader's module logger.
             interpolate: If True, run Jinja2 interpolation over the merged
                 result after loading (see :func:`yaconfiglib.utils.jinja2.interpolate`).
+                ``"lazy"`` defers it instead: a mapping result becomes a
+                :class:`LazyInterpolatedDict` that renders each templated
+                value the first time it is read.
             merge: The merge strategy applied between successive sources —
                 a :class:`ConfigLoaderMergeMethod` or any
                 :class:`~yaconfiglib.utils.merge.Merge`-compatible callable.
+                ``"lazy"`` is shorthand for ``Deep`` with *lazy* set.
             merge_options: Extra keyword options forwarded to the merge
                 callable on every call (e.g. ``{"mergelists": True}``).
+            lazy: If True, :meth:`load` does not merge mapping documents
+                up front but returns a read-only
+                :class:`~yaconfiglib.utils.lazy.LazyMergeView` that merges
+                each key on first access. Only ``Simple``, ``Deep`` and
+                ``Substitute`` merges can be lazy. Interpolation, when
+                enabled, still renders the fully merged result.
             ignore_error: Either a bool (ignore/re-raise all load errors
                 uniformly) or a predicate ``(error, **context) -> bool``
                 deciding per-error whether to skip and continue.
@@ -220,7 +374,7 @@ class ConfigLoader(ConfigBackend):
             strict: If True, undefined Jinja2 variables raise during
                 interpolation instead of rendering as empty.
             allow_commands: If False, loading a command source (``cmd://``,
-                ``exec://``, ``sh://``, ``*+fmt://``, or a script-extension
+                ``exec://``, ``sh://``, ``coproc://``, ``*+fmt://``, or a script-extension
                 file) — including one reached via ``!include`` — raises
                 :class:`CommandsDisabledError` instead of executing it. Set
                 this when loading configuration you do not fully trust. Does
@@ -229,14 +383,62 @@ class ConfigLoader(ConfigBackend):
                 ``SandboxedEnvironment``, blocking attribute traversal into
                 Python internals (SSTI). Set this when config values may be
                 untrusted.
+            cache: Parsed-document cache consulted before re-parsing a
+                local file. ``True`` selects the process-wide
+                :data:`~yaconfiglib.utils.cache.DEFAULT_CACHE`; pass a
+                :class:`~yaconfiglib.utils.cache.DocumentCache` for a private
+                one. Only backends with ``CACHEABLE = True`` participate, and
+                documents that ``!include`` other sources are never cached.
+            cache_dir: Directory for a persistent
+                :class:`~yaconfiglib.utils.cache.DiskCache` of parse results,
+                shared by every process pointing at it. Consulted after
+                *cache* and before parsing. The directory must be trusted
+                (see the security guide).
+            command_cache: Cache of command source results, so the same
+                ``cmd://``/``exec://`` source is not run again for every
+                include or reload while its result is fresh. ``True``
+                selects the process-wide
+                :data:`~yaconfiglib.utils.cache.DEFAULT_COMMAND_CACHE`; pass
+                a :class:`~yaconfiglib.utils.cache.CommandCache` to choose
+                the TTL, size and stale-while-revalidate window.
+            memoize_includes: If True, a YAML ``!include``/``!load`` target
+                repeated within one top-level :meth:`load` (same loader,
+                path and include arguments) is parsed once and reused. Turn
+                off when an include must be re-evaluated every time, e.g. a
+                command whose output changes between calls.
+            share_includes: If True, memoized includes hand out the same
+                object at every inclusion site instead of a private copy.
+                Faster, but mutating one site (including an in-place merge)
+                is visible at every other.
+            max_workers: If greater than 1, :meth:`load` reads and parses
+                its sources concurrently on a private thread pool of this
+                size, then merges the results strictly in source order, so
+                the outcome is identical to a serial load. Helps most with
+                command sources and slow (e.g. network) filesystems.
+            executor: An application-owned
+                :class:`concurrent.futures.Executor` to fetch sources on
+                instead of a private pool; takes precedence over
+                *max_workers* and is never shut down by the loader.
         """
         self.allow_commands = bool(allow_commands)
-        self.sandbox = bool(sandbox)
-        self.merge = (
-            merge if isinstance(merge, Merge) else ConfigLoaderMergeMethod(merge)
+        if cache is True:
+            cache = _cache.DEFAULT_CACHE
+        self.cache = None if cache is None or cache is False else cache
+        self.cache_dir = cache_dir
+        self._disk_cache = _cache.DiskCache(cache_dir) if cache_dir else None
+        if command_cache is True:
+            command_cache = _cache.DEFAULT_COMMAND_CACHE
+        self.command_cache = (
+            None if command_cache is None or command_cache is False else command_cache
         )
+        self.memoize_includes = bool(memoize_includes)
+        self.share_includes = bool(share_includes)
+        self.max_workers = max_workers
+        self.executor = executor
+        self.sandbox = bool(sandbox)
+        self.merge, self.lazy = _resolve_merge(merge, lazy)
         self.merge_options = {} if merge_options is None else merge_options
-        self.interpolate = False if interpolate is None else bool(interpolate)
+        self.interpolate = _interpolate_mode(interpolate)
         self.inject_env = bool(inject_env)
         self.strict = bool(strict)
         # Stored for introspection only. Library code must never call
@@ -270,7 +472,7 @@ class ConfigLoader(ConfigBackend):
     def base_dir(self, value: str | Path):
         self._base_dir = self._getpath(value)
 
-    def _load(
+    def _prepare(
         self,
         path: Path,
         *,
@@ -281,7 +483,13 @@ class ConfigLoader(ConfigBackend):
         interpolate: bool = None,
         allow_commands: bool = None,
         **reader_args,
-    ) -> tuple[str, object]:
+    ) -> tuple[ConfigBackend, dict, typing.Callable[[object], tuple[str, object]]]:
+        """Plan the load of one source, shared by :meth:`_load` and :meth:`_aload`.
+
+        Returns the backend to parse *path* with, the options to pass it, and
+        a ``finish(value) -> (key, value)`` callable applying *transform* and
+        the key factory to the parsed document.
+        """
 
         # NOTE: `recursive` is deliberately NOT a parameter here. Glob expansion
         # happens in parse_sources(), before _load() is ever called, so a
@@ -309,7 +517,7 @@ class ConfigLoader(ConfigBackend):
         key_factory = key_factory or self.key_factory
         if not callable(key_factory):
             if key_factory.startswith("%"):
-                _eval = jinja2.eval(key_factory.removeprefix("%"))
+                _eval = _jinja2().eval(key_factory.removeprefix("%"))
 
                 def _key(path: Path, value):
                     return _eval(value=value, pathname=PurePosixPath(path.as_posix()))
@@ -343,15 +551,159 @@ class ConfigLoader(ConfigBackend):
                 False if (loader is self and self.interpolate) else interpolate
             ),
         )
+        if self.command_cache is not None:
+            from .backends.command import CommandBackend
+
+            if isinstance(_loader, CommandBackend):
+                _options["command_cache"] = self.command_cache
         _options.update(reader_args)
 
-        value = _loader.load(path, **_options)
-        if transform:
-            value = jinja2.eval(transform)(
-                value=value, pathname=PurePosixPath(path.as_posix())
+        def finish(value: object) -> tuple[str, object]:
+            if transform:
+                value = _jinja2().eval(transform)(
+                    value=value, pathname=PurePosixPath(path.as_posix())
+                )
+            return key_factory(path, value), value
+
+        return _loader, _options, finish
+
+    def _load(self, path: Path, **load_args) -> tuple[str, object]:
+        backend, options, finish = self._prepare(path, **load_args)
+        _cache.note_dependency(path)
+        return finish(self._parse(backend, path, options))
+
+    async def _aload(
+        self, path: Path, executor: Executor = None, **load_args
+    ) -> tuple[str, object]:
+        backend, options, finish = self._prepare(path, **load_args)
+        _cache.note_dependency(path)
+        if isinstance(path, MemorySource):
+            # Nothing to read or wait for: the content is already in memory.
+            value = self._parse(backend, path, options)
+        elif self._uses_cache(backend, options):
+            # Cache lookups stat and read files: keep them off the event loop.
+            value = await _to_thread(executor, self._parse, backend, path, options)
+        elif executor is not None and type(backend).aload is ConfigBackend.aload:
+            value = await _to_thread(executor, backend.load, path, **options)
+        else:
+            value = await backend.aload(path, **options)
+        return finish(value)
+
+    def _uses_cache(self, backend: ConfigBackend, options: dict) -> bool:
+        return (
+            (self.cache is not None or self._disk_cache is not None)
+            and getattr(backend, "CACHEABLE", False)
+            and "master" not in options
+        )
+
+    def _parse(self, backend: ConfigBackend, path: Path, options: dict) -> object:
+        if isinstance(path, MemorySource):
+            # In-memory content goes straight to the backend's parser; it has
+            # no file signature for the caches to key on. Duck-typed backends
+            # without loads() read it through the source's read_text().
+            loads = getattr(backend, "loads", None)
+            if loads is None:
+                return backend.load(path, **options)
+            return loads(path.data, name=path.name, **options)
+        cache = self.cache
+        disk_cache = self._disk_cache
+        if not self._uses_cache(backend, options):
+            return backend.load(path, **options)
+        # Everything except the per-loader plumbing identifies the parse; the
+        # loader/path_factory/base_dir only steer nested includes, and a
+        # document with includes is never cached (see DocumentCache.load).
+        try:
+            key = (
+                type(backend),
+                _cache.freeze(vars(backend)),
+                _cache.freeze(
+                    {
+                        k: v
+                        for k, v in options.items()
+                        if k not in ("loader", "path_factory", "base_dir")
+                    }
+                ),
             )
+        except TypeError:
+            return backend.load(path, **options)
 
-        return key_factory(path, value), value
+        def parse() -> object:
+            return backend.load(path, **options)
+
+        if disk_cache is not None:
+            parse_from_disk = parse
+
+            def parse() -> object:
+                return disk_cache.load(
+                    path,
+                    key,
+                    parse_from_disk,
+                    version=getattr(backend, "CACHE_VERSION", None),
+                )
+
+        if cache is None:
+            return parse()
+        return cache.load(path, key, parse)
+
+    def _fetch(
+        self,
+        paths: typing.Iterable[Path],
+        *,
+        executor: Executor = None,
+        max_workers: int = None,
+        load: typing.Callable[..., object] = None,
+        **load_args: object,
+    ) -> typing.Generator[tuple[Path, tuple[str, object] | Exception], None, None]:
+        """Yield ``(path, outcome)`` for every source, in source order.
+
+        *outcome* is the ``(key, value)`` pair from :meth:`_load`, or the
+        exception it raised — errors are handed back rather than raised so the
+        caller can apply ``ignore_error`` at the source's position in the
+        merge. With an *executor*, or *max_workers* above 1, every source is
+        submitted up front and fetched concurrently; results are still yielded
+        in order. Closing the generator early cancels whatever has not started.
+        *load* replaces :meth:`_load` as the per-source step.
+        """
+        load = load or self._load
+
+        def fetch(path: Path) -> tuple[str, object] | Exception:
+            try:
+                return load(path, **load_args)
+            except Exception as error:  # noqa: BLE001 - re-raised by load()
+                return error
+
+        if executor is None and (max_workers is None or max_workers <= 1):
+            for path in paths:
+                yield path, fetch(path)
+            return
+
+        paths = list(paths)
+        if len(paths) < 2:
+            for path in paths:
+                yield path, fetch(path)
+            return
+
+        pool = executor
+        if pool is None:
+            # concurrent.futures is only needed for parallel loads.
+            from concurrent.futures import ThreadPoolExecutor
+
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="yaconfiglib"
+            )
+        # Each task runs in a copy of the caller's context so the include memo
+        # of the enclosing load() (and dependency tracking) is visible to it.
+        futures = [
+            pool.submit(contextvars.copy_context().run, fetch, path) for path in paths
+        ]
+        try:
+            for path, future in zip(paths, futures):
+                yield path, future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            if executor is None:
+                pool.shutdown(wait=True)
 
     def load(
         self,
@@ -366,8 +718,11 @@ class ConfigLoader(ConfigBackend):
         interpolate: bool = None,
         merge: ConfigLoaderMergeMethod | Merge = None,
         merge_options: dict[str] = None,
+        lazy: bool = None,
         allow_commands: bool = None,
         sandbox: bool = None,
+        max_workers: int = None,
+        executor: Executor = None,
         **reader_args: object,
     ) -> object:
         """Load, merge, and (optionally) interpolate one or more configuration sources.
@@ -406,6 +761,10 @@ class ConfigLoader(ConfigBackend):
             merge: Overrides the instance's *merge* strategy for this call.
             merge_options: Overrides the instance's *merge_options* for
                 this call.
+            lazy: Overrides the instance's *lazy* for this call.
+            max_workers: Overrides the instance's *max_workers* for this
+                call.
+            executor: Overrides the instance's *executor* for this call.
             **reader_args: Additional keyword arguments forwarded to each
                 backend's ``load()`` (e.g. backend-specific options like
                 ``json_decoder_options`` or ``ini_default_section``).
@@ -414,43 +773,230 @@ class ConfigLoader(ConfigBackend):
             The merged (and possibly interpolated) result. Dict results
             are wrapped in :class:`DotAccessibleDict`.
         """
-        encoding = encoding or self.encoding
-        interpolate = self.interpolate if interpolate is None else interpolate
-        sandbox = self.sandbox if sandbox is None else sandbox
-        recursive = self.recursive if recursive is None else recursive
-        merge = (
-            merge
-            if isinstance(merge, Merge)
-            else (ConfigLoaderMergeMethod(merge) if merge else self.merge)
+        plan = self._plan(
+            pathname,
+            recursive=recursive,
+            encoding=encoding,
+            interpolate=interpolate,
+            sandbox=sandbox,
+            merge=merge,
+            merge_options=merge_options,
+            lazy=lazy,
+            max_workers=max_workers,
+            executor=executor,
+        )
+        with _cache.load_scope():
+            fetched = self._fetch(
+                plan.sources,
+                executor=plan.executor,
+                max_workers=plan.max_workers,
+                encoding=plan.encoding,
+                loader=loader,
+                transform=transform,
+                key_factory=key_factory,
+                allow_commands=allow_commands,
+                **reader_args,
+            )
+            with contextlib.closing(fetched):
+                results = self._merge_sources(fetched, plan, default)
+        return self._finalize(results, plan, flatten)
+
+    async def aload(
+        self,
+        *pathname: SourceLike,
+        recursive: bool = None,
+        encoding: str = None,
+        loader: str = None,
+        transform: str = None,
+        default: object = None,
+        key_factory: str | typing.Callable[[Path], str] = None,
+        flatten: bool = False,
+        interpolate: bool = None,
+        merge: ConfigLoaderMergeMethod | Merge = None,
+        merge_options: dict[str] = None,
+        lazy: bool = None,
+        allow_commands: bool = None,
+        sandbox: bool = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        **reader_args: object,
+    ) -> object:
+        """Asynchronous :meth:`load`, safe to await from an event loop.
+
+        Takes the same arguments and returns the same result as :meth:`load`.
+        Every source is fetched concurrently — files are read and parsed on a
+        worker thread, command sources run through
+        :func:`asyncio.create_subprocess_shell` — and the results are merged
+        strictly in source order, with ``ignore_error`` applied per source
+        exactly as in :meth:`load`. *max_workers* caps how many sources are
+        in flight at once; *executor* replaces asyncio's default executor for
+        the threaded work.
+        """
+        import asyncio
+
+        plan = self._plan(
+            pathname,
+            recursive=recursive,
+            encoding=encoding,
+            interpolate=interpolate,
+            sandbox=sandbox,
+            merge=merge,
+            merge_options=merge_options,
+            lazy=lazy,
+            max_workers=max_workers,
+            executor=executor,
         )
-        # Per-call override only — must NOT rewrite self.merge_options (doing so
-        # made one call's override silently leak into every later load()).
-        merge_options = self.merge_options if merge_options is None else merge_options
+        with _cache.load_scope():
+            # Glob expansion and stream reads hit the filesystem too.
+            paths = await _to_thread(plan.executor, list, plan.sources)
+            limit = asyncio.Semaphore(plan.max_workers or len(paths) or 1)
+            outcomes = await asyncio.gather(
+                *(
+                    self._afetch(
+                        path,
+                        limit,
+                        executor=plan.executor,
+                        encoding=plan.encoding,
+                        loader=loader,
+                        transform=transform,
+                        key_factory=key_factory,
+                        allow_commands=allow_commands,
+                        **reader_args,
+                    )
+                    for path in paths
+                )
+            )
+            results = self._merge_sources(zip(paths, outcomes), plan, default)
+        return self._finalize(results, plan, flatten)
 
-        results = default
-        _join_init = False
+    async def _afetch(
+        self, path: Path, limit: typing.AsyncContextManager, **load_args: object
+    ) -> tuple[str, object] | Exception:
+        """Async counterpart of :meth:`_fetch`'s per-source step."""
+        try:
+            async with limit:
+                return await self._aload(path, **load_args)
+        except Exception as error:  # noqa: BLE001 - re-raised by _merge_sources()
+            return error
 
+    def _plan(
+        self,
+        pathname: tuple[SourceLike, ...],
+        *,
+        recursive: bool = None,
+        encoding: str = None,
+        interpolate: bool = None,
+        sandbox: bool = None,
+        merge: ConfigLoaderMergeMethod | Merge = None,
+        merge_options: dict[str] = None,
+        lazy: bool = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        expand_globs: bool = True,
+    ) -> _LoadPlan:
+        """Resolve per-call overrides against the instance settings.
+
+        Shared by :meth:`load`, :meth:`aload` and :meth:`load_handle` so they
+        cannot drift.
+        """
+        encoding = encoding or self.encoding
+        recursive = self.recursive if recursive is None else recursive
+        if merge is None and lazy is None:
+            merge, lazy = self.merge, self.lazy
+        else:
+            merge, lazy = _resolve_merge(
+                self.merge if merge is None else merge,
+                self.lazy if lazy is None else lazy,
+            )
+        if executor is None and max_workers is None:
+            executor = self.executor
         if not pathname:
             pathname = ("#!\n",)
-
-        for path in parse_sources(
-            pathname,
-            base_dir=self.base_dir,
+        return _LoadPlan(
+            sources=parse_sources(
+                pathname,
+                base_dir=self.base_dir,
+                encoding=encoding,
+                path_factory=self.path_factory,
+                recursive=recursive,
+                expand_globs=expand_globs,
+            ),
             encoding=encoding,
-            path_factory=self.path_factory,
             recursive=recursive,
+            interpolate=(
+                self.interpolate
+                if interpolate is None
+                else _interpolate_mode(interpolate)
+            ),
+            sandbox=self.sandbox if sandbox is None else sandbox,
+            merge=merge,
+            lazy=lazy,
+            # Per-call override only — must NOT rewrite self.merge_options (doing
+            # so made one call's override silently leak into every later load()).
+            merge_options=(
+                self.merge_options if merge_options is None else merge_options
+            ),
+            max_workers=self.max_workers if max_workers is None else max_workers,
+            executor=executor,
+        )
+
+    def _merge_sources(
+        self,
+        fetched: typing.Iterable[tuple[Path, tuple[str, object] | Exception]],
+        plan: _LoadPlan,
+        results: object,
+        _join_init: bool = False,
+        snapshots: list[tuple[object, bool]] = None,
+    ) -> object:
+        """Merge fetched ``(path, outcome)`` pairs in order, as :meth:`_fetch` yields them.
+
+        *results*/*_join_init* give the state to continue from. If
+        *snapshots* is a list, a private copy of that state is appended to it
+        after every source.
+
+        When starting fresh with ``Deep``/``Substitute`` and many sources
+        (``_N_WAY_MIN_SOURCES``), all of them are merged in one
+        :meth:`~yaconfiglib.utils.merge.MergeMethod.merge_many` pass instead.
+        """
+        merge = plan.merge
+        merge_options = plan.merge_options
+        if (
+            snapshots is None
+            and not _join_init
+            and not plan.lazy
+            and getattr(merge, "name", None) in _N_WAY_MERGES
         ):
+            fetched = list(fetched)
+            docs = [
+                outcome[1]
+                for _path, outcome in fetched
+                if not isinstance(outcome, Exception)
+            ]
+            if len(docs) == len(fetched) >= _N_WAY_MIN_SOURCES:
+                # Structural sharing leaves the documents intact, so a merge
+                # error can still be replayed below, where ignore_error gets
+                # to see it along with the offending source. That replay is
+                # the only fallback: merge_many must not refold first.
+                try:
+                    return merge.merge_many(
+                        docs,
+                        refold=False,
+                        **{**merge_options, "structural_sharing": True},
+                    )
+                except Exception:  # noqa: BLE001 - re-raised below
+                    pass
+        for path, outcome in fetched:
             try:
-                name, result = self._load(
-                    path,
-                    encoding=encoding,
-                    loader=loader,
-                    transform=transform,
-                    key_factory=key_factory,
-                    allow_commands=allow_commands,
-                    **reader_args,
-                )
-                if _join_init:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                name, result = outcome
+                if plan.lazy:
+                    # Layers are merged on access by _finalize's view.
+                    if not _join_init:
+                        results = _LazyLayers()
+                        _join_init = True
+                    results.append(result)
+                elif _join_init:
                     results = merge(
                         results,
                         result,
@@ -477,10 +1023,16 @@ class ConfigLoader(ConfigBackend):
                 Exception
             ) as error:  # noqa: BLE001 - feeds the ignore_error predicate
                 logger.debug("load error for %s: %s", path, error)
-                if self.ignore_error(error, path=path, loader=self):
-                    continue
-                raise
-
+                if not self.ignore_error(error, path=path, loader=self):
+                    raise
+            if snapshots is not None:
+                snapshots.append((_cache.thaw(results), _join_init))
+        return results
+
+    def _finalize(self, results: object, plan: _LoadPlan, flatten: bool) -> object:
+        """Flatten, interpolate and wrap a merged result."""
+        if isinstance(results, _LazyLayers):
+            results = _lazy_merge(results, plan.merge, plan.merge_options)
         if flatten:
             if isinstance(results, typing.Mapping):
                 result = {
@@ -497,23 +1049,18 @@ class ConfigLoader(ConfigBackend):
         else:
             result = results
 
-        if interpolate:
-            import os
-
-            custom_env = _get_jinja_env(self.strict, sandbox)
-
-            # Auto-inject env context if requested
-            globals_dict = {}
-            if isinstance(result, typing.Mapping):
-                globals_dict.update(result)
-            if self.inject_env:
-                globals_dict["env"] = os.environ
-
+        if plan.interpolate:
+            if isinstance(result, LazyMergeView):
+                result = result.materialize()
+            custom_env = _get_jinja_env(self.strict, plan.sandbox)
+            if plan.interpolate == "lazy" and isinstance(result, typing.Mapping):
+                return self._lazy_interpolated(result, custom_env)
             try:
-                result = jinja2.interpolate(
+                result = _jinja2().interpolate(
                     result,
-                    globals=globals_dict,
+                    globals=self._template_globals(result),
                     environment=custom_env,
+                    ordered=True,
                 )
             except (
                 Exception
@@ -528,6 +1075,249 @@ class ConfigLoader(ConfigBackend):
 
         return result
 
+    def _lazy_interpolated(
+        self, data: typing.Mapping, environment: object
+    ) -> LazyInterpolatedDict:
+        """Wrap *data* in a :class:`LazyInterpolatedDict` rendering like eager interpolation.
+
+        A value's template sees the values it references rendered, as with
+        ``ordered`` eager interpolation: each referenced top-level name is
+        read through the returned dict, which renders it (and, through
+        attribute access, anything below it) on demand. A value reached
+        again while it is being rendered is an
+        :class:`~yaconfiglib.utils.jinja2.InterpolationCycleError`.
+        """
+        jinja2 = _jinja2()
+        globals_dict = self._template_globals(data)
+        local = threading.local()
+        root = None
+
+        def scope(value: object) -> dict:
+            names = {
+                ref[0]
+                for code in jinja2._template_strings(value)
+                for ref in jinja2.references(code, environment)
+            }
+            found = {}
+            for name in names:
+                if name not in globals_dict:
+                    continue
+                # A global shadowing a top-level key (e.g. env) wins, as in
+                # eager interpolation. Templated keys of the root itself are
+                # rendered before it exists, against the raw values.
+                if (
+                    root is not None
+                    and name in data
+                    and globals_dict[name] is data[name]
+                ):
+                    found[name] = root[name]
+                else:
+                    found[name] = globals_dict[name]
+            return found
+
+        def render(value: object, path: tuple = None) -> object:
+            rendering = local.__dict__.setdefault("paths", [])
+            if path is not None and path in rendering:
+                chain = rendering[rendering.index(path) :] + [path]
+                raise jinja2.InterpolationCycleError(
+                    [jinja2._format_path(entry) for entry in chain]
+                )
+            rendering.append(path)
+            try:
+                # Copy containers: the raw value is shared with globals_dict.
+                return jinja2.interpolate(
+                    _cache.thaw(value), globals=scope(value), environment=environment
+                )
+            except (
+                Exception
+            ) as error:  # noqa: BLE001 - feeds the ignore_error predicate
+                # A cycle is reported once, by the render that started it.
+                if len(rendering) > 1 and isinstance(
+                    error, jinja2.InterpolationCycleError
+                ):
+                    raise
+                logger.debug("interpolation error: %s", error)
+                if not self.ignore_error(error, result=value, loader=self):
+                    raise
+                return value
+            finally:
+                rendering.pop()
+
+        root = LazyInterpolatedDict(data, render)
+        return root
+
+    def _template_globals(self, value: object) -> dict:
+        # Auto-inject env context if requested
+        globals_dict = {}
+        if isinstance(value, typing.Mapping):
+            globals_dict.update(value)
+        if self.inject_env:
+            import os
+
+            globals_dict["env"] = os.environ
+        return globals_dict
+
+    def load_handle(
+        self,
+        *pathname: SourceLike,
+        default: object = None,
+        flatten: bool = False,
+        **kwargs: object,
+    ) -> ConfigHandle:
+        """Load like :meth:`load`, keeping what :meth:`reload` needs to refresh cheaply.
+
+        Takes the same arguments as :meth:`load`. The returned
+        :class:`ConfigHandle` holds the result in :attr:`~ConfigHandle.value`
+        plus, for every layer, its resolved path, parsed document, a stat
+        fingerprint of the file and every file it ``!include``-d, and a
+        snapshot of the merge state after it. Glob patterns remember the
+        mtimes of the directories they list.
+
+        The bookkeeping costs one deep copy of the merge state per layer, so
+        prefer plain :meth:`load` for configuration that is read only once.
+        """
+        plan_args = {k: kwargs.pop(k) for k in _PLAN_ARGS if k in kwargs}
+        plan = self._plan(pathname, expand_globs=False, **plan_args)
+        groups = []
+        for source in plan.sources:
+            if is_glob_source(source):
+                groups.append(self._expand_group(source, plan.recursive))
+            else:
+                groups.append(_SourceGroup(None, None, [source]))
+        handle = ConfigHandle(
+            self,
+            plan._replace(sources=None),
+            dict(encoding=plan.encoding, **kwargs),
+            default,
+            flatten,
+        )
+        self._rebuild(handle, groups, start=0, reusable={})
+        return handle
+
+    def reload(self, handle: ConfigHandle) -> object:
+        """Refresh *handle* from its sources, re-parsing only what changed.
+
+        Each layer's fingerprint is re-checked with ``stat()``; glob patterns
+        whose directories changed are expanded again. Changed or new sources
+        are parsed, and the merge restarts from the snapshot before the
+        earliest layer that differs, reusing the parsed documents of
+        unchanged layers after it. Sources that cannot be fingerprinted —
+        commands and in-memory documents — count as unchanged.
+
+        Returns:
+            The refreshed result, also stored in ``handle.value``.
+
+        Raises:
+            ValueError: If *handle* was produced by another loader.
+        """
+        if handle.loader is not self:
+            raise ValueError("handle was not produced by this ConfigLoader")
+        groups = []
+        for group in handle.groups:
+            if group.pattern is not None:
+                signature = glob_signature(group.pattern, handle.plan.recursive)
+                if signature is None or signature != group.signature:
+                    group = self._expand_group(group.pattern, handle.plan.recursive)
+            groups.append(group)
+        paths = [str(path) for group in groups for path in group.paths]
+
+        reusable = {}
+        for layer in handle.layers:
+            if not any(
+                _cache.stat_signature(dep) != signature
+                for dep, signature in layer.fingerprint
+            ):
+                reusable[str(layer.path)] = layer
+        start = len(paths)
+        for index, path in enumerate(paths):
+            if (
+                index >= len(handle.layers)
+                or str(handle.layers[index].path) != path
+                or path not in reusable
+            ):
+                start = index
+                break
+        if start == len(paths) == len(handle.layers):
+            handle.parsed = []
+            handle.groups = groups
+            return handle.value
+        self._rebuild(handle, groups, start=start, reusable=reusable)
+        return handle.value
+
+    @staticmethod
+    def _expand_group(pattern: Path, recursive: bool) -> _SourceGroup:
+        # Fingerprint before listing: a file added in between is then caught
+        # by the next reload() instead of being missed.
+        signature = glob_signature(pattern, recursive)
+        return _SourceGroup(pattern, signature, list(expand_glob(pattern, recursive)))
+
+    def _load_layer(self, path: Path, **load_args: object) -> _Layer:
+        with _cache.track_dependencies() as deps:
+            try:
+                outcome = self._load(path, **load_args)
+            except Exception as error:  # noqa: BLE001 - kept for ignore_error
+                outcome = error
+        return _Layer(
+            path,
+            outcome,
+            tuple((dep, _cache.stat_signature(dep)) for dep in deps),
+        )
+
+    def _rebuild(
+        self,
+        handle: ConfigHandle,
+        groups: list[_SourceGroup],
+        *,
+        start: int,
+        reusable: dict[str, _Layer],
+    ) -> None:
+        """Re-merge *handle* from layer *start*, parsing sources not in *reusable*."""
+        plan = handle.plan
+        paths = [path for group in groups for path in group.paths]
+        layers = handle.layers[:start]
+        if layers:
+            results, joined = _cache.thaw(layers[-1].snapshot)
+        else:
+            results, joined = _cache.thaw(handle.default), False
+        parse = [path for path in paths[start:] if str(path) not in reusable]
+        snapshots = []
+
+        def merged_layers():
+            fetched = self._fetch(
+                parse,
+                executor=plan.executor,
+                max_workers=plan.max_workers,
+                load=self._load_layer,
+                **handle.load_args,
+            )
+            with contextlib.closing(fetched):
+                for path in paths[start:]:
+                    layer = reusable.get(str(path))
+                    if layer is None:
+                        _path, layer = next(fetched)
+                        handle.parsed.append(path)
+                    layers.append(layer)
+                    outcome = layer.outcome
+                    if not isinstance(outcome, Exception):
+                        # The stored document must stay pristine for later
+                        # reloads; merges may mutate or alias what they get.
+                        outcome = outcome[0], _cache.thaw(outcome[1])
+                    yield path, outcome
+
+        handle.parsed = []
+        with _cache.load_scope():
+            results = self._merge_sources(
+                merged_layers(), plan, results, joined, snapshots
+            )
+        layers[start:] = [
+            layer._replace(snapshot=snapshot)
+            for layer, snapshot in zip(layers[start:], snapshots)
+        ]
+        value = self._finalize(results, plan, handle.flatten)
+        handle.groups = groups
+        handle.layers = layers
+        handle.value = value
+
     def load_as(self, model_cls: type[T], *pathname: SourceLike, **kwargs) -> T:
         """Load configuration sources and instantiate as *model_cls*.
 
@@ -602,7 +1392,9 @@ class ConfigLoader(ConfigBackend):
             Each source's parsed document, with dict results wrapped in
             :class:`DotAccessibleDict`.
         """
-        interpolate = self.interpolate if interpolate is None else interpolate
+        interpolate = (
+            self.interpolate if interpolate is None else _interpolate_mode(interpolate)
+        )
         encoding = encoding or self.encoding
         custom_env = _get_jinja_env(self.strict, self.sandbox) if interpolate else None
         for path in parse_sources(
@@ -614,25 +1406,17 @@ class ConfigLoader(ConfigBackend):
         ):
             value = None
             try:
-                key, value = self._load(
-                    path,
-                    encoding=encoding,
-                    **reader_args,
-                )
-                if interpolate:
-                    globals_dict = {}
-                    if isinstance(value, typing.Mapping):
-                        globals_dict.update(value)
-                    if self.inject_env:
-                        import os
-
-                        globals_dict["env"] = os.environ
-                    value = jinja2.interpolate(
-                        value, globals_dict, environment=custom_env
+                # One include memo per yielded document: a generator must not
+                # hold a context variable open across its yields.
+                with _cache.load_scope():
+                    key, value = self._load(
+                        path,
+                        encoding=encoding,
+                        **reader_args,
                     )
-                if isinstance(value, dict):
-                    value = DotAccessibleDict(value)
-                yield value
+                yield self._finish_document(
+                    value, custom_env, lazy=interpolate == "lazy"
+                )
 
             except (
                 Exception
@@ -641,6 +1425,157 @@ class ConfigLoader(ConfigBackend):
                 if not self.ignore_error(error, path=path, value=value, loader=self):
                     raise
 
+    async def aload_all(
+        self,
+        *pathname: Path | typing.Sequence[Path],
+        encoding: str = None,
+        interpolate: bool = None,
+        max_workers: int = None,
+        executor: Executor = None,
+        **reader_args: object,
+    ) -> typing.AsyncIterator[object]:
+        """Asynchronous :meth:`load_all`, for use with ``async for``.
+
+        All sources are fetched concurrently as in :meth:`aload`, but each
+        document is yielded on its own, in source order, as soon as it and
+        every document before it are ready. Leaving the loop early cancels
+        the fetches still pending.
+
+        Args:
+            *pathname: Sources to resolve, same semantics as :meth:`load`.
+            encoding: Overrides the instance's *encoding* for this call.
+            interpolate: Overrides the instance's *interpolate* for this
+                call; applied independently to each yielded document.
+            max_workers: Overrides the instance's *max_workers* for this call.
+            executor: Overrides the instance's *executor* for this call.
+            **reader_args: Additional keyword arguments forwarded to each
+                backend's ``load()``.
+
+        Yields:
+            Each source's parsed document, with dict results wrapped in
+            :class:`DotAccessibleDict`.
+        """
+        import asyncio
+
+        interpolate = (
+            self.interpolate if interpolate is None else _interpolate_mode(interpolate)
+        )
+        encoding = encoding or self.encoding
+        if executor is None and max_workers is None:
+            executor = self.executor
+        max_workers = self.max_workers if max_workers is None else max_workers
+        custom_env = _get_jinja_env(self.strict, self.sandbox) if interpolate else None
+        paths = await _to_thread(
+            executor,
+            list,
+            parse_sources(
+                pathname,
+                base_dir=self.base_dir,
+                encoding=encoding,
+                path_factory=self.path_factory,
+                recursive=self.recursive,
+            ),
+        )
+        limit = asyncio.Semaphore(max_workers or len(paths) or 1)
+        tasks = []
+        for path in paths:
+            # One include memo per document, as in load_all(); the task
+            # captures it when created, so none is held across our yields.
+            with _cache.load_scope():
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._afetch(
+                            path,
+                            limit,
+                            executor=executor,
+                            encoding=encoding,
+                            **reader_args,
+                        )
+                    )
+                )
+        try:
+            for path, task in zip(paths, tasks):
+                outcome = await task
+                value = None
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    key, value = outcome
+                    value = self._finish_document(
+                        value, custom_env, lazy=interpolate == "lazy"
+                    )
+                except (
+                    Exception
+                ) as error:  # noqa: BLE001 - feeds the ignore_error predicate
+                    logger.debug("aload_all error for %s: %s", path, error)
+                    if not self.ignore_error(
+                        error, path=path, value=value, loader=self
+                    ):
+                        raise
+                    continue
+                yield value
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _finish_document(
+        self, value: object, environment: object, lazy: bool = False
+    ) -> object:
+        """Interpolate (when *environment* is given) and wrap one document."""
+        if lazy and isinstance(value, typing.Mapping):
+            return self._lazy_interpolated(value, environment)
+        if environment is not None:
+            value = _jinja2().interpolate(
+                value,
+                self._template_globals(value),
+                environment=environment,
+                ordered=True,
+            )
+        if isinstance(value, dict):
+            value = DotAccessibleDict(value)
+        return value
+
+
+class ConfigHandle:
+    """A loaded configuration that :meth:`ConfigLoader.reload` can refresh incrementally.
+
+    Returned by :meth:`ConfigLoader.load_handle`; treat everything but
+    :attr:`value`, :attr:`sources` and :attr:`parsed` as private.
+
+    Attributes:
+        loader: The :class:`ConfigLoader` that produced the handle.
+        value: The result of the latest load or reload, as :meth:`ConfigLoader.load`
+            would have returned it.
+        parsed: The sources parsed by the latest load or reload; unchanged
+            sources are reused and not listed.
+    """
+
+    def __init__(
+        self,
+        loader: ConfigLoader,
+        plan: _LoadPlan,
+        load_args: dict[str, object],
+        default: object,
+        flatten: bool,
+    ) -> None:
+        self.loader = loader
+        self.plan = plan
+        self.load_args = load_args
+        self.default = default
+        self.flatten = flatten
+        self.groups: list[_SourceGroup] = []
+        self.layers: list[_Layer] = []
+        self.parsed: list[Path] = []
+        self.value: object = None
+
+    @property
+    def sources(self) -> list[Path]:
+        """The resolved sources of the latest load or reload, in merge order."""
+        return [path for group in self.groups for path in group.paths]
+
+    def __repr__(self) -> str:
+        return f"<ConfigHandle sources={len(self.layers)} parsed={len(self.parsed)}>"
+
 
 class DotAccessibleDict(dict):
     """Dictionary subclass supporting dot-notation queries and attribute access."""
@@ -695,6 +1630,129 @@ class DotAccessibleDict(dict):
         return val
 
 
+class LazyInterpolatedDict(DotAccessibleDict):
+    """A :class:`DotAccessibleDict` whose Jinja2 templates render on first read.
+
+    Returned by :meth:`ConfigLoader.load` when ``interpolate="lazy"``.
+    Templated strings — and lists, which are rendered whole — are rendered
+    the first time they are read, through item, attribute or dotted
+    :meth:`get` access, iteration over :meth:`items`/:meth:`values`, or
+    comparison, and the result replaces the template. Nested mappings are
+    wrapped on access, and templated keys are rendered when their mapping
+    is wrapped, as eager interpolation does. Rendering uses the same
+    globals, ``strict`` and ``sandbox`` settings as eager interpolation,
+    and a template sees the values it references rendered (they are
+    rendered on demand), so results match eager interpolation. Errors,
+    including an :class:`~yaconfiglib.utils.jinja2.InterpolationCycleError`
+    for values that reference each other, are raised (or passed to
+    ``ignore_error``) at the access that triggers them.
+
+    Call :meth:`resolve_all` to render everything up front, e.g. to
+    validate a config at startup.
+    """
+
+    __slots__ = ("_path", "_pending", "_render")
+
+    def __init__(
+        self,
+        data: typing.Mapping = (),
+        render: typing.Callable[..., object] = None,
+        path: tuple = (),
+    ) -> None:
+        dict.__init__(self)
+        object.__setattr__(self, "_render", render)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_pending", {})
+        items = data.items() if isinstance(data, typing.Mapping) else data
+        for key, value in items:
+            if render is not None and _has_template(key):
+                key = render(key)
+            dict.__setitem__(self, key, value)
+            if render is not None and (_has_template(value) or is_array(value)):
+                self._pending[key] = value
+
+    def __getitem__(self, key: object) -> object:
+        value = dict.__getitem__(self, key)
+        pending = self._pending.get(key, _NO_TEMPLATE)
+        if pending is not _NO_TEMPLATE:
+            # Left pending while rendering: a read of the same key from its
+            # own template reaches the renderer again and is a cycle.
+            if pending is value:
+                value = self._render(value, self._path + (key,))
+                dict.__setitem__(self, key, value)
+            del self._pending[key]
+        if isinstance(value, dict) and not isinstance(value, LazyInterpolatedDict):
+            value = LazyInterpolatedDict(value, self._render, self._path + (key,))
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def __iter__(self) -> typing.Iterator:
+        # Overriding __iter__ makes dict(), {**d} and dict.update() go through
+        # keys()/__getitem__ instead of copying the raw storage.
+        return dict.__iter__(self)
+
+    def get(self, key: str, default: object = None, dig: bool = True) -> object:
+        if key in self:
+            return self[key]
+        return super().get(key, default, dig)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self) -> LazyInterpolatedDict:
+        return LazyInterpolatedDict(self, self._render, self._path)
+
+    def pop(self, key: object, *default: object) -> object:
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def resolve_all(self) -> LazyInterpolatedDict:
+        """Render every pending template, recursively, and return ``self``."""
+        for value in self.values():
+            if isinstance(value, LazyInterpolatedDict):
+                value.resolve_all()
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        return dict.__eq__(self.resolve_all(), other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.resolve_all())
+
+    def __reduce__(self):
+        return DotAccessibleDict, (dict(self),)
+
+
+_NO_TEMPLATE = object()
+
+
+def _has_template(value: object) -> bool:
+    return isinstance(value, str) and any(
+        marker in value for marker in ("{{", "{%", "{#")
+    )
+
+
 def load(fp: typing.Any, **kwargs) -> object:
     """Load configuration from a file pointer or file path."""
     load_keys = {
@@ -716,8 +1774,13 @@ def load(fp: typing.Any, **kwargs) -> object:
     return loader_inst.load(fp, **load_kwargs)
 
 
-def loads(s: str | bytes, **kwargs) -> object:
-    """Load configuration from a string or bytes in memory."""
+def loads(s: TextLike, **kwargs) -> object:
+    """Load configuration from a string, bytes, ``bytearray`` or ``memoryview`` in memory.
+
+    The content is parsed in place by the selected backend's
+    :meth:`~yaconfiglib.backends.base.ConfigBackend.loads` (YAML unless
+    ``loader=`` says otherwise); binary buffers are not copied first.
+    """
     load_keys = {
         "recursive",
         "encoding",
@@ -734,13 +1797,8 @@ def loads(s: str | bytes, **kwargs) -> object:
     loader_kwargs = {k: v for k, v in kwargs.items() if k not in load_keys}
     load_kwargs = {k: v for k, v in kwargs.items() if k in load_keys}
     loader_inst = ConfigLoader(**loader_kwargs)
-    # Use parse_sources inline memory doc marker
-    marker = "#!\n"
-    if isinstance(s, bytes):
-        content = marker.encode("utf-8") + s
-    else:
-        content = marker + s
-    return loader_inst.load(content, **load_kwargs)
+    source = memory_source(s, encoding=load_kwargs.get("encoding"))
+    return loader_inst.load(source, **load_kwargs)
 
 
 def dump(obj: object, fp: typing.Any, **kwargs) -> None:
@@ -761,4 +1819,10 @@ def dumps(obj: object, **kwargs) -> str:
     return backend.dumps(obj, **kwargs)
 
 
-DEFAULT_LOADER = ConfigLoader()
+def __getattr__(name: str) -> object:
+    # DEFAULT_LOADER is built on first access rather than at import time.
+    if name == "DEFAULT_LOADER":
+        global DEFAULT_LOADER
+        DEFAULT_LOADER = ConfigLoader()
+        return DEFAULT_LOADER
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
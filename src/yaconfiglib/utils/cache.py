@@ -0,0 +1,878 @@
+"""
+Parsed-document caching for :class:`~yaconfiglib.loader.ConfigLoader`.
+
+:class:`DocumentCache` is a process-wide, size-bounded LRU cache of parsed
+configuration documents. Entries are keyed by resolved path, backend and
+reader options, validated against a single ``stat()`` of the source, and the
+parsed documents themselves are stored by content hash so identical files are
+parsed only once. Callers always receive a private copy of a cached document,
+so an in-place merge can never corrupt the cache. That copy is deliberate: a
+hit costs time proportional to the document (about 1/30 of a parse), not a
+constant lookup, in exchange for keeping every existing ``MergeMethod`` free
+to mutate its left operand.
+
+:class:`DiskCache` persists the same parse results across processes in a
+directory, so short-lived tools skip re-parsing unchanged files at startup.
+
+:class:`CommandCache` keeps the parsed results of command sources
+(``cmd://``, ``exec://``, ...) for a fixed time, so the same command is not
+run again for every include or reload.
+"""
+
+from __future__ import annotations
+
+import contextlib as _contextlib
+import contextvars as _contextvars
+import copy as _copy
+import logging as _logging
+import os as _os
+import pathlib as _pathlib
+import sys as _sys
+import threading as _threading
+import time as _time
+import typing as _ty
+from collections import OrderedDict as _OrderedDict
+
+__all__ = [
+    "CacheStats",
+    "CommandCache",
+    "CommandCacheStats",
+    "DiskCache",
+    "DocumentCache",
+    "DEFAULT_CACHE",
+    "DEFAULT_COMMAND_CACHE",
+    "freeze",
+    "include_memo",
+    "load_scope",
+    "stat_signature",
+    "thaw",
+]
+
+T = _ty.TypeVar("T")
+
+logger = _logging.getLogger(__name__)
+
+#: Immutable leaf types shared (not copied) by :func:`thaw`.
+_ATOMIC_TYPES = frozenset(
+    (str, int, float, bool, bytes, type(None), complex, frozenset)
+)
+
+# dict subclasses that add behavior but no construction logic or per-instance
+# state (e.g. DotAccessibleDict) can be rebuilt item-wise like a plain dict.
+_PLAIN_DICT_SUBCLASSES: dict[type, bool] = {}
+
+
+def _is_plain_dict_subclass(cls: type) -> bool:
+    plain = _PLAIN_DICT_SUBCLASSES.get(cls)
+    if plain is None:
+        plain = _PLAIN_DICT_SUBCLASSES[cls] = (
+            issubclass(cls, dict)
+            and cls.__new__ is dict.__new__
+            and cls.__init__ is dict.__init__
+            and cls.__setitem__ is dict.__setitem__
+        )
+    return plain
+
+
+# Dependency tracking for nested loads. ConfigLoader._load() records every
+# path it loads into the innermost active tracker, so a parse that pulled in
+# other sources (YAML !include/!load) is visible to whoever is caching it —
+# such a document depends on more than its own file and must not be cached
+# under that file's signature alone.
+_DEPENDENCIES: _contextvars.ContextVar[list | None] = _contextvars.ContextVar(
+    "yaconfiglib_dependencies", default=None
+)
+
+
+# Include memo for the current top-level load (see load_scope()).
+_INCLUDE_MEMO: _contextvars.ContextVar[dict | None] = _contextvars.ContextVar(
+    "yaconfiglib_include_memo", default=None
+)
+
+
+@_contextlib.contextmanager
+def track_dependencies() -> _ty.Iterator[list]:
+    """Collect the paths loaded (via :func:`note_dependency`) inside the block.
+
+    Tracking is transitive: on exit the collected paths are also reported to
+    the enclosing block, if any.
+    """
+    parent = _DEPENDENCIES.get()
+    deps: list = []
+    token = _DEPENDENCIES.set(deps)
+    try:
+        yield deps
+    finally:
+        _DEPENDENCIES.reset(token)
+        if parent is not None:
+            parent.extend(deps)
+
+
+def note_dependency(path: object) -> None:
+    """Record *path* as loaded by the innermost :func:`track_dependencies` block."""
+    deps = _DEPENDENCIES.get()
+    if deps is not None:
+        deps.append(path)
+
+
+@_contextlib.contextmanager
+def load_scope() -> _ty.Iterator[dict]:
+    """Provide the include memo of the outermost load, opening one if needed.
+
+    ``ConfigLoader.load()`` enters this around its parse loop; nested loads
+    triggered by ``!include`` find the outer memo already active and share it,
+    so each include target is parsed once per top-level load.
+    """
+    memo = _INCLUDE_MEMO.get()
+    if memo is not None:
+        yield memo
+        return
+    memo = {}
+    token = _INCLUDE_MEMO.set(memo)
+    try:
+        yield memo
+    finally:
+        _INCLUDE_MEMO.reset(token)
+
+
+def include_memo() -> dict | None:
+    """Return the include memo of the active :func:`load_scope`, if any."""
+    return _INCLUDE_MEMO.get()
+
+
+def stat_signature(path: object) -> tuple[int, int, int] | None:
+    """Return ``(mtime_ns, size, inode)`` for a local file, else None.
+
+    Only real filesystem paths qualify — virtual paths (``MemPath``), command
+    URIs and anything ``os.stat`` cannot see return None, which callers treat
+    as "not cacheable".
+    """
+    if not isinstance(path, _pathlib.Path):
+        return None
+    try:
+        st = _os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def freeze(obj: object) -> _ty.Hashable:
+    """Return a hashable, order-insensitive key for *obj* (used for reader options).
+
+    Raises:
+        TypeError: If *obj* contains something that cannot be hashed.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted(((k, freeze(v)) for k, v in obj.items()), key=repr))
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(v) for v in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(freeze(v) for v in obj)
+    hash(obj)
+    return obj
+
+
+def thaw(obj: T, memo: dict | None = None) -> T:
+    """Return a private copy of *obj* that is safe to mutate.
+
+    Builtin ``dict``/``list``/``tuple`` containers are copied with an exact-type
+    fast path and immutable leaves are shared; anything else falls back to
+    :func:`copy.deepcopy`. Shared subtrees (YAML anchors/aliases) stay shared
+    in the copy.
+    """
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return obj
+    if memo is None:
+        memo = {}
+    oid = id(obj)
+    if oid in memo:
+        return memo[oid]
+    if cls is dict:
+        result = memo[oid] = {}
+        for k, v in obj.items():
+            result[k] = thaw(v, memo)
+        return result
+    if cls is list:
+        result = memo[oid] = []
+        result.extend(thaw(v, memo) for v in obj)
+        return result
+    if cls is tuple:
+        result = memo[oid] = tuple(thaw(v, memo) for v in obj)
+        return result
+    if _is_plain_dict_subclass(cls) and not getattr(obj, "__dict__", None):
+        result = memo[oid] = cls()
+        for k, v in obj.items():
+            dict.__setitem__(result, k, thaw(v, memo))
+        return result
+    return _copy.deepcopy(obj, memo)
+
+
+class CacheStats(_ty.NamedTuple):
+    """Point-in-time counters reported by :attr:`DocumentCache.stats`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    documents: int
+    bytes: int
+
+
+class _Entry(_ty.NamedTuple):
+    signature: tuple
+    # (content digest, backend/options key) of the entry's document.
+    document: tuple
+
+
+class DocumentCache:
+    """Size-bounded LRU cache of parsed documents, shared across loaders.
+
+    Two tables back the cache:
+
+    * an LRU of *entries* — ``(path, backend, options)`` key to the source's
+      stat signature and content digest; a matching signature is a hit with
+      no I/O beyond the ``stat()``.
+    * a content-addressed table of parsed *documents* keyed by digest plus
+      backend and options, reference-counted by entries, so two files with
+      identical bytes (or a touched-but-unchanged file) read the same way
+      are parsed once. The same bytes read by another backend, or with other
+      options, get their own document.
+
+    The byte budget is charged with each document's source size. Evicting an
+    entry drops its document once no other entry refers to it.
+
+    Documents are stored pristine and handed out through :func:`thaw`, so a
+    caller (or a ``MergeMethod`` merging into its left operand in place) can
+    mutate what it receives without affecting the cache. Handing out shared
+    documents would make hits O(1) but would require every merge and every
+    caller to treat loaded configs as read-only, so the copy is kept; for a
+    2 MiB YAML file a hit takes ~125ms against ~3.9s to parse (see the
+    ``cache`` suite in ``benchmarks/bench.py``).
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 << 20) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of ``(path, backend, options)`` entries.
+            max_bytes: Budget for the summed source size of cached documents.
+        """
+        self._lock = _threading.RLock()
+        self._entries: _OrderedDict[tuple, _Entry] = _OrderedDict()
+        # (digest, key) -> [document, nbytes, refcount]
+        self._documents: dict[tuple, list] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit/miss/eviction counters and occupancy."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                documents=len(self._documents),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and document and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._documents.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def resize(self, max_entries: int = None, max_bytes: int = None) -> None:
+        """Change the entry and/or byte budget, evicting LRU entries to fit."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def load(
+        self,
+        path: object,
+        key: _ty.Hashable,
+        parse: _ty.Callable[[], T],
+    ) -> T:
+        """Return the document for *path*, calling *parse* only when needed.
+
+        Args:
+            path: The source being loaded. Non-local paths bypass the cache.
+            key: Hashable identity of the parse — backend and reader options;
+                combined with the path to form the entry key.
+            parse: Zero-argument callable producing the parsed document.
+
+        Returns:
+            A private copy of the (possibly cached) document.
+        """
+        signature = stat_signature(path)
+        if signature is None:
+            return parse()
+        entry_key = (str(path), key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(entry_key)
+                self._hits += 1
+                return thaw(self._documents[entry.document][0])
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return parse()
+        import hashlib
+
+        document_key = (hashlib.blake2b(content, digest_size=20).digest(), key)
+
+        with self._lock:
+            stored = self._documents.get(document_key)
+            if stored is not None:
+                self._store(entry_key, _Entry(signature, document_key), stored)
+                self._hits += 1
+                return thaw(stored[0])
+            self._misses += 1
+
+        with track_dependencies() as deps:
+            document = parse()
+        # Not cacheable when the parse pulled in other sources (includes), or
+        # when the file changed between the stat above and the backend's read.
+        if deps or stat_signature(path) != signature:
+            return document
+
+        with self._lock:
+            stored = self._documents.get(document_key)
+            if stored is None:
+                stored = self._documents[document_key] = [document, len(content), 0]
+                self._bytes += len(content)
+            self._store(entry_key, _Entry(signature, document_key), stored)
+        return thaw(document)
+
+    def _store(self, entry_key: tuple, entry: _Entry, stored: list) -> None:
+        previous = self._entries.pop(entry_key, None)
+        if previous is not None:
+            self._release(previous.document)
+        self._entries[entry_key] = entry
+        stored[2] += 1
+        self._evict()
+
+    def _release(self, document_key: tuple) -> None:
+        stored = self._documents.get(document_key)
+        if stored is None:
+            return
+        stored[2] -= 1
+        if stored[2] <= 0:
+            del self._documents[document_key]
+            self._bytes -= stored[1]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._release(entry.document)
+            self._evictions += 1
+
+
+# Errors that mean "this cache file is unusable" -- truncated, written by an
+# incompatible interpreter, or referring to a class that no longer imports.
+# Any of them degrades to a cache miss.
+_CORRUPT_ERRORS = (
+    OSError,
+    EOFError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    ImportError,
+    IndexError,
+)
+
+_LIBRARY_VERSION = None
+
+
+def _library_version() -> str:
+    global _LIBRARY_VERSION
+    if _LIBRARY_VERSION is None:
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+
+            _LIBRARY_VERSION = version("yaconfiglib")
+        except (ImportError, PackageNotFoundError):
+            _LIBRARY_VERSION = "unknown"
+    return _LIBRARY_VERSION
+
+
+@_contextlib.contextmanager
+def _file_lock(path: str) -> _ty.Iterator[None]:
+    """Hold an exclusive advisory lock on *path* (no-op where unsupported)."""
+    with open(path, "a+b") as handle:
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            return
+        try:
+            import msvcrt
+        except ImportError:
+            yield
+            return
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# marshal, pickle, hashlib and tempfile are imported where they are used:
+# only a DiskCache needs them, and pickle alone costs milliseconds to import.
+
+
+def _dump(obj: object) -> bytes:
+    import marshal
+
+    # marshal is the fastest codec for plain builtin trees; anything it cannot
+    # represent (datetime from TOML/YAML, custom types) goes through pickle.
+    try:
+        return b"M" + marshal.dumps(obj)
+    except ValueError:
+        import pickle
+
+        try:
+            return b"P" + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except pickle.PicklingError as error:
+            raise TypeError(f"cannot cache {type(obj).__name__}: {error}") from error
+
+
+def _undump(data: bytes) -> object:
+    codec, payload = data[:1], data[1:]
+    if codec == b"M":
+        import marshal
+
+        return marshal.loads(payload)
+    if codec == b"P":
+        import pickle
+
+        try:
+            return pickle.loads(payload)
+        except pickle.UnpicklingError as error:
+            raise ValueError(f"corrupt cache entry: {error}") from error
+    raise ValueError(f"unknown cache codec {codec!r}")
+
+
+class DiskCache:
+    """Persistent parse cache shared by every process using the same directory.
+
+    Parsed documents live under ``docs/``, named by a hash of the source's
+    content digest, the backend, its :attr:`~yaconfiglib.backends.base.ConfigBackend.CACHE_VERSION`,
+    the reader options and the yaconfiglib/Python versions, so a library
+    upgrade never reads a stale parse. A small per-path record under
+    ``index/`` remembers the last ``(mtime_ns, size, inode)`` seen for a path
+    and its document, letting an unchanged file hit with a ``stat()`` and one
+    read; a changed signature falls back to hashing the file's bytes.
+
+    Files are written to a temporary name and atomically renamed into place
+    while holding an advisory lock on ``.lock``, so concurrent processes never
+    observe a partial entry.
+
+    Entries are stored with :mod:`marshal` (or :mod:`pickle` for non-builtin
+    values) and loading one executes no user code beyond unpickling, but the
+    directory must still be trusted: anyone able to write into it can make
+    loads return arbitrary objects.
+    """
+
+    def __init__(self, directory: str | _os.PathLike) -> None:
+        """Use (creating if needed) *directory* as the cache root."""
+        self.directory = _os.fspath(directory)
+        self._docs = _os.path.join(self.directory, "docs")
+        self._index = _os.path.join(self.directory, "index")
+        _os.makedirs(self._docs, exist_ok=True)
+        _os.makedirs(self._index, exist_ok=True)
+        self._lock = _os.path.join(self.directory, ".lock")
+
+    def clear(self) -> None:
+        """Remove every cached entry from the directory."""
+        with _file_lock(self._lock):
+            for folder in (self._docs, self._index):
+                for name in _os.listdir(folder):
+                    try:
+                        _os.unlink(_os.path.join(folder, name))
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def _hash(*parts: object) -> str:
+        import hashlib
+
+        return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+    def _read(self, path: str) -> object:
+        with open(path, "rb") as handle:
+            return _undump(handle.read())
+
+    def _write(self, path: str, data: bytes) -> None:
+        import tempfile
+
+        fd, tmp = tempfile.mkstemp(dir=_os.path.dirname(path), suffix=".tmp")
+        try:
+            with _os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            _os.replace(tmp, path)
+        except OSError:
+            try:
+                _os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def load(
+        self,
+        path: object,
+        key: _ty.Hashable,
+        parse: _ty.Callable[[], T],
+        version: str = None,
+    ) -> T:
+        """Return the document for *path* from disk, calling *parse* on a miss.
+
+        Args:
+            path: The source being loaded. Non-local paths bypass the cache.
+            key: Backend and reader-option identity, as for
+                :meth:`DocumentCache.load`. Keys whose ``repr`` is not stable
+                across processes (containing a memory address) bypass the
+                cache.
+            parse: Zero-argument callable producing the parsed document.
+            version: Extra version tag folded into the document key, e.g.
+                the backend's parser library version.
+        """
+        signature = stat_signature(path)
+        if signature is None:
+            return parse()
+        identity = repr(key)
+        if " at 0x" in identity:
+            return parse()
+        tag = (
+            identity,
+            version,
+            _library_version(),
+            _sys.version_info[:2],
+        )
+        index_file = _os.path.join(self._index, self._hash(str(path), tag))
+
+        try:
+            recorded_signature, doc_name = self._read(index_file)
+            if tuple(recorded_signature) == signature:
+                return self._read(_os.path.join(self._docs, doc_name))
+        except _CORRUPT_ERRORS:
+            pass
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return parse()
+        import hashlib
+
+        doc_name = self._hash(hashlib.blake2b(content, digest_size=20).hexdigest(), tag)
+        doc_file = _os.path.join(self._docs, doc_name)
+        try:
+            document = self._read(doc_file)
+        except _CORRUPT_ERRORS:
+            with track_dependencies() as deps:
+                document = parse()
+            if deps or stat_signature(path) != signature:
+                return document
+            try:
+                data = _dump(document)
+            except (TypeError, AttributeError):
+                return document
+            with _file_lock(self._lock):
+                self._write(doc_file, data)
+                self._write(index_file, _dump((signature, doc_name)))
+            return document
+
+        with _file_lock(self._lock):
+            self._write(index_file, _dump((signature, doc_name)))
+        return document
+
+
+#: Process-wide cache used by ``ConfigLoader(cache=True)``.
+DEFAULT_CACHE = DocumentCache()
+
+
+class CommandCacheStats(_ty.NamedTuple):
+    """Point-in-time counters reported by :attr:`CommandCache.stats`.
+
+    Attributes:
+        hits: Lookups answered by a fresh entry.
+        misses: Lookups that ran the command.
+        stale_hits: Lookups answered by an expired entry inside the
+            ``stale_while_revalidate`` window.
+        coalesced: Lookups that waited for a run already in progress.
+        refreshes: Background refreshes started for stale entries.
+        evictions: Entries dropped to stay within ``max_entries``.
+        entries: Entries currently held.
+    """
+
+    hits: int
+    misses: int
+    stale_hits: int
+    coalesced: int
+    refreshes: int
+    evictions: int
+    entries: int
+
+
+class _Flight:
+    """One in-progress run of a command that other lookups can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = _threading.Event()
+        self.value = None
+        self.error: BaseException | None = None
+
+    def result(self) -> object:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+# CommandCache._lookup() outcomes.
+_HIT, _STALE, _WAIT, _RUN = range(4)
+
+
+class CommandCache:
+    """Time-bounded cache of command results with single-flight runs.
+
+    Entries are keyed by the command string, its output format and the
+    reader options, and stay fresh for *ttl* seconds. Concurrent lookups of
+    a key that is being run wait for that one run instead of starting their
+    own (single-flight); a failed run is raised to all of them and not
+    cached. With *stale_while_revalidate*, an entry that expired less than
+    that many seconds ago is still returned while one background run
+    refreshes it; if the refresh fails, the stale value is kept until the
+    window closes.
+
+    Like :class:`DocumentCache`, results are stored pristine and handed out
+    through :func:`thaw`. A cached result does not notice changes to files
+    the command's output includes — the *ttl* bounds how long that lasts.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 256,
+        stale_while_revalidate: float = 0.0,
+        clock: _ty.Callable[[], float] = _time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            ttl: Seconds a result stays fresh after its command finished.
+            max_entries: Maximum number of cached commands (LRU eviction).
+            stale_while_revalidate: Seconds past *ttl* during which the
+                expired result is still served while it is refreshed in
+                the background. ``0`` disables it.
+            clock: Monotonic time source, in seconds.
+        """
+        self._lock = _threading.Lock()
+        # key -> (result, expires_at)
+        self._entries: _OrderedDict[_ty.Hashable, tuple[object, float]] = _OrderedDict()
+        self._flights: dict[_ty.Hashable, _Flight] = {}
+        self._tasks: set = set()
+        self._hits = self._misses = self._stale_hits = 0
+        self._coalesced = self._refreshes = self._evictions = 0
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.clock = clock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CommandCacheStats:
+        """Current hit/miss counters and occupancy."""
+        with self._lock:
+            return CommandCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                coalesced=self._coalesced,
+                refreshes=self._refreshes,
+                evictions=self._evictions,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters; runs in progress finish normally."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._stale_hits = 0
+            self._coalesced = self._refreshes = self._evictions = 0
+
+    def load(self, key: _ty.Hashable, run: _ty.Callable[[], T]) -> T:
+        """Return the result cached under *key*, calling *run* only when needed.
+
+        Args:
+            key: Hashable identity of the command run.
+            run: Zero-argument callable running the command and returning
+                its parsed result.
+
+        Returns:
+            A private copy of the (possibly cached) result.
+        """
+        action, payload = self._lookup(key)
+        if action == _HIT:
+            return thaw(payload)
+        if action == _STALE:
+            value, flight = payload
+            if flight is not None:
+                context = _contextvars.copy_context()
+                _threading.Thread(
+                    target=context.run,
+                    args=(self._refresh, key, flight, run),
+                    name="yaconfiglib-command-refresh",
+                    daemon=True,
+                ).start()
+            return thaw(value)
+        if action == _WAIT:
+            return thaw(payload.result())
+        try:
+            value = run()
+        except BaseException as error:
+            self._settle(key, payload, error=error)
+            raise
+        self._settle(key, payload, value)
+        return thaw(value)
+
+    async def aload(
+        self, key: _ty.Hashable, run: _ty.Callable[[], _ty.Awaitable[T]]
+    ) -> T:
+        """Asynchronous :meth:`load`; *run* is a coroutine function.
+
+        Waiting for a run started by another thread or task happens on a
+        worker thread, so the event loop is never blocked.
+        """
+        import asyncio
+
+        action, payload = self._lookup(key)
+        if action == _HIT:
+            return thaw(payload)
+        if action == _STALE:
+            value, flight = payload
+            if flight is not None:
+                task = asyncio.ensure_future(self._arefresh(key, flight, run))
+                # Keep a reference: the event loop only holds tasks weakly.
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return thaw(value)
+        if action == _WAIT:
+            return thaw(await asyncio.to_thread(payload.result))
+        try:
+            value = await run()
+        except BaseException as error:
+            self._settle(key, payload, error=error)
+            raise
+        self._settle(key, payload, value)
+        return thaw(value)
+
+    def _lookup(self, key: _ty.Hashable) -> tuple[int, object]:
+        """Classify a lookup of *key*, registering a run when one is needed."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if now < expires:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return _HIT, value
+                if now < expires + self.stale_while_revalidate:
+                    self._entries.move_to_end(key)
+                    self._stale_hits += 1
+                    if key in self._flights:
+                        return _STALE, (value, None)
+                    flight = self._flights[key] = _Flight()
+                    self._refreshes += 1
+                    return _STALE, (value, flight)
+                del self._entries[key]
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._coalesced += 1
+                return _WAIT, flight
+            flight = self._flights[key] = _Flight()
+            self._misses += 1
+            return _RUN, flight
+
+    def _settle(
+        self,
+        key: _ty.Hashable,
+        flight: _Flight,
+        value: object = None,
+        error: BaseException = None,
+    ) -> None:
+        """Record the outcome of *flight* and wake everything waiting on it."""
+        with self._lock:
+            if error is None:
+                self._entries[key] = (value, self.clock() + self.ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.value, flight.error = value, error
+        flight.done.set()
+
+    def _refresh(
+        self, key: _ty.Hashable, flight: _Flight, run: _ty.Callable[[], object]
+    ) -> None:
+        try:
+            value = run()
+        except Exception as error:  # noqa: BLE001 - the stale value stays served
+            logger.warning("refreshing cached command result failed: %s", error)
+            self._settle(key, flight, error=error)
+        else:
+            self._settle(key, flight, value)
+
+    async def _arefresh(
+        self,
+        key: _ty.Hashable,
+        flight: _Flight,
+        run: _ty.Callable[[], _ty.Awaitable[object]],
+    ) -> None:
+        try:
+            value = await run()
+        except BaseException as error:
+            if isinstance(error, Exception):
+                logger.warning("refreshing cached command result failed: %s", error)
+            self._settle(key, flight, error=error)
+            if not isinstance(error, Exception):
+                raise
+        else:
+            self._settle(key, flight, value)
+
+
+#: Process-wide cache used by ``ConfigLoader(command_cache=True)``.
+DEFAULT_COMMAND_CACHE = CommandCache()
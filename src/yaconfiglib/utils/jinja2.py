@@ -7,12 +7,15 @@ within configuration data structures (strings, mappings, sequences).
 
 from __future__ import annotations
 
+import hashlib as _hashlib
 import logging
+import os as _os
 import typing as _ty
 import weakref as _weakref
 from collections import OrderedDict as _OrderedDict
 
-from jinja2 import Environment, Template
+from jinja2 import Environment, Template, meta as _meta, nodes as _nodes
+from jinja2.bccache import BytecodeCache, FileSystemBytecodeCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,68 @@ DEFAULT_ENV = Environment(extensions=["jinja2.ext.do"])
 
 #: A string with none of Jinja's delimiters cannot be a template.
 _JINJA_MARKERS = ("{{", "{%", "{#")
+#: Types interpolation always passes through unchanged.
+_PLAIN_TYPES = frozenset((int, float, bool, type(None), bytes))
+
+
+#: Process-wide bytecode cache (see :func:`set_bytecode_cache`).
+BYTECODE_CACHE: BytecodeCache | None = None
+
+
+def set_bytecode_cache(
+    cache: str | _os.PathLike | BytecodeCache | None,
+) -> BytecodeCache | None:
+    """Share compiled templates through *cache*, e.g. across prefork workers.
+
+    Every template yaconfiglib compiles (interpolated values, ``transform``
+    and ``%`` key-factory expressions, ``.j2`` sources) is then looked up in
+    the cache by a hash of its source and of the environment's syntax
+    settings before being compiled, and stored there after. Environments
+    with their own ``bytecode_cache`` keep using it.
+
+    Args:
+        cache: A directory for a
+            :class:`~jinja2.FileSystemBytecodeCache` (created if missing;
+            writes are atomic, so processes can share it), any
+            :class:`~jinja2.BytecodeCache`, or ``None`` to turn caching off.
+            Bytecode is executed as loaded, so only point this at a
+            directory writable by trusted users.
+
+    Returns:
+        The cache now in use.
+    """
+    global BYTECODE_CACHE
+    if cache is not None and not isinstance(cache, BytecodeCache):
+        _os.makedirs(cache, exist_ok=True)
+        cache = FileSystemBytecodeCache(_os.fspath(cache))
+    BYTECODE_CACHE = cache
+    return cache
+
+
+def _bytecode_key(
+    env: Environment, source: str, name: str | None, filename: str | None
+) -> str:
+    # Jinja keys buckets by template name only; string templates have none,
+    # and environments with other delimiters or extensions compile the same
+    # source differently, so both go into the key.
+    syntax = (
+        type(env).__qualname__,
+        env.block_start_string,
+        env.block_end_string,
+        env.variable_start_string,
+        env.variable_end_string,
+        env.comment_start_string,
+        env.comment_end_string,
+        env.line_statement_prefix,
+        env.line_comment_prefix,
+        env.trim_blocks,
+        env.lstrip_blocks,
+        env.newline_sequence,
+        env.keep_trailing_newline,
+        tuple(sorted(env.extensions)),
+    )
+    digest = _hashlib.sha256(repr((syntax, name, filename, source)).encode("utf-8"))
+    return "yaconfiglib:" + digest.hexdigest()
 
 
 def load_template(
@@ -29,9 +94,26 @@ def load_template(
     environment: Environment | None = None,
     globals: _ty.MutableMapping | None = None,
 ) -> Template:
-    """Compile *source* into a :class:`~jinja2.Template`."""
+    """Compile *source* into a :class:`~jinja2.Template`.
+
+    Goes through the environment's ``bytecode_cache``, or else
+    :data:`BYTECODE_CACHE`, when one is set.
+    """
     env = environment or DEFAULT_ENV
-    code = env.compile(source, name, filename)
+    bcc = env.bytecode_cache or BYTECODE_CACHE
+    if bcc is None:
+        code = env.compile(source, name, filename)
+    else:
+        key = _bytecode_key(env, source, name, filename)
+        bucket = bcc.get_bucket(env, key, None, source)
+        code = bucket.code
+        if code is None:
+            code = bucket.code = env.compile(source, name, filename)
+            try:
+                bcc.set_bucket(bucket)
+            except OSError as error:
+                # The cache only saves time; a full disk must not fail a load.
+                logger.debug("could not store template bytecode: %s", error)
     return Template.from_code(env, code, env.make_globals(globals))
 
 
@@ -42,6 +124,20 @@ _CACHE_MAX = 1024
 # whole cache at capacity (the old dict did, causing recompile stampedes).
 _COMPILE_CACHE: "_OrderedDict[tuple, tuple]" = _OrderedDict()
 _EVAL_CACHE: "_OrderedDict[tuple, tuple]" = _OrderedDict()
+_REFS_CACHE: "_OrderedDict[tuple, tuple]" = _OrderedDict()
+
+
+class InterpolationCycleError(ValueError):
+    """Raised when templated values reference each other in a cycle.
+
+    Attributes:
+        cycle: The config paths on the cycle, starting and ending with the
+            same path (e.g. ``["a", "b", "a"]``).
+    """
+
+    def __init__(self, cycle: list[str]) -> None:
+        self.cycle = cycle
+        super().__init__("Interpolation cycle: " + " -> ".join(cycle))
 
 
 def _cache_get(cache: _OrderedDict, code: str, env: Environment):
@@ -127,8 +223,102 @@ def eval(
     return _eval
 
 
+def _is_template(text: str) -> bool:
+    return "{" in text and any(marker in text for marker in _JINJA_MARKERS)
+
+
+def _template_index(data: object, index: dict) -> bool:
+    """Record in *index* every container of *data* that interpolation must visit.
+
+    Returns whether *data* itself must be visited. A mutable mapping or
+    sequence is recorded (``id -> (container, rekey)``) only if some
+    descendant key or value is a template, or is a container interpolation
+    would convert (an immutable mapping or a non-list iterable); *rekey*
+    says whether any of a mapping's keys needs interpolating. Everything
+    left out renders to itself and is skipped.
+    """
+    if type(data) in _PLAIN_TYPES:
+        return False
+    if isinstance(data, str):
+        return _is_template(data)
+    if isinstance(data, _ty.MutableMapping):
+        rekey = found = False
+        for key, value in data.items():
+            # Plain str keys and values are by far the most common: test them
+            # inline rather than through a call.
+            if (
+                ("{" in key and _is_template(key))
+                if type(key) is str
+                else _template_index(key, index)
+            ):
+                rekey = found = True
+            if (
+                ("{" in value and _is_template(value))
+                if type(value) is str
+                else _template_index(value, index)
+            ):
+                found = True
+        if found:
+            index[id(data)] = (data, rekey)
+        return found
+    if isinstance(data, _ty.MutableSequence):
+        found = False
+        for value in data:
+            if _template_index(value, index):
+                found = True
+        if found:
+            index[id(data)] = (data, False)
+        return found
+    # Converted to a dict/list by interpolation, so always visited.
+    return isinstance(data, (_ty.Mapping, _ty.Iterable)) and not isinstance(data, bytes)
+
+
+def references(code: str, environment: Environment | None = None) -> tuple[tuple, ...]:
+    """Return the variable paths template *code* reads, e.g. ``(("db", "host"),)``.
+
+    A path is a free variable name followed by the constant attribute names
+    and subscripts applied to it (``db.host``, ``servers[0]``); a dynamic
+    subscript ends the path at the object it is applied to. Names bound
+    inside the template (``{% set %}``, loop variables) are left out.
+    """
+    env = environment or DEFAULT_ENV
+    cached = _cache_get(_REFS_CACHE, code, env)
+    if cached is not None:
+        return cached
+    ast = env.parse(code)
+    free = _meta.find_undeclared_variables(ast)
+    found: dict = {}
+    pending: list = [ast]
+    while pending:
+        node = pending.pop()
+        path = _ref_path(node)
+        if path is None:
+            pending.extend(node.iter_child_nodes())
+        elif path[0] in free:
+            found[path] = None
+    refs = tuple(found)
+    _cache_put(_REFS_CACHE, code, env, refs)
+    return refs
+
+
+def _ref_path(node: _nodes.Node) -> tuple | None:
+    if isinstance(node, _nodes.Name):
+        return (node.name,) if node.ctx == "load" else None
+    if isinstance(node, _nodes.Getattr):
+        parent = _ref_path(node.node)
+        return None if parent is None else (*parent, node.attr)
+    if isinstance(node, _nodes.Getitem) and isinstance(node.arg, _nodes.Const):
+        parent = _ref_path(node.node)
+        return None if parent is None else (*parent, node.arg.value)
+    return None
+
+
 def interpolate(
-    data: object, globals: dict | None = None, environment: Environment | None = None
+    data: object,
+    globals: dict | None = None,
+    environment: Environment | None = None,
+    *,
+    ordered: bool = False,
 ) -> object:
     """Recursively interpolate Jinja2 templates within *data*.
 
@@ -138,16 +328,167 @@ def interpolate(
     * **Mappings**: keys and values are interpolated recursively.
     * **Sequences**: each element is interpolated recursively.
 
+    A first read-only pass indexes the containers holding a template
+    anywhere below them; subtrees without one are skipped, and only the
+    entries that change are written back, so the cost follows the number of
+    templates rather than the size of *data*.
+
+    With *ordered*, *data* must be a mutable mapping whose top-level items
+    are in *globals* (as :class:`~yaconfiglib.loader.ConfigLoader` passes
+    them). Each templated value is then rendered once, after every templated
+    value it references (see :func:`references`), so ``"{{ host }}"`` sees
+    ``host`` already rendered. Templated keys are rendered last.
+
+    Raises:
+        InterpolationCycleError: With *ordered*, if templated values
+            reference each other in a cycle.
+
     Returns the interpolated object (may differ in type from *data* for
     pure-expression strings).
     """
     globals = {} if globals is None else globals
+    index: dict = {}
+    if isinstance(data, str) or _template_index(data, index):
+        if ordered and isinstance(data, _ty.MutableMapping):
+            return _interpolate_ordered(data, globals, environment, index)
+        return _interpolate(data, globals, environment, index)
+    return data
 
+
+def _format_path(path: tuple) -> str:
+    text = ""
+    for part in path:
+        text += f"[{part!r}]" if not isinstance(part, str) else f".{part}"
+    return text.lstrip(".")
+
+
+def _template_strings(value: object) -> _ty.Iterator[str]:
+    """Yield the templated strings anywhere inside *value*."""
+    if isinstance(value, str):
+        if _is_template(value):
+            yield value
+    elif isinstance(value, _ty.Mapping):
+        for key, item in value.items():
+            yield from _template_strings(key)
+            yield from _template_strings(item)
+    elif isinstance(value, _ty.Iterable) and not isinstance(value, bytes):
+        for item in value:
+            yield from _template_strings(item)
+
+
+def _interpolate_ordered(
+    data: _ty.MutableMapping,
+    globals: dict,
+    environment: Environment | None,
+    index: dict,
+) -> _ty.MutableMapping:
+    """Render the templated values of *data* in dependency order (see :func:`interpolate`)."""
+    # Sites: each templated value, or each container interpolation converts,
+    # as (path, container, key, value), at the first path that reaches it.
+    sites: dict[tuple, tuple] = {}
+    rekeyed: list = []
+    seen: set = set()
+    pending = [((), data)]
+    while pending:
+        path, container = pending.pop()
+        if id(container) in seen:
+            continue
+        seen.add(id(container))
+        if isinstance(container, _ty.MutableMapping):
+            if index[id(container)][1]:
+                rekeyed.append(container)
+            items = container.items()
+        else:
+            items = enumerate(container)
+        children = []
+        for key, value in items:
+            if isinstance(value, str):
+                if _is_template(value):
+                    sites[(id(container), key)] = (path + (key,), container, key, value)
+            elif id(value) in index:
+                children.append((path + (key,), value))
+            elif type(value) not in _PLAIN_TYPES and _template_index(value, {}):
+                sites[(id(container), key)] = (path + (key,), container, key, value)
+        pending.extend(reversed(children))
+
+    # A trie of site paths: node = [sites here, children by path component].
+    trie: list = [[], {}]
+    order = list(sites.values())
+    for number, (path, *_rest) in enumerate(order):
+        node = trie
+        for part in path:
+            node = node[1].setdefault(part, [[], {}])
+        node[0].append(number)
+
+    def dependencies(number: int) -> list[int]:
+        value = order[number][3]
+        codes = [value] if isinstance(value, str) else _template_strings(value)
+        found: list[int] = []
+        for code in codes:
+            for ref in references(code, environment):
+                name = ref[0]
+                if name not in data or globals.get(name, data) is not data[name]:
+                    continue  # shadowed by another global, e.g. env
+                node = trie
+                for part in ref:
+                    node = node[1].get(part)
+                    if node is None:
+                        break
+                    found.extend(node[0])
+                else:
+                    # Every site below the referenced path.
+                    below = list(node[1].values())
+                    while below:
+                        child = below.pop()
+                        found.extend(child[0])
+                        below.extend(child[1].values())
+        return [dep for dep in found if dep != number]
+
+    # Depth-first topological order; a grey site met again closes a cycle.
+    state: dict[int, int] = {}  # 1 = in progress, 2 = rendered
+    for start in range(len(order)):
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(dependencies(start)))]
+        while stack:
+            number, deps = stack[-1]
+            for dep in deps:
+                if dep not in state:
+                    state[dep] = 1
+                    stack.append((dep, iter(dependencies(dep))))
+                    break
+                if state[dep] == 1:
+                    chain = [entry[0] for entry in stack]
+                    chain = chain[chain.index(dep) :] + [dep]
+                    raise InterpolationCycleError(
+                        [_format_path(order[n][0]) for n in chain]
+                    )
+            else:
+                stack.pop()
+                state[number] = 2
+                path, container, key, value = order[number]
+                new = _interpolate(value, globals, environment, None)
+                container[key] = new
+                if len(path) == 1 and globals.get(key, data) is value:
+                    globals[key] = new
+
+    for container in rekeyed:
+        for key in list(container.keys()):
+            value = container.pop(key)
+            container[_interpolate(key, globals, environment, None)] = value
+    return data
+
+
+def _interpolate(
+    data: object, globals: dict, environment: Environment | None, index: dict | None
+) -> object:
+    """Interpolate *data*, visiting only containers in *index* (all if ``None``)."""
     if isinstance(data, str):
         # Fast path: a string with no Jinja delimiter renders to itself, so
         # skip the cache lookup + Template.render entirely. Most config strings
         # are plain text — this avoids paying Jinja for every one of them.
-        if not any(marker in data for marker in _JINJA_MARKERS):
+        if not _is_template(data):
             return data
         stripped = data.strip()
         # Pure Jinja2 expression: {{ expr }} — evaluate to preserve type.
@@ -164,18 +505,34 @@ def interpolate(
 
     if isinstance(data, _ty.Mapping):
         if not isinstance(data, _ty.MutableMapping):
-            data = dict(data)
+            data, index = dict(data), None
+        elif index is not None:
+            entry = index.get(id(data))
+            if entry is None:
+                return data
+            if not entry[1]:
+                # No key changes: rewrite just the values that render differently.
+                for key, value in data.items():
+                    new = _interpolate(value, globals, environment, index)
+                    if new is not value:
+                        data[key] = new
+                return data
+        # Keys may change: pop and re-insert every key to keep their order.
         for key in list(data.keys()):
             value = data.pop(key)
-            new_key = interpolate(key, globals, environment=environment)
-            data[new_key] = interpolate(value, globals, environment=environment)
+            new_key = _interpolate(key, globals, environment, index)
+            data[new_key] = _interpolate(value, globals, environment, index)
         return data
 
     if isinstance(data, _ty.Iterable) and not isinstance(data, (str, bytes)):
         if not isinstance(data, _ty.MutableSequence):
-            data = list(data)
+            data, index = list(data), None
+        elif index is not None and id(data) not in index:
+            return data
         for idx, value in enumerate(data):
-            data[idx] = interpolate(value, globals, environment=environment)
+            new = _interpolate(value, globals, environment, index)
+            if new is not value:
+                data[idx] = new
         return data
 
     return data
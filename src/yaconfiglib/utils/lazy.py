@@ -0,0 +1,165 @@
+"""
+Lazily merged, read-only views over layered configuration documents.
+
+:class:`LazyMergeView` behaves like the mapping an eager
+:class:`~yaconfiglib.utils.merge.MergeMethod` fold over its layers would
+produce, but resolves each key only when it is first read — a deep
+:class:`~collections.ChainMap` with merge semantics. Nested mappings become
+nested views, so a key that is never read is never merged.
+"""
+
+from __future__ import annotations
+
+import itertools as _itertools
+import typing as _ty
+
+from .cache import thaw as _thaw
+from .merge import MergeMethod
+
+__all__ = ["LazyMergeView", "LAZY_MERGE_METHODS"]
+
+#: Names of the merge methods a :class:`LazyMergeView` can reproduce.
+LAZY_MERGE_METHODS = frozenset(("Simple", "Deep", "Substitute"))
+
+_MISSING = object()
+
+
+class LazyMergeView(_ty.Mapping):
+    """A read-only mapping that merges its *layers* key by key on first access.
+
+    Reading ``view[key]`` gives the value ``merge`` would have produced for
+    *key* when folding the layers in order: ``Simple`` takes the value from
+    the last layer defining the key; ``Deep`` and ``Substitute`` return a
+    nested view when every layer's value for the key is a mapping (or
+    ``None``), and otherwise fold the values eagerly like the eager merge,
+    but without mutating the layers. Resolved values are memoized, so each
+    subtree is merged at most once.
+
+    Values are shared with the layers, so treat them as read-only; call
+    :meth:`materialize` for an independent plain ``dict``. Keys are also
+    reachable as attributes (``view.server.port``) and through dotted
+    :meth:`get` lookups, like :class:`~yaconfiglib.loader.DotAccessibleDict`.
+
+    Args:
+        layers: The documents to merge, lowest precedence first. ``None``
+            layers are skipped, as the eager merge does.
+        merge: A ``Simple``, ``Deep`` or ``Substitute``
+            :class:`~yaconfiglib.utils.merge.MergeMethod` (or the matching
+            ``ConfigLoaderMergeMethod`` member).
+        **options: Merge options (e.g. ``mergelists=True``) used for values
+            that have to be folded eagerly.
+
+    Raises:
+        ValueError: If *merge* is not one of the supported methods.
+        TypeError: If a layer is not a mapping.
+    """
+
+    __slots__ = ("_layers", "_merge", "_options", "_resolved", "_keys")
+
+    def __init__(
+        self,
+        layers: _ty.Iterable[_ty.Mapping | None],
+        merge: MergeMethod = MergeMethod.Deep,
+        **options,
+    ) -> None:
+        if getattr(merge, "name", None) not in LAZY_MERGE_METHODS:
+            raise ValueError(
+                f"lazy merging supports {sorted(LAZY_MERGE_METHODS)}, not {merge!r}"
+            )
+        layers = tuple(layer for layer in layers if layer is not None)
+        for layer in layers:
+            if not isinstance(layer, _ty.Mapping):
+                raise TypeError(f"cannot lazily merge a {type(layer).__name__!r} layer")
+        self._layers = layers
+        self._merge = merge
+        self._options = options
+        self._resolved: dict = {}
+        self._keys: dict | None = None
+
+    @property
+    def layers(self) -> tuple[_ty.Mapping, ...]:
+        """The (non-``None``) layers, lowest precedence first."""
+        return self._layers
+
+    def __getitem__(self, key: object) -> object:
+        value = self._resolved.get(key, _MISSING)
+        if value is _MISSING:
+            values = [layer[key] for layer in self._layers if key in layer]
+            if not values:
+                raise KeyError(key)
+            value = self._resolved[key] = self._resolve(values)
+        return value
+
+    def _resolve(self, values: list) -> object:
+        if self._merge.name == "Simple":
+            return values[-1]
+        present = [value for value in values if value is not None]
+        if not present:
+            return None
+        if all(isinstance(value, _ty.Mapping) for value in present):
+            return type(self)(present, self._merge, **self._options)
+        # Mixed types: defer to the real merge, in structural-sharing mode so
+        # the layers are never mutated and unchanged subtrees are not copied.
+        options = {**self._options, "structural_sharing": True}
+        result = values[0]
+        for value in values[1:]:
+            result = self._merge(result, value, **options)
+        return result
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._resolved or any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> _ty.Iterator:
+        if self._keys is None:
+            # First-occurrence order, matching the eager merge's dict order.
+            self._keys = dict.fromkeys(_itertools.chain.from_iterable(self._layers))
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        if self._keys is None:
+            iter(self)
+        return len(self._keys)
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name not in LazyMergeView.__slots__:
+            raise TypeError(f"{type(self).__name__!r} is read-only")
+        object.__setattr__(self, name, value)
+
+    def get(self, key: object, default: object = None, dig: bool = True) -> object:
+        """Return ``self[key]``, or follow a dotted *key* (``"db.credentials.user"``) when *dig* is set."""
+        if key in self:
+            return self[key]
+        if dig and isinstance(key, str) and "." in key:
+            current = self
+            for part in key.split("."):
+                if not isinstance(current, _ty.Mapping) or part not in current:
+                    return default
+                current = current[part]
+                if current is None:
+                    return default
+            return current
+        return default
+
+    def materialize(self) -> dict:
+        """Resolve every key and return the result as an independent plain ``dict``."""
+        return {
+            key: (
+                value.materialize()
+                if isinstance(value, LazyMergeView)
+                else _thaw(value)
+            )
+            for key, value in self.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.materialize()!r})"
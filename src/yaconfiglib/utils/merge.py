@@ -10,6 +10,7 @@ This module provides the :class:`MergeMethod` enum with three built-in strategie
 
 from __future__ import annotations
 
+import copy
 import logging
 import typing
 
@@ -56,8 +57,587 @@ class Merge(typing.Protocol):
     ) -> object: ...
 
 
+# ----------------------------------------------------------------------
+# Merge engine
+#
+# Each strategy is a generator "step" merging one (a, b) pair. Whenever a
+# step needs a nested merge it yields the (a, b) pair instead of recursing,
+# and _run() sends the result back — an explicit stack, so nesting depth is
+# bounded by memory rather than the recursion limit. Scalars are resolved
+# inline without a step, and kinds come from an exact-type table; the ABC
+# checks only run for types outside it.
+#
+# _run() also tracks every pair by identity, so a pair nested inside itself
+# is reported as a cycle. With structural_sharing=True finished pairs are
+# memoized too, so shared subtrees are merged once (and stay shared); an
+# in-place merge can't reuse them, because it mutates a between two merges
+# of the same pair.
+#
+# With structural_sharing=True the steps never mutate a or b: a mapping or
+# list is copied (shallowly) only when one of its entries actually changes,
+# and every untouched subtree of either input is reused by reference.
+# ----------------------------------------------------------------------
+_SCALAR, _MAPPING, _ARRAY, _OTHER = range(4)
+
+_EXACT_KINDS: dict[type, int] = {
+    **dict.fromkeys(_SCALAR_TYPES, _SCALAR),
+    dict: _MAPPING,
+    list: _ARRAY,
+    tuple: _ARRAY,
+}
+
+
+def _kind(obj: object) -> int:
+    kind = _EXACT_KINDS.get(type(obj))
+    if kind is not None:
+        return kind
+    if isinstance(obj, _SCALAR_TYPES):
+        return _SCALAR
+    if isinstance(obj, typing.Mapping):
+        return _MAPPING
+    if is_array(obj):
+        return _ARRAY
+    return _OTHER
+
+
+def _is_scalar(obj: object) -> bool:
+    kind = _EXACT_KINDS.get(type(obj))
+    return kind == _SCALAR if kind is not None else isinstance(obj, _SCALAR_TYPES)
+
+
+def _is_mapping(obj: object) -> bool:
+    kind = _EXACT_KINDS.get(type(obj))
+    return kind == _MAPPING if kind is not None else isinstance(obj, typing.Mapping)
+
+
+def _is_mutable_mapping(obj: object) -> bool:
+    return type(obj) is dict or isinstance(obj, typing.MutableMapping)
+
+
+def _is_mutable_sequence(obj: object) -> bool:
+    return type(obj) is list or isinstance(obj, typing.MutableSequence)
+
+
+def _rebuild_mapping(a: typing.Mapping, target: dict) -> typing.Mapping:
+    try:
+        return type(a)(**target)
+    except TypeError:
+        return target
+
+
+def _update_mapping(a: typing.Mapping, changes: dict) -> typing.Mapping:
+    """Write *changes* into *a* in place, or rebuild *a*'s type around them."""
+    if type(a) is dict:
+        a.update(changes)
+        return a
+    target = dict(a)
+    target.update(changes)
+    if _is_mutable_mapping(a):
+        a.update(target)
+        return a
+    return _rebuild_mapping(a, target)
+
+
+def _share_mapping(a: typing.Mapping, changes: dict) -> typing.Mapping:
+    """Return a shallow copy of *a* with *changes* applied, or *a* itself if there are none."""
+    if not changes:
+        return a
+    if type(a) is dict or _is_mutable_mapping(a):
+        new = a.copy() if type(a) is dict else copy.copy(a)
+        new.update(changes)
+        return new
+    return _rebuild_mapping(a, {**a, **changes})
+
+
+def _unchanged(old: object, new: object) -> bool:
+    """Whether *new* can be left out of a structurally shared result in favor of *old*."""
+    return new is old or (
+        type(new) is type(old) and _EXACT_KINDS.get(type(new)) == _SCALAR and new == old
+    )
+
+
+_IN_PROGRESS = object()
+
+
+def _run(
+    step: typing.Callable,
+    a: object,
+    b: object,
+    mergelists: bool | typing.Callable,
+    sharing: bool,
+    memo: dict | None = None,
+) -> object:
+    """Drive *step* over (a, b) and every nested pair it yields, without recursion.
+
+    *memo* maps ``(id(a), id(b))`` to ``(a, b, result)`` for every pair
+    being merged; a pair met again while it is still being merged is a
+    cycle. With *sharing*, finished pairs stay in *memo*, so a subtree
+    reached through several references (YAML aliases, reused Python
+    objects) is merged once and stays shared in the result. In place, *a*
+    may change before the same pair comes up again, so finished pairs are
+    dropped and merged afresh.
+    """
+    if memo is None:
+        memo = {}
+    key = (id(a), id(b))
+    hit = memo.get(key)
+    if hit is not None:
+        return _memo_result(hit, a, b)
+    memo[key] = (a, b, _IN_PROGRESS)
+    stack = []
+    frame = step(a, b, mergelists, sharing)
+    value = None
+    while True:
+        try:
+            pair = frame.send(value)
+        except StopIteration as done:
+            if sharing:
+                memo[key] = (*memo[key][:2], done.value)
+            else:
+                del memo[key]
+            if not stack:
+                return done.value
+            frame, key = stack.pop()
+            value = done.value
+        else:
+            child = (id(pair[0]), id(pair[1]))
+            hit = memo.get(child)
+            if hit is not None:
+                value = _memo_result(hit, *pair)
+                continue
+            memo[child] = (pair[0], pair[1], _IN_PROGRESS)
+            stack.append((frame, key))
+            frame, key, value = step(pair[0], pair[1], mergelists, sharing), child, None
+
+
+def _memo_result(hit: tuple, a: object, b: object) -> object:
+    result = hit[2]
+    if result is _IN_PROGRESS:
+        raise ValueError(
+            f"Cannot merge cyclic {type(b).__name__!r} into {type(a).__name__!r}:"
+            " the pair is reachable from itself"
+        )
+    return result
+
+
+# Simple merge: scalars and arrays replace; dicts are updated shallowly.
+def _simple_step(a: object, b: object, mergelists: bool, sharing: bool):
+    if b is None:
+        return a
+    kind_b = _kind(b)
+    if kind_b == _SCALAR:
+        return b
+
+    if kind_b == _ARRAY:
+        if _kind(a) == _ARRAY:
+            # Element-by-element replacement up to len(b); b's extra
+            # elements are appended, and a's tail beyond len(b) is kept.
+            # (The comment used to say "truncate extras", which described
+            # neither branch — tests pin the append-and-keep behavior.)
+            result = list(a)
+            changed = len(b) > len(result)
+            for i, v in enumerate(b):
+                if i < len(result):
+                    if v is not None and not _is_scalar(v):
+                        v = yield result[i], v
+                    elif v is None:
+                        v = result[i]
+                    changed = changed or not _unchanged(result[i], v)
+                    result[i] = v
+                else:
+                    result.append(v)
+            if sharing and not changed:
+                return a
+            return type(a)(result) if not isinstance(a, list) else result
+        return b
+
+    if kind_b == _MAPPING:
+        if _is_mapping(a):
+            if _is_mutable_mapping(a):
+                if sharing:
+                    changes = {
+                        k: v
+                        for k, v in b.items()
+                        if k not in a or not _unchanged(a[k], v)
+                    }
+                    return _share_mapping(a, changes)
+                a.update(b)
+                return a
+            return type(a)(**a, **b)
+        return b
+
+    raise TypeError(
+        f"Cannot simple-merge {type(b).__name__!r} into {type(a).__name__!r}"
+    )
+
+
+# Substitute merge: scalars and arrays always replace. Dicts are merged
+# recursively (existing keys recurse; new keys are inserted).
+def _substitute_step(a: object, b: object, mergelists: bool, sharing: bool):
+    if b is None:
+        return a
+
+    # When a is a mapping we always try to merge into it — fall through
+    # to the mapping branches below.  Only replace outright when a is NOT
+    # a mapping (or when b is a scalar/array and a is None).
+    a_is_mapping = _is_mapping(a)
+    kind_b = _kind(b)
+    if not a_is_mapping:
+        if a is None or kind_b == _SCALAR or kind_b == _ARRAY:
+            return b
+
+    if a_is_mapping and kind_b == _MAPPING:
+        changes = {}
+        for k, v in b.items():
+            if k in a:
+                if v is None:
+                    continue
+                current = a[k]
+                # Only a None or non-mapping value meeting a scalar/array is
+                # a plain replacement; everything else needs a full step.
+                if _is_mapping(current) or (
+                    current is not None and _kind(v) not in (_SCALAR, _ARRAY)
+                ):
+                    v = yield current, v
+                if sharing and _unchanged(current, v):
+                    continue
+            changes[k] = v
+        # Preserve the original mapping type where possible.
+        return (_share_mapping if sharing else _update_mapping)(a, changes)
+
+    if a_is_mapping and kind_b == _ARRAY:
+        # Merge each dict element of b into a sequentially.
+        result = a
+        for item in b:
+            if _is_mapping(item):
+                result = yield result, item
+            else:
+                raise TypeError(
+                    f"Cannot merge list element of type {type(item).__name__!r} "
+                    f"into a mapping"
+                )
+        return result
+
+    raise TypeError(
+        f"Cannot substitute-merge {type(b).__name__!r} into {type(a).__name__!r}"
+    )
+
+
+# Deep merge: dicts merged key-by-key recursively. Lists extended with unique
+# scalar/array items; dict elements inside lists are merged by position when
+# mergelists=True, or by key when mergelists is a key function (see
+# _list_mode).
+def _deep_step(a: object, b: object, mergelists: bool, sharing: bool):
+    if b is None:
+        return a
+    if a is None:
+        return b
+    kind_b = _kind(b)
+    if kind_b == _SCALAR:
+        return b
+    kind_a = _kind(a)
+
+    if kind_a == _ARRAY and kind_b == _ARRAY:
+        return (yield from _deep_lists(a, b, mergelists, sharing))
+
+    if kind_a == _MAPPING and kind_b == _MAPPING:
+        changes = {}
+        for k, v in b.items():
+            if k in a:
+                if v is None:
+                    continue
+                current = a[k]
+                if current is not None and not _is_scalar(v):
+                    v = yield current, v
+                if sharing and _unchanged(current, v):
+                    continue
+            changes[k] = v
+        return (_share_mapping if sharing else _update_mapping)(a, changes)
+
+    if kind_a == _MAPPING and kind_b == _ARRAY:
+        result = a
+        for item in b:
+            if _is_mapping(item):
+                result = yield result, item
+            else:
+                raise TypeError(
+                    f"Cannot deep-merge list element of type "
+                    f"{type(item).__name__!r} into a mapping"
+                )
+        return result
+
+    raise TypeError(f"Cannot deep-merge {type(b).__name__!r} into {type(a).__name__!r}")
+
+
+# Tags keeping the frozen keys of lists, tuples and dicts apart (a list never
+# equals a tuple, yet tuple(list) would).
+_LIST_KEY, _TUPLE_KEY, _DICT_KEY = object(), object(), object()
+
+# Below this many elements a linear ``in`` beats building a _ListIndex.
+_INDEX_THRESHOLD = 16
+
+
+def _dedup_key(obj: object) -> typing.Hashable:
+    """Return a hashable key equal to another's exactly when the objects are ``==``.
+
+    Only builtin scalars, lists, tuples and dicts have keys; anything else
+    raises :class:`TypeError`.
+    """
+    kind = type(obj)
+    if kind is list:
+        return _LIST_KEY, tuple(map(_dedup_key, obj))
+    if kind is tuple:
+        return _TUPLE_KEY, tuple(map(_dedup_key, obj))
+    if kind is dict:
+        return _DICT_KEY, frozenset((k, _dedup_key(v)) for k, v in obj.items())
+    if _EXACT_KINDS.get(kind) == _SCALAR:
+        return obj
+    raise TypeError(f"no de-duplication key for {kind.__name__!r}")
+
+
+class _ListIndex:
+    """A growing list answering ``item in self`` like ``item in items`` does.
+
+    Builtin values are found through a set of :func:`_dedup_key` keys.
+    Elements without a key (exotic types, which may define any ``__eq__``)
+    are still compared one by one, and an item without a key falls back to a
+    linear scan of the whole list. Plain dicts are left out of the
+    comparison set: a dict never equals a scalar or an array.
+    """
+
+    __slots__ = ("items", "keys", "others")
+
+    def __init__(self, items: list) -> None:
+        self.items = items
+        self.keys: set = set()
+        self.others: list = []
+        for item in items:
+            self._note(item)
+
+    def _note(self, item: object) -> None:
+        if type(item) is dict:
+            return
+        try:
+            self.keys.add(_dedup_key(item))
+        except (TypeError, RecursionError):
+            self.others.append(item)
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            key = _dedup_key(item)
+        except (TypeError, RecursionError):
+            return item in self.items
+        return key in self.keys or (bool(self.others) and item in self.others)
+
+    def append(self, item: object) -> None:
+        self.items.append(item)
+        self._note(item)
+
+
+def _list_mode(
+    mergelists: bool, merge_key: str | typing.Callable | None
+) -> bool | typing.Callable:
+    """Fold the ``mergelists``/``merge_key`` options into one step argument.
+
+    Returns a key function when *merge_key* is given (it takes precedence),
+    else *mergelists*.
+    """
+    if merge_key is None:
+        return mergelists
+    if callable(merge_key):
+        return merge_key
+
+    def key(item: typing.Mapping) -> object:
+        return item[merge_key] if merge_key in item else None
+
+    return key
+
+
+def _deep_lists(
+    a: typing.Sequence,
+    b: typing.Sequence,
+    mergelists: bool | typing.Callable,
+    sharing: bool,
+):
+    result = list(a)
+    merged = False
+    # Unique-item checks go through a hash index once the lists are large
+    # enough for the O(len(a) * len(b)) scans to matter.
+    seen = _ListIndex(result) if len(result) + len(b) > _INDEX_THRESHOLD else result
+
+    if callable(mergelists):
+        # Keyed: index a's dict elements by key, merge b's matching ones into
+        # them and append the rest in b's order. Later b items with the key of
+        # an appended one merge into it, so each key appears once.
+        index: dict = {}
+        for i, item in enumerate(result):
+            if _is_mapping(item):
+                k = mergelists(item)
+                if k is not None:
+                    index.setdefault(k, i)
+        for item in b:
+            kind = _kind(item)
+            if kind == _MAPPING:
+                k = mergelists(item)
+                if k is not None:
+                    i = index.get(k)
+                    if i is not None:
+                        current = result[i]
+                        result[i] = yield current, item
+                        merged = merged or result[i] is not current
+                        continue
+                    index[k] = len(result)
+                seen.append(item)
+            elif (kind == _SCALAR or kind == _ARRAY) and item not in seen:
+                seen.append(item)
+    elif mergelists:
+        # Collect dict elements from b for potential positional merge.
+        b_dicts: dict[int, typing.Mapping] = {
+            i: item for i, item in enumerate(b) if _is_mapping(item)
+        }
+
+        # Extend with unique non-dict items from b.
+        for item in b:
+            kind = _kind(item)
+            if (kind == _SCALAR or kind == _ARRAY) and item not in seen:
+                seen.append(item)
+
+        # Merge dict elements by position if requested.
+        for i, a_item in enumerate(result):
+            if i in b_dicts and _is_mapping(a_item):
+                # PEEK, do not pop: only a dict that actually merges leaves
+                # b_dicts here. Popping before the overlap check dropped a
+                # non-overlapping positional dict entirely — it was neither
+                # merged nor left for the append loop below (silent data
+                # loss, e.g. Deep([{"k":1}], [{"z":9}], mergelists=True)
+                # returned [{'k': 1}]).
+                b_item = b_dicts[i]
+                # Only merge when at least one key overlaps.
+                if any(k in a_item for k in b_item):
+                    del b_dicts[i]
+                    result[i] = yield a_item, b_item
+                    merged = merged or result[i] is not a_item
+
+        # Append any remaining b dict entries that were not merged.
+        for v in b_dicts.values():
+            result.append(v)
+    else:
+        # Extend unique non-dict items, then append dict items to preserve exact behavior
+        mappings = []
+        for item in b:
+            kind = _kind(item)
+            if kind == _MAPPING:
+                mappings.append(item)
+            elif (kind == _SCALAR or kind == _ARRAY) and item not in seen:
+                seen.append(item)
+        result.extend(mappings)
+
+    if sharing:
+        if not merged and len(result) == len(a):
+            return a
+    elif _is_mutable_sequence(a):
+        a[:] = result
+        return a
+    if type(a) is list:
+        return result
+    try:
+        return type(a)(result)
+    except TypeError:
+        return result
+
+
+_STEPS: dict[str, typing.Callable] = {
+    "Simple": _simple_step,
+    "Deep": _deep_step,
+    "Substitute": _substitute_step,
+}
+
+# Strategies whose dict-into-dict merge treats every key independently, so
+# N documents can be merged key by key (see _merge_many).
+_N_WAY = frozenset(("Deep", "Substitute"))
+
+
+def _fold(merge: Merge, values: typing.Sequence, options: dict) -> object:
+    result = values[0]
+    for value in values[1:]:
+        result = merge(result, value, **options)
+    return result
+
+
+def _merge_many(merge: Merge, docs: list, options: dict, refold: bool = True) -> object:
+    """Merge *docs* as a pairwise fold with *merge* would, visiting each key once.
+
+    Wherever every non-``None`` value at a path is a plain ``dict``, the
+    values are merged N-way: keys are gathered in first-occurrence order and
+    each key's values are merged together. Any other combination (lists,
+    scalars, mixed or exotic types) is folded pairwise, which defines the
+    result in the first place.
+
+    Those partial folds share structure rather than mutate, so if one fails
+    the documents are intact. With *refold* the whole pairwise fold is then
+    rerun — it raises the same error, for the same key, as a plain fold
+    would; without it the walk's error propagates as is.
+    """
+    walk_options = {**options, "structural_sharing": True}
+    # A caller's memo may hold in-place results; the walk's folds share.
+    walk_options.pop("memo", None)
+    if not refold:
+        return _merge_many_walk(merge, docs, walk_options)
+    try:
+        return _merge_many_walk(merge, docs, walk_options)
+    except Exception:  # noqa: BLE001 - re-raised by the fold below
+        return _fold(merge, docs, options)
+
+
+def _merge_many_walk(merge: Merge, docs: list, options: dict) -> object:
+    root: dict = {}
+    pending = [(root, None, docs)]
+    while pending:
+        parent, key, values = pending.pop()
+        present = [value for value in values if value is not None]
+        if len(present) < 2:
+            parent[key] = present[0] if present else values[0]
+        elif all(_EXACT_KINDS.get(type(value)) == _SCALAR for value in present):
+            parent[key] = present[-1]
+        elif all(type(value) is dict for value in present):
+            grouped: dict = {}
+            for value in present:
+                for k, v in value.items():
+                    group = grouped.get(k)
+                    if group is None:
+                        grouped[k] = [v]
+                    else:
+                        group.append(v)
+            parent[key] = merged = {}
+            for k, group in grouped.items():
+                if len(group) == 1 and group[0] is not None:
+                    merged[k] = group[0]
+                else:
+                    merged[k] = None
+                    pending.append((merged, k, group))
+        else:
+            parent[key] = _fold(merge, values, options)
+    return root[None]
+
+
 class MergeMethod(IntEnum):
-    """Built-in merge strategies."""
+    """Built-in merge strategies.
+
+    Members are called as ``method(a, b, **options)`` and return the merged
+    value. By default *a* is updated in place where it is mutable. Options:
+
+    * ``mergelists`` (``Deep`` only) — merge dict elements of lists by
+      position when they share a key.
+    * ``merge_key`` (``Deep`` only) — a key name, or a callable returning a
+      hashable key (``None`` for none), to merge dict elements of lists by
+      instead: each element of *b* is merged into the element of *a* with
+      the same key, or appended. Takes precedence over ``mergelists``.
+    * ``structural_sharing`` — never mutate *a* or *b*. Only the containers
+      on changed paths are copied (shallowly); every unchanged subtree of
+      either input is reused by reference, so a merge costs O(changed keys)
+      rather than O(size). The result shares structure with the inputs, so
+      treat all three as read-only.
+    """
 
     Simple = 1
     Deep = 2
@@ -71,116 +651,43 @@ class MergeMethod(IntEnum):
         memo: dict | None = None,
         **options,
     ):
-        method: Merge = getattr(self, f"_{self.name.lower()}")
+        step = _STEPS.get(self._name_)
+        if step is not None:
+            return _run(
+                step,
+                a,
+                b,
+                _list_mode(options.get("mergelists", False), options.get("merge_key")),
+                options.get("structural_sharing", False),
+                memo,
+            )
+        method: Merge = getattr(self, f"_{self._name_.lower()}")
         return method(a, b, memo=memo, **options)
 
-    # ------------------------------------------------------------------
-    # Simple merge
-    # Scalars and arrays replace; dicts are updated shallowly.
-    # ------------------------------------------------------------------
     def _simple(
         self,
         a: object,
         b: object,
         *,
         memo: dict | None = None,
+        structural_sharing: bool = False,
         **options,
     ):
-        if b is None:
-            return a
-
-        if is_scalar(b):
-            return b
-
-        if is_array(b):
-            if is_array(a):
-                # Element-by-element replacement up to len(b); b's extra
-                # elements are appended, and a's tail beyond len(b) is kept.
-                # (The comment used to say "truncate extras", which described
-                # neither branch — tests pin the append-and-keep behavior.)
-                result = list(a)
-                for i, v in enumerate(b):
-                    if i < len(result):
-                        result[i] = self._simple(result[i], v, memo=memo, **options)
-                    else:
-                        result.append(v)
-                return type(a)(result) if not isinstance(a, list) else result
-            return b
+        """Simple merge: scalars and arrays replace; dicts are updated shallowly."""
+        return _run(_simple_step, a, b, False, structural_sharing, memo)
 
-        if isinstance(b, typing.Mapping):
-            if isinstance(a, typing.Mapping):
-                if isinstance(a, typing.MutableMapping):
-                    a.update(b)
-                    return a
-                return type(a)(**a, **b)
-            return b
-
-        raise TypeError(
-            f"Cannot simple-merge {type(b).__name__!r} into {type(a).__name__!r}"
-        )
-
-    # ------------------------------------------------------------------
-    # Substitute merge
-    # Scalars and arrays always replace.  Dicts are merged recursively
-    # (existing keys recurse; new keys are inserted).
-    # ------------------------------------------------------------------
     def _substitute(
         self,
         a: object,
         b: object,
         *,
         memo: dict | None = None,
+        structural_sharing: bool = False,
         **options,
     ):
-        if b is None:
-            return a
-
-        # When a is a mapping we always try to merge into it — fall through
-        # to the mapping branches below.  Only replace outright when a is NOT
-        # a mapping (or when b is a scalar/array and a is None).
-        if not isinstance(a, typing.Mapping):
-            if a is None or is_scalar(b) or is_array(b):
-                return b
-
-        if isinstance(a, typing.Mapping) and isinstance(b, typing.Mapping):
-            target = dict(a)
-            for k, v in b.items():
-                if k in target:
-                    target[k] = self._substitute(target[k], v, memo=memo, **options)
-                else:
-                    target[k] = v
-            # Preserve the original mapping type where possible.
-            if isinstance(a, typing.MutableMapping):
-                a.update(target)
-                return a
-            try:
-                return type(a)(**target)
-            except TypeError:
-                return target
-
-        if isinstance(a, typing.Mapping) and is_array(b):
-            # Merge each dict element of b into a sequentially.
-            result = a
-            for item in b:
-                if isinstance(item, typing.Mapping):
-                    result = self._substitute(result, item, memo=memo, **options)
-                else:
-                    raise TypeError(
-                        f"Cannot merge list element of type {type(item).__name__!r} "
-                        f"into a mapping"
-                    )
-            return result
-
-        raise TypeError(
-            f"Cannot substitute-merge {type(b).__name__!r} into {type(a).__name__!r}"
-        )
+        """Substitute merge: arrays replace; dicts are merged recursively."""
+        return _run(_substitute_step, a, b, False, structural_sharing, memo)
 
-    # ------------------------------------------------------------------
-    # Deep merge
-    # Dicts merged key-by-key recursively.  Lists extended with unique
-    # scalar/array items; dict elements inside lists are merged by
-    # position when mergelists=True.
-    # ------------------------------------------------------------------
     def _deep(
         self,
         a: object,
@@ -188,122 +695,54 @@ class MergeMethod(IntEnum):
         *,
         memo: dict | None = None,
         mergelists: bool = False,
+        merge_key: str | typing.Callable | None = None,
+        structural_sharing: bool = False,
         **options,
     ):
-        if b is None:
-            return a
-
-        if a is None or is_scalar(b):
-            return b
-
-        if is_array(a) and is_array(b):
-            return self._deep_lists(a, b, memo=memo, mergelists=mergelists, **options)
-
-        if isinstance(a, typing.Mapping) and isinstance(b, typing.Mapping):
-            return self._deep_dicts(a, b, memo=memo, mergelists=mergelists, **options)
-
-        if isinstance(a, typing.Mapping) and is_array(b):
-            result = a
-            for item in b:
-                if isinstance(item, typing.Mapping):
-                    result = self._deep(
-                        result, item, memo=memo, mergelists=mergelists, **options
-                    )
-                else:
-                    raise TypeError(
-                        f"Cannot deep-merge list element of type "
-                        f"{type(item).__name__!r} into a mapping"
-                    )
-            return result
-
-        raise TypeError(
-            f"Cannot deep-merge {type(b).__name__!r} into {type(a).__name__!r}"
+        """Deep merge: dicts merged recursively, lists extended with unique items."""
+        return _run(
+            _deep_step,
+            a,
+            b,
+            _list_mode(mergelists, merge_key),
+            structural_sharing,
+            memo,
         )
 
-    def _deep_dicts(
-        self,
-        a: typing.Mapping,
-        b: typing.Mapping,
-        *,
-        memo: dict | None,
-        mergelists: bool,
-        **options,
-    ) -> typing.Mapping:
-        target = dict(a)
-        for k, v in b.items():
-            if k in target:
-                target[k] = self._deep(
-                    target[k], v, memo=memo, mergelists=mergelists, **options
-                )
-            else:
-                target[k] = v
-        if isinstance(a, typing.MutableMapping):
-            a.update(target)
-            return a
-        try:
-            return type(a)(**target)
-        except TypeError:
-            return target
-
-    def _deep_lists(
-        self,
-        a: typing.Sequence,
-        b: typing.Sequence,
-        *,
-        memo: dict | None,
-        mergelists: bool,
-        **options,
-    ) -> typing.Sequence:
-        result = list(a)
-
-        if mergelists:
-            # Collect dict elements from b for potential positional merge.
-            b_dicts: dict[int, typing.Mapping] = {
-                i: item for i, item in enumerate(b) if isinstance(item, typing.Mapping)
-            }
-
-            # Extend with unique non-dict items from b.
-            for item in b:
-                if (is_scalar(item) or is_array(item)) and item not in result:
-                    result.append(item)
-
-            # Merge dict elements by position if requested.
-            for i, a_item in enumerate(result):
-                if isinstance(a_item, typing.Mapping) and i in b_dicts:
-                    # PEEK, do not pop: only a dict that actually merges leaves
-                    # b_dicts here. Popping before the overlap check dropped a
-                    # non-overlapping positional dict entirely — it was neither
-                    # merged nor left for the append loop below (silent data
-                    # loss, e.g. Deep([{"k":1}], [{"z":9}], mergelists=True)
-                    # returned [{'k': 1}]).
-                    b_item = b_dicts[i]
-                    # Only merge when at least one key overlaps.
-                    if any(k in a_item for k in b_item):
-                        del b_dicts[i]
-                        result[i] = self._deep(
-                            a_item, b_item, memo=memo, mergelists=mergelists, **options
-                        )
-
-            # Append any remaining b dict entries that were not merged.
-            for v in b_dicts.values():
-                result.append(v)
-        else:
-            # Fast path: extend unique non-dict items, then append dict items to preserve exact behavior
-            for item in b:
-                if not isinstance(item, typing.Mapping):
-                    if (is_scalar(item) or is_array(item)) and item not in result:
-                        result.append(item)
-            for item in b:
-                if isinstance(item, typing.Mapping):
-                    result.append(item)
-
-        if isinstance(a, typing.MutableSequence):
-            a[:] = result
-            return a
-        try:
-            return type(a)(result)
-        except TypeError:
-            return result
+    def merge_many(
+        self, docs: typing.Iterable, *, refold: bool = True, **options
+    ) -> object:
+        """Merge *docs* in order, in a single pass where possible.
+
+        Returns what folding the documents pairwise would, i.e.
+        ``method(method(docs[0], docs[1], **options), docs[2], **options)``
+        and so on. ``Deep`` and ``Substitute`` walk all the documents
+        together key by key instead, so each key's final value is computed
+        once rather than being revisited by every later merge. Other
+        strategies fold pairwise.
+
+        Like the pairwise fold, this may update the documents in place unless
+        ``structural_sharing=True`` is passed. Containers built by the N-way
+        walk are always new.
+
+        Args:
+            docs: The documents to merge, lowest precedence first.
+            refold: If the N-way walk fails, rerun the pairwise fold so the
+                error is the one a plain fold raises. Pass False when the
+                caller replays the documents itself on failure (as
+                :class:`~yaconfiglib.loader.ConfigLoader` does), so a failing
+                merge is not run a third time.
+            **options: Merge options, as for a pairwise call.
+
+        Returns:
+            The merged document, or ``None`` if *docs* is empty.
+        """
+        docs = list(docs)
+        if not docs:
+            return None
+        if self._name_ in _N_WAY:
+            return _merge_many(self, docs, options, refold)
+        return _fold(self, docs, options)
 
 
 from .typing_merge import (
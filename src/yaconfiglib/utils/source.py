@@ -4,81 +4,146 @@ Turns the heterogeneous inputs a caller can pass to ``load()`` — file
 paths, glob patterns, command URIs, open streams, in-memory ``#!``-marked
 strings, and arbitrarily nested iterables of these — into a flat stream of
 concrete :class:`~pathlib.Path`-like objects ready for a backend to read.
+In-memory content becomes a :class:`MemorySource`, which the loader hands
+straight to :meth:`ConfigBackend.loads
+<yaconfiglib.backends.base.ConfigBackend.loads>` instead of a file.
 """
 
 from __future__ import annotations
 
-import atexit as _atexit
 import io as _io
 import itertools as _itertools
 import logging
 import os as _os
+import pathlib as _pathlib
+import sys as _sys
 import typing as _ty
 import glob as _glob
-import tempfile as _tempfile
 import re as _re
 
 try:
     from pathlib_next import Path, Pathname
-    from pathlib_next.mempath import MemPath
 
     HAS_PATHLIB_NEXT = True
 except ImportError:
     from pathlib import Path
 
     Pathname = Path  # fallback
-    MemPath = None  # fallback
     HAS_PATHLIB_NEXT = False
 
 logger = logging.getLogger(__name__)
 
-SourceLike = _ty.Union[str, _ty.Any, _io.IOBase, bytes]
+SourceLike = _ty.Union[str, _ty.Any, _io.IOBase, bytes, bytearray, memoryview]
+
+#: Anything :meth:`ConfigBackend.loads` accepts as a document's content.
+TextLike = _ty.Union[str, bytes, bytearray, memoryview]
 
 _CMD_REGEX = _re.compile(
-    r"^(exec|cmd|sh|exec\+\w+|cmd\+\w+)(://|:\\|:/|:)", _re.IGNORECASE
+    r"^(exec|cmd|sh|coproc|exec\+\w+|cmd\+\w+|coproc\+\w+)(://|:\\|:/|:)",
+    _re.IGNORECASE,
 )
 
 #: Monotonic counter giving every stream / unnamed in-memory source a unique
-#: virtual name. Without it every stream materialized to the SAME
-#: ``MemPath("stream")``, so callers that resolved sources up front
+#: virtual name. Without it every stream shared the SAME virtual path
+#: (``MemPath("stream")`` at the time), so callers that resolved sources up front
 #: (``list(parse_sources(...))``) saw every path holding the LAST stream's
 #: content.
 _SOURCE_COUNTER = _itertools.count()
 
-# Temp files created by the no-pathlib_next fallback (delete=False so the
-# backend can re-open them). Best-effort removal at interpreter exit — they
-# previously leaked one file per materialized source.
-_TEMP_SOURCES: list[str] = []
+# PurePath only gained an __init__ taking the path segments in Python 3.12.
+_PURE_PATH_INIT = _sys.version_info >= (3, 12)
 
 
-def _cleanup_temp_sources() -> None:
-    for name in _TEMP_SOURCES:
-        try:
-            _os.unlink(name)
-        except OSError:
-            pass
+class MemorySource(_pathlib.PurePosixPath):
+    """An in-memory document: a virtual filename plus the content to parse.
+
+    Behaves like a pure path for everything that only looks at the name
+    (backend detection, key factories, ``transform``'s ``pathname``), while
+    :attr:`data` keeps the content exactly as given — a ``str``, ``bytes``,
+    ``bytearray`` or ``memoryview`` is never copied into a file.
+    :class:`~yaconfiglib.loader.ConfigLoader` parses it with
+    :meth:`ConfigBackend.loads <yaconfiglib.backends.base.ConfigBackend.loads>`;
+    :meth:`read_text`/:meth:`read_bytes`, :meth:`open` and :meth:`exists`
+    serve backends that only implement ``load()`` and read their path the way
+    they would read a file (the ``MemPath`` these sources replaced supported
+    the same calls).
+
+    Attributes:
+        data: The document's content.
+        encoding: Codec for decoding :attr:`data` when it is binary, or
+            None for :attr:`ConfigBackend.DEFAULT_ENCODING
+            <yaconfiglib.backends.base.ConfigBackend.DEFAULT_ENCODING>`.
+    """
+
+    data: TextLike = ""
+    encoding: str = None
+
+    def __new__(cls, *args, data: TextLike = "", encoding: str = None):
+        self = super().__new__(cls, *args)
+        self.data = data
+        self.encoding = encoding
+        return self
+
+    def __init__(self, *args, data: TextLike = "", encoding: str = None) -> None:
+        if _PURE_PATH_INIT:
+            super().__init__(*args)
 
+    def read_text(self, encoding: str = None, errors: str = None) -> str:
+        """Return :attr:`data` as text, decoding binary content with *encoding*."""
+        if isinstance(self.data, str):
+            return self.data
+        return str(self.data, encoding or self.encoding or "utf-8", errors or "strict")
 
-_atexit.register(_cleanup_temp_sources)
+    def read_bytes(self) -> bytes:
+        """Return :attr:`data` as bytes, encoding text content with :attr:`encoding`."""
+        if isinstance(self.data, str):
+            return self.data.encode(self.encoding or "utf-8")
+        return bytes(self.data)
 
+    def open(
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: str = None,
+        errors: str = None,
+        newline: str = None,
+    ) -> _io.IOBase:
+        """Return a read-only stream over :attr:`data`, like :meth:`pathlib.Path.open`.
 
-def _materialize_temp(content: str | bytes, encoding: str, suffix: str) -> Path:
-    """Write *content* to a tracked temp file and return its Path.
+        Raises:
+            io.UnsupportedOperation: If *mode* asks to write.
+        """
+        if set(mode) & set("wax+"):
+            raise _io.UnsupportedOperation(f"{self} is read-only (mode {mode!r})")
+        if "b" in mode:
+            return _io.BytesIO(self.read_bytes())
+        return _io.StringIO(self.read_text(encoding, errors), newline=newline)
 
-    The suffix is reduced to a basename (separators stripped) so a virtual
-    filename from an in-memory ``#!`` marker line can never steer the temp
-    file outside the temp directory.
+    def exists(self) -> bool:
+        """Return True: an in-memory document always exists."""
+        return True
+
+    def is_file(self) -> bool:
+        """Return True: an in-memory document reads like a regular file."""
+        return True
+
+    def is_dir(self) -> bool:
+        """Return False: an in-memory document is never a directory."""
+        return False
+
+
+def memory_source(
+    data: TextLike, name: str = None, encoding: str = None
+) -> MemorySource:
+    """Wrap *data* in a :class:`MemorySource` named *name*.
+
+    Unnamed documents each get a unique ``mem-<n>.yaml`` name, so two of them
+    are never mistaken for one another and backend auto-detection picks YAML
+    (yaconfiglib's default format).
     """
-    mode = "w" if isinstance(content, str) else "wb"
-    kwargs = {"encoding": encoding} if isinstance(content, str) else {}
-    safe_suffix = _os.path.basename(str(suffix).replace("\\", "/")) if suffix else ""
-    with _tempfile.NamedTemporaryFile(
-        mode=mode, delete=False, suffix="-" + (safe_suffix or "source.yaml"), **kwargs
-    ) as tmp:
-        tmp.write(content)
-        name = tmp.name
-    _TEMP_SOURCES.append(name)
-    return Path(name)
+    if not name:
+        name = f"mem-{next(_SOURCE_COUNTER)}.yaml"
+    return MemorySource(name, data=data, encoding=encoding)
 
 
 def has_glob_pattern(path: Path) -> bool:
@@ -89,6 +154,60 @@ def has_glob_pattern(path: Path) -> bool:
     return _glob.has_magic(str(path))
 
 
+def is_glob_source(path: Path) -> bool:
+    """Return True if :func:`parse_sources` would glob-expand *path*."""
+    return not _CMD_REGEX.match(str(path)) and has_glob_pattern(path)
+
+
+def expand_glob(path: Path, recursive: bool = False) -> _ty.Iterator[Path]:
+    """Yield the paths matching the glob pattern *path*."""
+    # stdlib glob pattern fallback uses glob.glob on string paths
+    if hasattr(path, "glob") and HAS_PATHLIB_NEXT:
+        try:
+            yield from path.glob("", recursive=recursive)
+            return
+        except TypeError:
+            pass
+    # Fallback path traversal
+    # If it's a standard Path, glob is supported: path.glob(pattern)
+    # We need to separate directory from the pattern
+    yield from path.parent.glob(path.name)
+
+
+def glob_signature(
+    path: Path, recursive: bool = False
+) -> tuple[tuple[str, int], ...] | None:
+    """Fingerprint the directories a glob over *path* has to list.
+
+    Adding, removing or renaming a file changes its directory's mtime, so an
+    unchanged signature means :func:`expand_glob` would return the same
+    matches. A pattern whose magic is confined to its last component only
+    depends on its parent directory; otherwise (or if *recursive*) every
+    directory below the pattern's literal prefix is included. Returns None
+    for non-local paths, whose directories cannot be stat()ed.
+    """
+    import pathlib
+
+    if not isinstance(path, pathlib.Path):
+        return None
+    parts = path.parts
+    literal = next(
+        (i for i, part in enumerate(parts) if _glob.has_magic(part)), len(parts)
+    )
+    root = pathlib.Path(*parts[:literal]) if literal else pathlib.Path(".")
+    if literal == len(parts) - 1 and not recursive:
+        directories = [str(root)]
+    else:
+        directories = [top for top, _dirs, _files in _os.walk(root)] or [str(root)]
+    signature = []
+    for directory in directories:
+        try:
+            signature.append((directory, _os.stat(directory).st_mtime_ns))
+        except OSError:
+            signature.append((directory, None))
+    return tuple(signature)
+
+
 def parse_sources(
     sources: _ty.Iterable[SourceLike | _ty.Iterable[SourceLike]],
     base_dir: Path = None,
@@ -96,6 +215,7 @@ def parse_sources(
     memo: _ty.Iterable[str | Path] = None,
     path_factory: type[Path] = None,
     recursive: bool = None,
+    expand_globs: bool = True,
 ) -> _ty.Iterator[Path]:
     """Resolve *sources* into a flat stream of loadable :class:`Path`-like objects.
 
@@ -109,11 +229,14 @@ def parse_sources(
       :class:`~yaconfiglib.backends.command.CommandBackend` can run it.
     * An in-memory document: a string/bytes value starting with the
       ``"#!\\n"`` marker, where the first line (after the marker) is
-      treated as a virtual filename and the remainder as its content. The
-      content is materialized to a ``MemPath`` (or a real temp file as a
-      fallback) so downstream backends can read it like any other file.
-    * An open stream (:class:`io.IOBase`) — read fully and materialized
-      the same way as an in-memory document.
+      treated as a virtual filename and the remainder as its content.
+      It is yielded as a :class:`MemorySource`; nothing is written to a
+      ``MemPath`` or temp file.
+    * A ``bytearray`` or ``memoryview`` — an unnamed in-memory document,
+      wrapped without copying.
+    * An open stream (:class:`io.IOBase`) — read fully and yielded as a
+      :class:`MemorySource`.
+    * A :class:`MemorySource` — passed through as-is.
     * A nested iterable of any of the above — flattened recursively.
 
     Args:
@@ -128,6 +251,9 @@ def parse_sources(
             string source.
         recursive: Whether glob expansion should recurse into
             subdirectories.
+        expand_globs: If False, glob patterns are yielded as-is (resolved
+            against *base_dir*) for the caller to pass to
+            :func:`expand_glob` itself.
 
     Yields:
         Resolved :class:`Path`-like objects, one per concrete source
@@ -152,22 +278,24 @@ def parse_sources(
             path_marker = path_marker.encode(encoding or "utf-8")
             newline = newline.encode(encoding or "utf-8")
 
+        if isinstance(source, MemorySource):
+            yield source
+            continue
+
         # Handle file streams (in-memory or real)
         if isinstance(source, _io.IOBase):
-            content = source.read()
-            if MemPath is not None:
-                # Unique name + default .yaml suffix so backend auto-detection
-                # works for an anonymous stream (YAML is yaconfiglib's default).
-                path = MemPath(f"stream-{next(_SOURCE_COUNTER)}.yaml")
-                path.parent.mkdir(parents=True, exist_ok=True)
-                if isinstance(content, str):
-                    path.write_text(content, encoding=encoding)
-                else:
-                    path.write_bytes(content)
-                yield path
-            else:
-                # Fallback to temp file if MemPath is not available
-                yield _materialize_temp(content, encoding, ".yaml")
+            # Unique name + default .yaml suffix so backend auto-detection
+            # works for an anonymous stream (YAML is yaconfiglib's default).
+            yield MemorySource(
+                f"stream-{next(_SOURCE_COUNTER)}.yaml",
+                data=source.read(),
+                encoding=encoding,
+            )
+            continue
+
+        # Mutable/shared buffers are never file names: parse them in place.
+        if isinstance(source, (bytearray, memoryview)):
+            yield memory_source(source, encoding=encoding)
             continue
 
         elif isinstance(source, (str, Path, bytes)):
@@ -177,23 +305,7 @@ def parse_sources(
                 filename = filename.removeprefix(path_marker)
                 if isinstance(filename, bytes):
                     filename = filename.decode(encoding or "utf-8")
-                if not filename:
-                    # Unnamed in-memory docs each get a unique virtual name so
-                    # two of them never share (and overwrite) one MemPath. The
-                    # ``.yaml`` suffix keeps backend auto-detection working for
-                    # a bare ``loads("...")`` (YAML is yaconfiglib's default).
-                    filename = f"mem-{next(_SOURCE_COUNTER)}.yaml"
-                if MemPath is not None:
-                    path = MemPath(filename)
-                    path.parent.mkdir(parents=True, exist_ok=True)
-                    if isinstance(source, bytes):
-                        path.write_bytes(source)
-                    else:
-                        path.write_text(source, encoding=encoding)
-                    yield path
-                else:
-                    # Fallback to temp file if MemPath is not available
-                    yield _materialize_temp(source, encoding, filename)
+                yield memory_source(source, filename, encoding)
                 continue
             elif isinstance(source, Path):
                 is_cmd = bool(_CMD_REGEX.match(str(source)))
@@ -226,22 +338,8 @@ def parse_sources(
                     logger.warning("ignoring duplicated file %s" % path)
                     continue
                 memo.add(memo_key)
-            if not is_cmd and has_glob_pattern(path):
-                # stdlib glob pattern fallback uses glob.glob on string paths
-                if hasattr(path, "glob") and HAS_PATHLIB_NEXT:
-                    try:
-                        yield from path.glob("", recursive=recursive)
-                    except TypeError:
-                        pattern = path.name
-                        parent_dir = path.parent
-                        yield from parent_dir.glob(pattern)
-                else:
-                    # Fallback path traversal
-                    # If it's a standard Path, glob is supported: path.glob(pattern)
-                    # We need to separate directory from the pattern
-                    pattern = path.name
-                    parent_dir = path.parent
-                    yield from parent_dir.glob(pattern)
+            if expand_globs and not is_cmd and has_glob_pattern(path):
+                yield from expand_glob(path, recursive)
             else:
                 yield path
         elif isinstance(source, _ty.Iterable):
@@ -252,6 +350,7 @@ def parse_sources(
                 path_factory=path_factory,
                 encoding=encoding,
                 recursive=recursive,
+                expand_globs=expand_globs,
             )
         else:
             raise ValueError(
@@ -5,8 +5,11 @@ import sys
 import pytest
 import subprocess
 
+import yaml
+
 from yaconfiglib import ConfigLoader
-from yaconfiglib.backends.base import ConfigBackend
+from yaconfiglib.loader import DotAccessibleDict
+from yaconfiglib.backends.base import BUILTIN_BACKENDS, ConfigBackend, _builtins_first
 from yaconfiglib.backends.dotenv import DotenvBackend
 from yaconfiglib.backends.env import EnvVarBackend
 from yaconfiglib.backends.jinja2 import Jinja2ConfigLoader
@@ -104,18 +107,16 @@ class TestRegistryBackends:
         result = loader.load("config.yaml.j2", environment=environment)
         assert result == {"value": "from-env"}
 
-    def test_jinja_backend_falls_back_to_temp_file_without_pathlib_next(
-        self, tmp_path, monkeypatch
-    ):
-        # Regression: the ImportError fallback set MemPath = None and load()
-        # called it unconditionally, so every .j2 source raised
-        # "TypeError: 'NoneType' object is not callable" without pathlib_next —
-        # even though the class docstring promised "a real temp file when
-        # pathlib_next is unavailable". Simulating the absent import is enough;
-        # MemPath is the only thing this backend uses it for.
-        from yaconfiglib.backends import jinja2 as jinja2_backend
+    def test_jinja_backend_renders_without_a_virtual_file(self, tmp_path, monkeypatch):
+        # The rendered text used to be written to a MemPath (or, without
+        # pathlib_next, a temp file) just so the YAML backend could read it
+        # back. It now goes straight to the backend's loads().
+        from pathlib_next.mempath import MemPath
+
+        def refuse(*args, **kwargs):
+            raise AssertionError("rendered template written to a MemPath")
 
-        monkeypatch.setattr(jinja2_backend, "MemPath", None)
+        monkeypatch.setattr(MemPath, "write_text", refuse)
 
         template = tmp_path / "config.yaml.j2"
         template.write_text("port: {{ 8000 + 80 }}\nname: plain\n")
@@ -186,6 +187,11 @@ class TestCommandBackend:
         result = loader.load("main.yaml")
         assert result == {"config": {"app": {"name": "my-app"}}}
 
+    def test_cmd_mapping_output_is_dot_accessible(self):
+        result = CommandBackend().load("cmd+yaml://echo 'a: {b: 1}'")
+        assert isinstance(result, DotAccessibleDict)
+        assert result.a.b == 1
+
     # --- Fringe Case Tests ---
 
     def test_cmd_execution_failure(self):
@@ -212,6 +218,261 @@ class TestCommandBackend:
         assert "Unknown configuration format/loader" in str(exc_info.value)
 
 
+class TestDirectExec:
+    ARGV_CMD = 'python -c "import json, sys; print(json.dumps(sys.argv[1:]))"'
+
+    def test_exec_passes_arguments_verbatim(self):
+        loader = ConfigLoader()
+        result = loader.load(f'exec+json://{self.ARGV_CMD} "$HOME" "a b" "|" cat')
+        assert result == ["$HOME", "a b", "|", "cat"]
+
+    def test_exec_runs_without_a_shell(self, monkeypatch):
+        calls = []
+        real_run = subprocess.run
+
+        def spy(args, **kwargs):
+            calls.append((args, kwargs["shell"]))
+            return real_run(args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", spy)
+        assert CommandBackend().load(f"exec+json://{self.ARGV_CMD} x") == ["x"]
+        assert CommandBackend().load(f"cmd+json://{self.ARGV_CMD} x") == ["x"]
+        assert isinstance(calls[0][0], list) and calls[0][1] is False
+        assert isinstance(calls[1][0], str) and calls[1][1] is True
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell syntax")
+    def test_sh_and_cmd_keep_shell_syntax(self):
+        loader = ConfigLoader()
+        for scheme in ("sh", "cmd"):
+            result = loader.load(
+                f'{scheme}://echo \'{{"a": 1}}\' | python -c "import sys; print(sys.stdin.read())"'
+            )
+            assert result == {"a": 1}
+
+    def test_exec_missing_program(self):
+        with pytest.raises(FileNotFoundError):
+            CommandBackend().load("exec://yaconfiglib-no-such-program --flag")
+
+    def test_exec_empty_command(self):
+        with pytest.raises(ValueError, match="No program to execute"):
+            CommandBackend().load("exec:// ")
+
+    def test_exec_failure(self):
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            CommandBackend().load('exec://python -c "import sys; sys.exit(3)"')
+        assert exc_info.value.returncode == 3
+
+    def test_async_exec(self):
+        import asyncio
+
+        result = asyncio.run(
+            CommandBackend().aload(f'exec+json://{self.ARGV_CMD} "a b" c')
+        )
+        assert result == ["a b", "c"]
+
+    def test_exec_and_shell_results_cached_apart(self):
+        from yaconfiglib.utils.cache import CommandCache
+
+        cache = CommandCache()
+        backend = CommandBackend()
+        for scheme in ("exec", "cmd", "exec"):
+            backend.load(f"{scheme}+json://{self.ARGV_CMD} x", command_cache=cache)
+        assert len(cache) == 2
+        assert cache.stats.hits == 1
+
+
+class TestCommandOutputSniffing:
+    @pytest.mark.parametrize(
+        "output, first",
+        [
+            ('{"a": 1}', "json"),
+            ("# generated\n\nkey: value", "yaml"),
+            ("- one\n- two", "yaml"),
+            ('token = "abc"', "toml"),
+            ("export TOKEN=abc", "dotenv"),
+            ("[secret]\ntoken = abc", "toml"),
+            ("[1, 2, 3]", "json"),
+            ("just some text", "json"),
+        ],
+    )
+    def test_likely_format_comes_first(self, output, first):
+        from yaconfiglib.backends.command import _SNIFF_ORDER, _sniff_formats
+
+        order = _sniff_formats(output)
+        assert order[0] == first
+        assert sorted(order) == sorted(_SNIFF_ORDER)
+
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            ('token = "abc"\nttl = 30', {"token": "abc", "ttl": 30}),
+            ("export TOKEN=abc\nTTL=30", {"token": "abc", "ttl": "30"}),
+            ("[secret]\ntoken = abc def", {"secret": {"token": "abc def"}}),
+            ("{'a': 1}", {"a": 1}),
+            ("plain text", "plain text"),
+        ],
+    )
+    def test_sniffed_output_parses(self, output, expected):
+        # key = value and [section] output used to fall through json and
+        # yaml, which returned it as one folded YAML string (or flattened
+        # INI into dotenv) instead of the structured value.
+        assert CommandBackend()._parse_output(output, None, {}) == expected
+
+    def test_sniff_miss_falls_back_to_remaining_formats(self, monkeypatch):
+        from yaconfiglib.backends.toml import TomlConfig
+
+        tried = []
+        original = TomlConfig.loads
+
+        def spy(self, data, **options):
+            tried.append("toml")
+            return original(self, data, **options)
+
+        monkeypatch.setattr(TomlConfig, "loads", spy)
+        # Looks like TOML but is only valid dotenv (unquoted value).
+        result = CommandBackend()._parse_output("KEY=some value", None, {})
+        assert result == {"key": "some value"}
+        assert tried == ["toml"]
+
+
+_COPROCESS_HELPER = """\
+import json, os, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    request = message["request"]
+    if request == "crash":
+        os._exit(3)
+    if request == "fail":
+        reply = {"id": message["id"], "error": "no such secret"}
+    else:
+        output = json.dumps({"secret": request, "pid": os.getpid()})
+        reply = {"id": message["id"], "output": output}
+    print(json.dumps(reply), flush=True)
+"""
+
+
+class TestCoprocessSources:
+    @pytest.fixture
+    def helper(self, tmp_path):
+        script = tmp_path / "helper.py"
+        script.write_text(_COPROCESS_HELPER)
+        yield f"coproc://python {script.as_posix()}"
+        CommandBackend.close_coprocesses()
+
+    def test_requests_share_one_helper(self, helper):
+        loader = ConfigLoader()
+        first = loader.load(f"{helper}#db")
+        second = loader.load(f"{helper}#api")
+        assert (first["secret"], second["secret"]) == ("db", "api")
+        assert first["pid"] == second["pid"]
+
+    def test_request_option_and_format(self, helper):
+        result = ConfigLoader().load(
+            helper.replace("coproc://", "coproc+json://"), request={"path": "a/b"}
+        )
+        assert result["secret"] == {"path": "a/b"}
+
+    def test_concurrent_requests_are_multiplexed(self, helper):
+        from concurrent.futures import ThreadPoolExecutor
+
+        loader = ConfigLoader()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: loader.load(f"{helper}#k{i}"), range(40)))
+        assert [r["secret"] for r in results] == [f"k{i}" for i in range(40)]
+        assert len({r["pid"] for r in results}) == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="POSIX fork")
+    def test_forked_child_starts_its_own_helper(self, helper, monkeypatch):
+        import json
+        import warnings
+
+        monkeypatch.setattr(CommandBackend, "COPROCESS_TIMEOUT", 5.0)
+        loader = ConfigLoader()
+        parent = loader.load(f"{helper}#parent")
+        read_fd, write_fd = os.pipe()
+        with warnings.catch_warnings():
+            # Python 3.12+ warns about forking with the helper's threads running.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                os.close(read_fd)
+                child = loader.load(f"{helper}#child")
+                os.write(write_fd, json.dumps(child).encode())
+                CommandBackend.close_coprocesses()
+                code = 0
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as answer:
+            child = json.loads(answer.read() or "null")
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert child["secret"] == "child"
+        assert child["pid"] != parent["pid"]
+        # The parent's helper is untouched.
+        again = loader.load(f"{helper}#again")
+        assert (again["secret"], again["pid"]) == ("again", parent["pid"])
+
+    def test_unserializable_request_leaves_nothing_pending(self, helper):
+        from yaconfiglib.backends.command import _COPROCESSES
+
+        loader = ConfigLoader()
+        loader.load(f"{helper}#warm")
+        with pytest.raises(TypeError):
+            loader.load(helper, request={"key": object()})
+        (coprocess,) = _COPROCESSES.values()
+        assert coprocess._pending == {}
+
+    def test_helper_error_is_raised(self, helper):
+        from yaconfiglib.backends.command import CoprocessError
+
+        with pytest.raises(CoprocessError, match="no such secret"):
+            ConfigLoader().load(f"{helper}#fail")
+
+    def test_helper_is_restarted_after_crash(self, helper):
+        from yaconfiglib.backends.command import CoprocessError
+
+        loader = ConfigLoader()
+        before = loader.load(f"{helper}#a")["pid"]
+        with pytest.raises(CoprocessError, match="exited"):
+            loader.load(f"{helper}#crash")
+        after = loader.load(f"{helper}#b")
+        assert after["secret"] == "b"
+        assert after["pid"] != before
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX process probing")
+    def test_idle_helper_is_shut_down(self, helper, monkeypatch):
+        import time
+
+        monkeypatch.setattr(CommandBackend, "COPROCESS_IDLE_TIMEOUT", 0.2)
+        loader = ConfigLoader()
+        pid = loader.load(f"{helper}#a")["pid"]
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("idle coprocess was not shut down")
+        assert loader.load(f"{helper}#b")["pid"] != pid
+
+    def test_async_load(self, helper):
+        import asyncio
+
+        result = asyncio.run(ConfigLoader().aload(f"{helper}#async"))
+        assert result["secret"] == "async"
+
+    def test_blocked_by_allow_commands(self, helper):
+        from yaconfiglib import CommandsDisabledError
+
+        with pytest.raises(CommandsDisabledError):
+            ConfigLoader(allow_commands=False).load(f"{helper}#db")
+
+
 class TestYamlIncludeRegistration:
     def test_manual_include_registration_warns(self, caplog):
         """A pre-existing !include constructor is overridden with a warning.
@@ -255,6 +516,61 @@ class TestYamlIncludeRegistration:
         assert not any("unnecessary" in rec.getMessage() for rec in caplog.records)
 
 
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+class TestLibyaml:
+    DOC = (
+        "defaults: &defaults {retries: 3, when: 2024-01-02}\n"
+        "prod:\n  <<: *defaults\n  hosts: [a, b]\n  ratio: .5\n  flag: yes\n"
+    )
+
+    def test_c_loader_by_default(self):
+        import yaml
+
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        assert YamlConfig()._default_loader_cls() is yaml.CSafeLoader
+
+    def test_pure_python_can_be_forced(self, monkeypatch):
+        import yaml
+
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        fast = YamlConfig().loads(self.DOC)
+        monkeypatch.setattr(YamlConfig, "USE_LIBYAML", False)
+        assert YamlConfig()._default_loader_cls() is yaml.SafeLoader
+        assert YamlConfig().loads(self.DOC) == fast
+
+    def test_extended_safe_loader_stays_pure_python(self, monkeypatch):
+        import yaml
+
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        constructors = dict(yaml.SafeLoader.yaml_constructors)
+        constructors["!env"] = lambda ldr, node: "from-env"
+        monkeypatch.setattr(yaml.SafeLoader, "yaml_constructors", constructors)
+        assert YamlConfig()._default_loader_cls() is yaml.SafeLoader
+        assert YamlConfig().loads("a: !env X") == {"a": "from-env"}
+
+    def test_includes_registered_on_c_loader(self, tmp_path):
+        import yaml
+
+        (tmp_path / "db.toml").write_text('host = "db"\n')
+        (tmp_path / "main.yaml").write_text(
+            "base: &b {port: 1}\ndb: !include db.toml\nref: *b\n"
+        )
+        result = ConfigLoader(base_dir=tmp_path).load("main.yaml")
+        assert result == {"base": {"port": 1}, "db": {"host": "db"}, "ref": {"port": 1}}
+        assert yaml.CSafeLoader._yaconfiglib_include_registered is True
+
+    def test_dumps_matches_pure_python(self, monkeypatch):
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        data = {"a": [1, {"b": "ü", "c": None}], "t": (1, 2), "s": "x " * 60}
+        fast = YamlConfig().dumps(data)
+        monkeypatch.setattr(YamlConfig, "USE_LIBYAML", False)
+        assert YamlConfig().dumps(data) == fast
+
+
 class TestDeterministicDispatch:
     def test_first_defined_backend_wins(self):
         import re
@@ -284,6 +600,117 @@ class TestDeterministicDispatch:
                 ConfigBackend.get_class_by_path(StdPath("x.zzztest")) is ZzzFirstBackend
             )
 
+    def test_new_backend_invalidates_index(self):
+        import re
+
+        from pathlib import Path as StdPath
+
+        with pytest.raises(NotImplementedError):
+            ConfigBackend.get_class_by_path(StdPath("x.qqqindex"))
+
+        class QqqBackend(ConfigBackend):
+            PATHNAME_REGEX = re.compile(r".*\.qqqindex$", re.IGNORECASE)
+
+            def load(self, path, **options):
+                return "qqq"
+
+        assert ConfigBackend.get_class_by_path(StdPath("X.QQQINDEX")) is QqqBackend
+        assert ConfigBackend.get_class_by_name("qqqbackend") is QqqBackend
+
+    def test_index_agrees_with_linear_scan(self):
+        from pathlib import Path as StdPath
+
+        names = [
+            "a.yaml",
+            "B.YML",
+            "x.env",
+            "x.env.local",
+            "s.yaml.j2",
+            "c.ini",
+            "d.toml",
+            "e.json",
+            "cmd://echo hi",
+            "plain.txt",
+        ]
+        for spec in BUILTIN_BACKENDS:
+            spec.load()
+        ordered = _builtins_first(ConfigBackend.__subclasses__(recursive=True))
+        for name in names:
+            path = StdPath(name)
+            expected = next(
+                (scls for scls in ordered if scls.can_load_path(path)),
+                None,
+            )
+            try:
+                found = ConfigBackend.get_class_by_path(path)
+            except NotImplementedError:
+                found = None
+            assert found is expected, name
+
+
+class TestLazyBackends:
+    @staticmethod
+    def _run(script):
+        src = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(src))
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout.strip()
+
+    def test_specs_match_backend_classes(self):
+        for spec in BUILTIN_BACKENDS:
+            try:
+                scls = spec.load()
+            except ImportError:
+                continue
+            assert ConfigBackend.get_class_by_name(spec.name) is scls
+            if spec.pattern is None:
+                assert scls.PATHNAME_REGEX is None
+            else:
+                assert scls.PATHNAME_REGEX.pattern == spec.pattern.pattern
+                assert scls.PATHNAME_REGEX.flags == spec.pattern.flags
+
+    def test_json_load_imports_only_json_backend(self, tmp_path):
+        (tmp_path / "a.json").write_text('{"x": 1}')
+        script = (
+            "import sys, yaconfiglib\n"
+            f"assert yaconfiglib.load({str(tmp_path / 'a.json')!r}) == {{'x': 1}}\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in "
+            "('yaml', 'jinja2', 'toml', 'tomllib') or m.startswith('yaconfiglib.backends.')))"
+        )
+        assert (
+            self._run(script)
+            == "['yaconfiglib.backends.base', 'yaconfiglib.backends.json']"
+        )
+
+    def test_import_skips_cache_and_pool_modules(self):
+        script = (
+            "import sys, yaconfiglib\n"
+            "print(sorted(m for m in ('pickle', 'tempfile', 'concurrent.futures')"
+            " if m in sys.modules))"
+        )
+        assert self._run(script) == "[]"
+
+    def test_dispatch_order_independent_of_import_order(self):
+        script = (
+            "from pathlib import Path\n"
+            "from yaconfiglib.backends.yaml import YamlConfig\n"
+            "from yaconfiglib.backends import ConfigBackend\n"
+            "print(ConfigBackend.get_class_by_path(Path('cmd://echo.yaml')).__name__)"
+        )
+        assert self._run(script) == "CommandBackend"
+
+    def test_package_exports_resolve_lazily(self):
+        from yaconfiglib import backends
+        from yaconfiglib.backends.json import JsonConfig
+
+        assert backends.JsonConfig is JsonConfig
+        assert "YamlConfig" in dir(backends)
+        with pytest.raises(AttributeError):
+            backends.NoSuchBackend
+
 
 class TestCommandOutputEncoding:
     def test_command_output_utf8_decoding(self):
@@ -295,3 +722,80 @@ class TestCommandOutputEncoding:
         cmd = f"cmd://{sys.executable} -X utf8 -c \"print('caf\xe9')\""
         result = CommandBackend().load(cmd)
         assert result == "café"
+
+
+class TestBackendLoads:
+    @pytest.mark.parametrize(
+        "name, text, expected",
+        [
+            ("yaml", "a: 1\nb: [x]\n", {"a": 1, "b": ["x"]}),
+            ("json", '{"a": 1}', {"a": 1}),
+            ("toml", "a = 1\n[s]\nk = 'v'\n", {"a": 1, "s": {"k": "v"}}),
+            ("ini", "[s]\nk = v\n", {"s": {"k": "v"}}),
+            ("dotenv", "export KEY='v' # note\n", {"key": "v"}),
+        ],
+    )
+    @pytest.mark.parametrize("wrap", [str, bytes, bytearray, memoryview])
+    def test_native_loads_accepts_text_and_buffers(self, name, text, expected, wrap):
+        data = text if wrap is str else wrap(text.encode("utf-8"))
+        backend = ConfigBackend.get_class_by_name(name)()
+        assert backend.loads(data, name=f"doc.{name}") == expected
+
+    def test_loads_decodes_with_encoding(self):
+        from yaconfiglib.backends.json import JsonConfig
+
+        data = bytearray('{"name": "café"}'.encode("latin-1"))
+        assert JsonConfig().loads(data, encoding="latin-1") == {"name": "café"}
+
+    def test_default_loads_reads_through_memory_source(self):
+        class UpperBackend(ConfigBackend):
+            NAME = "upper-test"
+
+            def load(self, path, encoding=None, **options):
+                return {path.name: path.read_text(encoding=encoding).upper()}
+
+        result = UpperBackend().loads(b"hello", name="greeting.txt")
+        assert result == {"greeting.txt": "HELLO"}
+
+    def test_default_loads_supports_file_style_reads(self):
+        class StreamBackend(ConfigBackend):
+            NAME = "stream-test"
+
+            def load(self, path, **options):
+                assert path.exists() and path.is_file() and not path.is_dir()
+                with path.open("rb") as fp:
+                    raw = fp.read()
+                with path.open(encoding="utf-8") as fp:
+                    return {"lines": fp.read().splitlines(), "raw": raw}
+
+        result = StreamBackend().loads(memoryview(b"a\r\nb\n"), name="doc.txt")
+        assert result == {"lines": ["a", "b"], "raw": b"a\r\nb\n"}
+
+    def test_memory_source_is_read_only(self):
+        import io
+
+        from yaconfiglib.utils.source import memory_source
+
+        with pytest.raises(io.UnsupportedOperation):
+            memory_source("x: 1\n").open("w")
+
+    def test_jinja_loads_dispatches_on_name(self):
+        result = Jinja2ConfigLoader().loads(
+            '{"port": {{ 8000 + 80 }}}', name="conf/app.json.j2"
+        )
+        assert result == {"port": 8080}
+
+    def test_command_output_goes_to_backend_loads(self, monkeypatch):
+        from yaconfiglib.backends.json import JsonConfig
+
+        seen = []
+        original = JsonConfig.loads
+
+        def spy(self, data, **options):
+            seen.append(data)
+            return original(self, data, **options)
+
+        monkeypatch.setattr(JsonConfig, "loads", spy)
+        cmd = "cmd+json://python -c \"print('{}')\""
+        assert ConfigLoader().load(cmd) == {}
+        assert seen == ["{}"]
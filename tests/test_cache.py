@@ -0,0 +1,378 @@
+"""
+Tests for the parsed-document cache (utils/cache.py) and its loader wiring.
+"""
+
+import os
+
+from yaconfiglib import ConfigLoader
+from yaconfiglib.loader import ConfigLoaderMergeMethod
+from yaconfiglib.utils.cache import (
+    CommandCache,
+    DiskCache,
+    DocumentCache,
+    freeze,
+    thaw,
+)
+
+
+def _touch(path, content):
+    """Rewrite *path* and force a distinct mtime even on coarse filesystems."""
+    path.write_text(content)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestDocumentCache:
+    def test_second_load_is_a_hit(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("x: 1\n")
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        assert loader.load("a.yaml") == {"x": 1}
+        assert loader.load("a.yaml") == {"x": 1}
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        f = tmp_path / "a.yaml"
+        f.write_text("x: 1\n")
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        loader.load("a.yaml")
+        _touch(f, "x: 22\n")
+        assert loader.load("a.yaml") == {"x": 22}
+        assert cache.stats.misses == 2
+
+    def test_identical_content_parsed_once(self, tmp_path):
+        (tmp_path / "a.json").write_text('{"k": [1, 2]}')
+        (tmp_path / "b.json").write_text('{"k": [1, 2]}')
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        loader.load("a.json")
+        loader.load("b.json")
+        stats = cache.stats
+        assert (stats.misses, stats.entries, stats.documents) == (1, 2, 1)
+
+    def test_identical_content_through_other_backend_parsed_again(self, tmp_path):
+        (tmp_path / "a.json").write_text('{"x": 1e3}')
+        (tmp_path / "a.yaml").write_text('{"x": 1e3}')
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        assert loader.load("a.json") == {"x": 1000.0}
+        assert loader.load("a.yaml") == {"x": "1e3"}
+        assert loader.load("a.json") == {"x": 1000.0}
+        stats = cache.stats
+        assert (stats.misses, stats.entries, stats.documents) == (2, 2, 2)
+
+    def test_in_place_merge_cannot_corrupt_cache(self, tmp_path):
+        (tmp_path / "base.yaml").write_text("db: {host: a, opts: [1]}\n")
+        (tmp_path / "over.yaml").write_text("db: {host: b, opts: [2]}\n")
+        loader = ConfigLoader(
+            base_dir=tmp_path, cache=DocumentCache(), merge=ConfigLoaderMergeMethod.Deep
+        )
+        merged = loader.load("base.yaml", "over.yaml")
+        assert merged == {"db": {"host": "b", "opts": [1, 2]}}
+        merged["db"]["opts"].append(3)
+        assert loader.load("base.yaml") == {"db": {"host": "a", "opts": [1]}}
+
+    def test_documents_with_includes_are_not_cached(self, tmp_path):
+        (tmp_path / "inc.yaml").write_text("v: 1\n")
+        (tmp_path / "main.yaml").write_text("inc: !include inc.yaml\n")
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        assert loader.load("main.yaml") == {"inc": {"v": 1}}
+        _touch(tmp_path / "inc.yaml", "v: 2\n")
+        assert loader.load("main.yaml") == {"inc": {"v": 2}}
+        assert len(cache) == 0
+
+    def test_reader_options_are_part_of_the_key(self, tmp_path):
+        (tmp_path / "a.ini").write_text("[s]\nk = v\n")
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        loader.load("a.ini")
+        loader.load("a.ini", ini_default_section="other")
+        assert cache.stats.entries == 2
+
+    def test_entry_limit_evicts_lru(self, tmp_path):
+        for name in "abc":
+            (tmp_path / f"{name}.json").write_text(f'{{"{name}": 1}}')
+        cache = DocumentCache(max_entries=2)
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        for name in "abc":
+            loader.load(f"{name}.json")
+        stats = cache.stats
+        assert (stats.entries, stats.evictions) == (2, 1)
+
+    def test_byte_budget_and_resize(self, tmp_path):
+        (tmp_path / "a.json").write_text('{"a": "' + "x" * 100 + '"}')
+        (tmp_path / "b.json").write_text('{"b": "' + "y" * 100 + '"}')
+        cache = DocumentCache(max_bytes=150)
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        loader.load("a.json")
+        loader.load("b.json")
+        assert cache.stats.entries == 1
+        cache.resize(max_entries=0)
+        assert cache.stats == (0, 2, 2, 0, 0, 0)
+
+    def test_clear_resets(self, tmp_path):
+        (tmp_path / "a.toml").write_text("k = 1\n")
+        cache = DocumentCache()
+        loader = ConfigLoader(base_dir=tmp_path, cache=cache)
+        loader.load("a.toml")
+        cache.clear()
+        assert cache.stats == (0, 0, 0, 0, 0, 0)
+
+    def test_memory_sources_bypass_cache(self):
+        cache = DocumentCache()
+        loader = ConfigLoader(cache=cache)
+        assert loader.load("#!\nx: 1\n") == {"x": 1}
+        assert cache.stats.misses == 0
+
+
+class TestDiskCache:
+    @staticmethod
+    def _count_parses(monkeypatch, backend_cls):
+        calls = []
+        original = backend_cls.load
+
+        def counting(self, path, **options):
+            calls.append(path)
+            return original(self, path, **options)
+
+        monkeypatch.setattr(backend_cls, "load", counting)
+        return calls
+
+    def test_warm_start_skips_parse(self, tmp_path, monkeypatch):
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        (tmp_path / "a.yaml").write_text("x: [1, 2]\n")
+        calls = self._count_parses(monkeypatch, YamlConfig)
+        cache_dir = tmp_path / "cache"
+        assert ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.yaml") == {
+            "x": [1, 2]
+        }
+        # A fresh loader stands in for a new process: nothing in memory.
+        assert ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.yaml") == {
+            "x": [1, 2]
+        }
+        assert len(calls) == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        f = tmp_path / "a.json"
+        f.write_text('{"x": 1}')
+        loader = ConfigLoader(base_dir=tmp_path, cache_dir=tmp_path / "cache")
+        loader.load("a.json")
+        _touch(f, '{"x": 2}')
+        assert loader.load("a.json") == {"x": 2}
+
+    def test_non_builtin_values_round_trip(self, tmp_path):
+        import datetime
+
+        (tmp_path / "a.toml").write_text("when = 2024-01-02T03:04:05\n")
+        cache_dir = tmp_path / "cache"
+        ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.toml")
+        result = ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.toml")
+        assert result == {"when": datetime.datetime(2024, 1, 2, 3, 4, 5)}
+
+    def test_corrupt_entries_are_misses(self, tmp_path):
+        (tmp_path / "a.ini").write_text("[s]\nk = v\n")
+        cache_dir = tmp_path / "cache"
+        ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.ini")
+        for folder in ("docs", "index"):
+            for entry in (cache_dir / folder).iterdir():
+                entry.write_bytes(b"garbage")
+        result = ConfigLoader(base_dir=tmp_path, cache_dir=cache_dir).load("a.ini")
+        assert result == {"s": {"k": "v"}}
+
+    def test_clear_empties_directory(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("x: 1\n")
+        cache = DiskCache(tmp_path / "cache")
+        ConfigLoader(base_dir=tmp_path, cache_dir=cache.directory).load("a.yaml")
+        cache.clear()
+        assert not any((tmp_path / "cache" / "docs").iterdir())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCommandCache:
+    def test_fresh_entry_is_a_hit_until_ttl(self):
+        clock = _Clock()
+        cache = CommandCache(ttl=10, clock=clock)
+        runs = []
+
+        def run():
+            runs.append(1)
+            return {"token": len(runs)}
+
+        assert cache.load("k", run) == {"token": 1}
+        clock.now = 9
+        assert cache.load("k", run) == {"token": 1}
+        clock.now = 10
+        assert cache.load("k", run) == {"token": 2}
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+
+    def test_results_are_private_copies(self):
+        cache = CommandCache()
+        cache.load("k", lambda: {"list": [1]})["list"].append(2)
+        assert cache.load("k", lambda: None) == {"list": [1]}
+
+    def test_failures_are_not_cached(self):
+        cache = CommandCache()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        try:
+            cache.load("k", fail)
+        except RuntimeError:
+            pass
+        assert cache.load("k", lambda: "ok") == "ok"
+        assert cache.stats.misses == 2
+
+    def test_entry_limit_evicts_lru(self):
+        cache = CommandCache(max_entries=2)
+        cache.load("a", lambda: 1)
+        cache.load("b", lambda: 2)
+        cache.load("a", lambda: None)
+        cache.load("c", lambda: 3)
+        assert cache.stats.evictions == 1
+        assert cache.load("a", lambda: None) == 1
+        assert cache.load("b", lambda: "rerun") == "rerun"
+
+    def test_concurrent_loads_share_one_run(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = CommandCache()
+        started = threading.Event()
+        release = threading.Event()
+        runs = []
+
+        def run():
+            runs.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(cache.load, "k", run)
+            started.wait(5)
+            others = [pool.submit(cache.load, "k", run) for _ in range(3)]
+            while cache.stats.coalesced < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+        assert results == ["value"] * 4
+        assert len(runs) == 1
+        assert cache.stats.coalesced == 3
+
+    def test_stale_while_revalidate_serves_old_value(self):
+        import threading
+
+        clock = _Clock()
+        cache = CommandCache(ttl=10, stale_while_revalidate=5, clock=clock)
+        refreshed = threading.Event()
+        cache.load("k", lambda: "old")
+
+        def refresh():
+            refreshed.set()
+            return "new"
+
+        clock.now = 12
+        assert cache.load("k", refresh) == "old"
+        assert refreshed.wait(5)
+        for _ in range(500):
+            if cache.load("k", lambda: "unused") == "new":
+                break
+            threading.Event().wait(0.01)
+        assert cache.load("k", lambda: "unused") == "new"
+        assert (cache.stats.stale_hits, cache.stats.refreshes) == (1, 1)
+        # Past the stale window the command runs in the foreground again.
+        clock.now = 40
+        assert cache.load("k", lambda: "blocking") == "blocking"
+
+    def test_async_load_uses_cache(self):
+        import asyncio
+
+        cache = CommandCache()
+        runs = []
+
+        async def run():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return {"v": 1}
+
+        async def main():
+            return await asyncio.gather(*(cache.aload("k", run) for _ in range(3)))
+
+        assert asyncio.run(main()) == [{"v": 1}] * 3
+        assert len(runs) == 1
+
+    def test_loader_reuses_command_result(self, tmp_path):
+        import sys
+
+        marker = tmp_path / "runs.txt"
+        script = tmp_path / "emit.py"
+        script.write_text(
+            "import json, pathlib, sys\n"
+            "with open(sys.argv[1], 'a') as f:\n"
+            "    f.write('x')\n"
+            "print(json.dumps({'secret': 's3cr3t'}))\n"
+        )
+        cmd = f'cmd+json://"{sys.executable}" "{script}" "{marker}"'
+        cache = CommandCache(ttl=60)
+        loader = ConfigLoader(command_cache=cache)
+        assert loader.load(cmd) == {"secret": "s3cr3t"}
+        assert loader.load(cmd, cmd) == {"secret": "s3cr3t"}
+        assert ConfigLoader(command_cache=cache).load(cmd) == {"secret": "s3cr3t"}
+        assert marker.read_text() == "x"
+        assert cache.stats.hits == 3
+        # Without a cache every load runs the command.
+        ConfigLoader().load(cmd)
+        assert marker.read_text() == "xx"
+
+    def test_included_command_hits_across_files_and_reloads(self, tmp_path):
+        import sys
+
+        marker = tmp_path / "runs.txt"
+        script = tmp_path / "emit.py"
+        script.write_text(
+            "import json, sys\n"
+            "with open(sys.argv[1], 'a') as f:\n"
+            "    f.write('x')\n"
+            "print(json.dumps({'secret': 's3cr3t'}))\n"
+        )
+        cmd = f'cmd+json://"{sys.executable}" "{script}" "{marker}"'
+        for name in ("one.yaml", "two.yaml"):
+            (tmp_path / name).write_text(f"db: !include '{cmd}'\n")
+        cache = CommandCache(ttl=60)
+        # Without the include memo, so every include reaches the backend.
+        loader = ConfigLoader(
+            base_dir=tmp_path, command_cache=cache, memoize_includes=False
+        )
+        for _ in range(2):
+            for name in ("one.yaml", "two.yaml"):
+                assert loader.load(name) == {"db": {"secret": "s3cr3t"}}
+        assert marker.read_text() == "x"
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (3, 1, 1)
+
+
+class TestHelpers:
+    def test_thaw_copies_containers_and_keeps_sharing(self):
+        shared = {"k": [1]}
+        doc = {"a": shared, "b": shared, "t": (1, [2])}
+        copy = thaw(doc)
+        assert copy == doc
+        assert copy["a"] is not shared
+        assert copy["a"] is copy["b"]
+        assert copy["t"][1] is not doc["t"][1]
+
+    def test_freeze_is_order_insensitive(self):
+        assert freeze({"a": 1, "b": [1]}) == freeze({"b": [1], "a": 1})
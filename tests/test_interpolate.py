@@ -6,7 +6,6 @@ import pytest
 
 from yaconfiglib.utils import jinja2 as j2
 
-
 # ---------------------------------------------------------------------------
 # compile / eval helpers
 # ---------------------------------------------------------------------------
@@ -142,6 +141,79 @@ class TestLoaderInterpolationFeatures:
             loader.load(loader=PythonBackend({"value": "{{ missing_var }}"}))
 
 
+class TestOrderedInterpolation:
+    def test_references(self):
+        refs = j2.references(
+            "{{ db.host }}:{{ servers[0].port }}{% for x in items %}{{ x }}{% endfor %}"
+            "{{ cfg[key] }}"
+        )
+        assert set(refs) == {
+            ("db", "host"),
+            ("servers", 0, "port"),
+            ("items",),
+            ("cfg",),
+            ("key",),
+        }
+
+    def test_values_see_rendered_references(self, monkeypatch):
+        from yaconfiglib import ConfigLoader
+        from yaconfiglib.backends.python_backend import PythonBackend
+
+        monkeypatch.setenv("APP_HOST", "example.org")
+        data = {
+            "url": "{{ scheme }}://{{ host }}/{{ db.name }}",
+            "scheme": "https",
+            "host": "{{ env.APP_HOST }}",
+            "db": {"name": "{{ host }}-db", "port": "{{ 5000 + 432 }}"},
+            "links": ["{{ url }}"],
+        }
+        loader = ConfigLoader(interpolate=True, inject_env=True)
+        result = loader.load(loader=PythonBackend(data))
+        assert result == {
+            "url": "https://example.org/example.org-db",
+            "scheme": "https",
+            "host": "example.org",
+            "db": {"name": "example.org-db", "port": 5432},
+            "links": ["https://example.org/example.org-db"],
+        }
+
+    def test_each_value_rendered_once(self, monkeypatch):
+        calls = []
+        compile_ = j2.compile
+
+        def counting(code, *args, **kwargs):
+            calls.append(code)
+            return compile_(code, *args, **kwargs)
+
+        monkeypatch.setattr(j2, "compile", counting)
+        data = {"a": "x{{ b }}", "b": "y{{ c }}", "c": "z"}
+        j2.interpolate(data, dict(data), ordered=True)
+        assert data == {"a": "xyz", "b": "yz", "c": "z"}
+        assert sorted(calls) == ["x{{ b }}", "y{{ c }}"]
+
+    def test_cycle_reports_paths(self):
+        data = {"a": "{{ b.c }}", "b": {"c": "{{ a }}"}}
+        with pytest.raises(j2.InterpolationCycleError) as info:
+            j2.interpolate(data, dict(data), ordered=True)
+        assert isinstance(info.value, ValueError)
+        assert info.value.cycle == ["a", "b.c", "a"]
+
+    def test_reference_into_own_subtree_is_not_a_cycle(self):
+        data = {"db": {"host": "h", "url": "pg://{{ db.host }}", "all": "{{ db }}"}}
+        result = j2.interpolate(data, dict(data), ordered=True)
+        assert result["db"]["url"] == "pg://h"
+
+    def test_shadowed_global_is_not_a_dependency(self):
+        data = {"env": "{{ missing }}", "v": "{{ env.X }}"}
+        result = j2.interpolate(data, {**data, "env": {"X": "1"}}, ordered=True)
+        assert result["v"] == "1"
+
+    def test_templated_keys_rendered_after_values(self):
+        data = {"{{ name }}_port": "{{ port }}", "name": "{{ 'svc' }}", "port": 1}
+        result = j2.interpolate(data, dict(data), ordered=True)
+        assert result == {"svc_port": 1, "name": "svc", "port": 1}
+
+
 class TestInterpolatePerf:
     def test_plain_string_fast_path_returns_identity(self):
         from yaconfiglib.utils.jinja2 import interpolate
@@ -154,6 +226,48 @@ class TestInterpolatePerf:
 
         assert interpolate("hi {{ name }}", {"name": "bob"}) == "hi bob"
 
+    def test_clean_subtrees_are_not_rewritten(self):
+        from yaconfiglib.utils.jinja2 import interpolate
+
+        class Recording(dict):
+            writes = 0
+
+            def __setitem__(self, key, value):
+                Recording.writes += 1
+                super().__setitem__(key, value)
+
+            def pop(self, *args):
+                Recording.writes += 1
+                return super().pop(*args)
+
+        clean = Recording(a="x", b=["y", {"c": 1}])
+        mixed = Recording(plain="p", tpl="{{ n }}", other="q")
+        data = {"clean": clean, "mixed": mixed}
+        result = interpolate(data, {"n": 5})
+        assert result["clean"] is clean and result["mixed"] is mixed
+        assert mixed == {"plain": "p", "tpl": 5, "other": "q"}
+        assert list(mixed) == ["plain", "tpl", "other"]
+        assert Recording.writes == 1  # only mixed["tpl"]
+
+    def test_templated_keys_keep_order(self):
+        from yaconfiglib.utils.jinja2 import interpolate
+
+        data = {"a": 1, "{{ k }}": 2, "z": "{{ k }}"}
+        assert list(interpolate(data, {"k": "b"}).items()) == [
+            ("a", 1),
+            ("b", 2),
+            ("z", "b"),
+        ]
+
+    def test_immutable_containers_still_converted(self):
+        from types import MappingProxyType
+
+        from yaconfiglib.utils.jinja2 import interpolate
+
+        result = interpolate({"t": ("a", "b"), "m": MappingProxyType({"k": "v"})})
+        assert result == {"t": ["a", "b"], "m": {"k": "v"}}
+        assert type(result["m"]) is dict
+
     def test_compile_cache_lru_keeps_hot_entry(self):
         from yaconfiglib.utils import jinja2 as J
 
@@ -186,3 +300,152 @@ class TestInterpolatePerf:
         env2 = Environment()
         r = J.compile("{{ x }}", environment=env2)
         assert r(x=5) == "5"
+
+
+class TestBytecodeCache:
+    @pytest.fixture(autouse=True)
+    def _restore(self):
+        previous = j2.BYTECODE_CACHE
+        yield
+        j2.set_bytecode_cache(previous)
+        j2._COMPILE_CACHE.clear()
+        j2._EVAL_CACHE.clear()
+
+    def test_warm_start_skips_compilation(self, tmp_path, monkeypatch):
+        from jinja2 import Environment
+
+        j2.set_bytecode_cache(tmp_path / "bcc")
+        assert j2.compile("hi {{ name }}")(name="a") == "hi a"
+        assert j2.eval("1 + n")(n=1) == 2
+        assert list((tmp_path / "bcc").iterdir())
+
+        # A fresh process: empty LRUs, nothing may be compiled from source.
+        j2._COMPILE_CACHE.clear()
+        j2._EVAL_CACHE.clear()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("compiled instead of loading bytecode")
+
+        monkeypatch.setattr(Environment, "compile", fail)
+        assert j2.compile("hi {{ name }}")(name="b") == "hi b"
+        assert j2.eval("1 + n")(n=2) == 3
+
+    def test_key_covers_environment_syntax(self, tmp_path):
+        from jinja2 import Environment
+
+        j2.set_bytecode_cache(str(tmp_path))
+        source = "<< x >>{{ x }}"
+        plain = j2.load_template(source, environment=Environment())
+        custom = j2.load_template(
+            source,
+            environment=Environment(
+                variable_start_string="<<", variable_end_string=">>"
+            ),
+        )
+        assert plain.render(x=1) == "<< x >>1"
+        assert custom.render(x=1) == "1{{ x }}"
+
+    def test_none_turns_the_cache_off(self, tmp_path):
+        assert j2.set_bytecode_cache(None) is None
+        j2.load_template("{{ 1 }}")
+        assert j2.BYTECODE_CACHE is None
+
+
+class TestLazyInterpolation:
+    DATA = {
+        "host": "db",
+        "url": "pg://{{ host }}",
+        "port": "{{ 5000 + 432 }}",
+        "nested": {"greeting": "hi {{ host }}", "items": ["{{ host }}-a", "b"]},
+        "{{ host }}_key": "plain",
+    }
+
+    @staticmethod
+    def _load(data, **kwargs):
+        import copy
+
+        from yaconfiglib import ConfigLoader
+        from yaconfiglib.backends.python_backend import PythonBackend
+
+        loader = ConfigLoader(interpolate="lazy", **kwargs)
+        return loader.load(loader=PythonBackend(copy.deepcopy(data)))
+
+    def test_matches_eager_interpolation(self):
+        import copy
+
+        from yaconfiglib import ConfigLoader
+        from yaconfiglib.backends.python_backend import PythonBackend
+
+        eager = ConfigLoader(interpolate=True).load(
+            loader=PythonBackend(copy.deepcopy(self.DATA))
+        )
+        lazy = self._load(self.DATA)
+        assert lazy == eager
+        assert lazy.port == 5432
+
+    def test_cross_references_match_eager_interpolation(self, monkeypatch):
+        import copy
+
+        from yaconfiglib import ConfigLoader
+        from yaconfiglib.backends.python_backend import PythonBackend
+
+        monkeypatch.setenv("APP_REGION", "eu")
+        data = {
+            "url": "{{ scheme }}://{{ host }}/{{ db.name }}",
+            "scheme": "https",
+            "host": "{{ scheme }}-h.{{ env.APP_REGION }}",
+            "db": {"name": "{{ host }}-db", "dsn": "{{ db.name }}:{{ port }}"},
+            "port": "{{ 5000 + 432 }}",
+            "links": ["{{ url }}", "{{ db.dsn }}"],
+        }
+        eager = ConfigLoader(interpolate=True, inject_env=True).load(
+            loader=PythonBackend(copy.deepcopy(data))
+        )
+        # Read in an order that reaches every reference before its target.
+        lazy = self._load(data, inject_env=True)
+        assert lazy.links[1] == "https-h.eu-db:5432"
+        assert lazy.url == "https://https-h.eu/https-h.eu-db"
+        assert lazy == eager
+
+    def test_cycles_raise_on_access(self):
+        config = self._load({"a": "{{ b.c }}", "b": {"c": "{{ a }}"}, "ok": 1})
+        assert config.ok == 1
+        with pytest.raises(j2.InterpolationCycleError) as info:
+            config.a
+        assert info.value.cycle == ["a", "b.c", "a"]
+
+    def test_renders_only_on_access(self, monkeypatch):
+        calls = []
+        original = j2.interpolate
+
+        def counting(data, *args, **kwargs):
+            calls.append(data)
+            return original(data, *args, **kwargs)
+
+        monkeypatch.setattr(j2, "interpolate", counting)
+        config = self._load(self.DATA)
+        assert calls == ["{{ host }}_key"]
+        assert config.nested.greeting == "hi db"
+        assert config["nested"]["greeting"] == "hi db"
+        assert calls[1:] == ["hi {{ host }}"]
+        assert config.get("nested.items") == ["db-a", "b"]
+
+    def test_errors_surface_on_access(self):
+        config = self._load({"ok": 1, "bad": "{{ missing }}"}, strict=True)
+        assert config.ok == 1
+        with pytest.raises(Exception, match="missing"):
+            config.bad
+        with pytest.raises(Exception, match="missing"):
+            config.resolve_all()
+
+    def test_sandbox_applies(self):
+        from jinja2.exceptions import SecurityError
+
+        config = self._load({"x": "{{ ''.__class__.__mro__ }}"}, sandbox=True)
+        with pytest.raises(SecurityError):
+            config.x
+
+    def test_resolve_all_and_plain_copies(self):
+        config = self._load(self.DATA).resolve_all()
+        assert dict.__getitem__(config, "url") == "pg://db"
+        assert dict(self._load(self.DATA))["url"] == "pg://db"
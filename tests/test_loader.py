@@ -85,6 +85,24 @@ class TestMergeMethods:
         result = loader.load("a.yaml", "b.yaml")
         assert result == {"items": [{"name": "api", "enabled": True}]}
 
+    def test_merge_key_via_merge_options(self, tmp_path):
+        (tmp_path / "a.yaml").write_text(
+            "servers:\n  - {name: a, port: 80}\n  - {name: b, port: 80}\n"
+        )
+        (tmp_path / "b.yaml").write_text("servers:\n  - {name: b, port: 8080}\n")
+        loader = ConfigLoader(
+            base_dir=tmp_path,
+            merge=ConfigLoaderMergeMethod.Deep,
+            merge_options={"merge_key": "name"},
+        )
+        expected = {"servers": [{"name": "a", "port": 80}, {"name": "b", "port": 8080}]}
+        assert loader.load("a.yaml", "b.yaml") == expected
+        per_call = ConfigLoader(base_dir=tmp_path, merge=ConfigLoaderMergeMethod.Deep)
+        assert (
+            per_call.load("a.yaml", "b.yaml", merge_options={"merge_key": "name"})
+            == expected
+        )
+
     def test_substitute_merge(self, tmp_path):
         (tmp_path / "a.yaml").write_text("list: [1, 2, 3]\n")
         (tmp_path / "b.yaml").write_text("list: [4, 5]\n")
@@ -110,6 +128,67 @@ class TestMergeMethods:
         assert isinstance(result, list)
         assert len(result) == 2
 
+    def test_many_layer_deep_merge_matches_pairwise(self, tmp_path):
+        names = []
+        for i in range(20):
+            (tmp_path / f"l{i}.yaml").write_text(
+                f"db:\n  port: {5000 + i}\n  opt{i}: true\nitems: [{i}]\n"
+            )
+            names.append(f"l{i}.yaml")
+        loader = ConfigLoader(base_dir=tmp_path, merge=ConfigLoaderMergeMethod.Deep)
+        result = loader.load(*names)
+        expected = None
+        for name in names:
+            expected = ConfigLoaderMergeMethod.Deep(
+                expected, loader.load(name), mergelists=True
+            )
+        assert result == expected
+        assert result["db"]["port"] == 5019
+        assert result["items"] == list(range(20))
+
+    def test_many_layer_merge_error_reaches_ignore_error(self, tmp_path):
+        names = []
+        for i in range(20):
+            body = "db: [1]\n" if i == 7 else f"db:\n  port: {i}\n"
+            (tmp_path / f"l{i:02}.yaml").write_text(body)
+            names.append(f"l{i:02}.yaml")
+        seen = []
+
+        def record(error, path, **ctx):
+            seen.append((type(error), path.name))
+            return True
+
+        loader = ConfigLoader(base_dir=tmp_path, merge=ConfigLoaderMergeMethod.Deep)
+        with pytest.raises(TypeError):
+            loader.load(*names)
+        loader.ignore_error = record
+        assert loader.load(*names) == {"db": {"port": 19}}
+        assert seen == [(TypeError, "l07.yaml")]
+
+    def test_many_layer_merge_error_is_not_refolded(self, tmp_path, monkeypatch):
+        from yaconfiglib.utils import merge as merge_module
+
+        names = []
+        for i in range(20):
+            body = "db: [1]\n" if i == 7 else f"db:\n  port: {i}\n"
+            (tmp_path / f"l{i:02}.yaml").write_text(body)
+            names.append(f"l{i:02}.yaml")
+        folds = []
+        fold = merge_module._fold
+
+        def counting_fold(merge, values, options):
+            folds.append(len(values))
+            return fold(merge, values, options)
+
+        monkeypatch.setattr(merge_module, "_fold", counting_fold)
+        loader = ConfigLoader(
+            base_dir=tmp_path, merge=ConfigLoaderMergeMethod.Deep, ignore_error=True
+        )
+        assert loader.load(*names) == {"db": {"port": 19}}
+        # Only the walk's fold of the clashing "db" values runs; the loader's
+        # per-source replay is the sole fallback.
+        assert folds == [20]
+
     def test_flatten_scalar_result_raises_clear_error(self):
         from yaconfiglib.backends.python_backend import PythonBackend
 
@@ -557,3 +636,355 @@ class TestRecursiveGlob:
         assert {"a": 1} in recursive_docs and {"b": 2} in recursive_docs
         plain_docs = list(ConfigLoader(base_dir=tmp_path).load_all("**/*.yaml"))
         assert plain_docs == [{"b": 2}]
+
+
+class TestIncludeMemo:
+    @staticmethod
+    def _write_tree(tmp_path, count=5):
+        (tmp_path / "common.yaml").write_text("db: {host: h, ports: [1]}\n")
+        (tmp_path / "main.yaml").write_text(
+            "".join(f"s{i}: !include common.yaml\n" for i in range(count))
+        )
+
+    @staticmethod
+    def _count_parses(monkeypatch, tmp_path):
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        calls = []
+        original = YamlConfig.load
+
+        def counting(self, path, **options):
+            if path.name == "common.yaml":
+                calls.append(path)
+            return original(self, path, **options)
+
+        monkeypatch.setattr(YamlConfig, "load", counting)
+        return calls
+
+    def test_repeated_include_parsed_once(self, tmp_path, monkeypatch):
+        self._write_tree(tmp_path)
+        calls = self._count_parses(monkeypatch, tmp_path)
+        result = ConfigLoader(base_dir=tmp_path).load("main.yaml")
+        assert len(calls) == 1
+        assert all(
+            result[f"s{i}"] == {"db": {"host": "h", "ports": [1]}} for i in range(5)
+        )
+
+    def test_memoized_includes_are_private_copies(self, tmp_path):
+        self._write_tree(tmp_path, count=2)
+        result = ConfigLoader(base_dir=tmp_path).load("main.yaml")
+        result["s0"]["db"]["ports"].append(2)
+        assert result["s1"]["db"]["ports"] == [1]
+
+    def test_share_includes_shares_by_reference(self, tmp_path):
+        self._write_tree(tmp_path, count=2)
+        result = ConfigLoader(base_dir=tmp_path, share_includes=True).load("main.yaml")
+        assert result["s0"] is result["s1"]
+
+    def test_memo_is_per_top_level_load(self, tmp_path, monkeypatch):
+        self._write_tree(tmp_path, count=3)
+        calls = self._count_parses(monkeypatch, tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path)
+        loader.load("main.yaml")
+        loader.load("main.yaml")
+        assert len(calls) == 2
+
+    def test_memoize_includes_off(self, tmp_path, monkeypatch):
+        self._write_tree(tmp_path, count=3)
+        calls = self._count_parses(monkeypatch, tmp_path)
+        ConfigLoader(base_dir=tmp_path, memoize_includes=False).load("main.yaml")
+        assert len(calls) == 3
+
+    def test_include_args_are_part_of_the_key(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("k: 1\n")
+        (tmp_path / "b.yaml").write_text("k: 2\n")
+        (tmp_path / "main.yaml").write_text(
+            "x: !include {pathname: [a.yaml, b.yaml], merge: Simple}\n"
+            "y: !include {pathname: [a.yaml, b.yaml], merge: List}\n"
+        )
+        result = ConfigLoader(base_dir=tmp_path).load("main.yaml")
+        assert result == {"x": {"k": 2}, "y": [{"k": 1}, {"k": 2}]}
+
+
+class TestParallelLoading:
+    @staticmethod
+    def _write_layers(tmp_path, count=8):
+        for i in range(count):
+            (tmp_path / f"{i:02}.yaml").write_text(f"last: {i}\nk{i}: {i}\n")
+
+    def test_parallel_matches_serial(self, tmp_path):
+        self._write_layers(tmp_path)
+        sources = [f"{i:02}.yaml" for i in range(8)]
+        serial = ConfigLoader(base_dir=tmp_path).load(sources)
+        parallel = ConfigLoader(base_dir=tmp_path, max_workers=4).load(sources)
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+        assert parallel["last"] == 7
+
+    def test_sources_are_fetched_concurrently(self, tmp_path, monkeypatch):
+        import threading
+
+        from yaconfiglib.backends.yaml import YamlConfig
+
+        self._write_layers(tmp_path, count=3)
+        # Every parse waits for the others: only completes if all run at once.
+        barrier = threading.Barrier(3, timeout=5)
+        original = YamlConfig.load
+
+        def waiting(self, path, **options):
+            barrier.wait()
+            return original(self, path, **options)
+
+        monkeypatch.setattr(YamlConfig, "load", waiting)
+        result = ConfigLoader(base_dir=tmp_path, max_workers=3).load("*.yaml")
+        assert set(result) == {"last", "k0", "k1", "k2"}
+
+    def test_ignore_error_preserved(self, tmp_path):
+        self._write_layers(tmp_path, count=3)
+        (tmp_path / "01.yaml").write_text("bad: [unclosed\n")
+        loader = ConfigLoader(base_dir=tmp_path, max_workers=4, ignore_error=True)
+        result = loader.load("00.yaml", "01.yaml", "02.yaml")
+        assert result == {"last": 2, "k0": 0, "k2": 2}
+
+    def test_first_error_in_source_order_is_raised(self, tmp_path):
+        self._write_layers(tmp_path, count=3)
+        loader = ConfigLoader(base_dir=tmp_path, max_workers=4)
+        with pytest.raises(FileNotFoundError, match="missing-a"):
+            loader.load("00.yaml", "missing-a.yaml", "missing-b.yaml")
+
+    def test_application_executor_is_not_shut_down(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._write_layers(tmp_path, count=4)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            loader = ConfigLoader(base_dir=tmp_path, executor=pool)
+            assert len(loader.load("*.yaml")) == 5
+            assert len(loader.load("*.yaml")) == 5
+            assert pool.submit(lambda: 42).result() == 42
+
+    def test_per_call_override(self, tmp_path):
+        self._write_layers(tmp_path, count=4)
+        loader = ConfigLoader(base_dir=tmp_path)
+        assert len(loader.load("*.yaml", max_workers=2)) == 5
+        assert loader.max_workers is None
+
+
+class TestAsyncLoading:
+    @staticmethod
+    def _write_layers(tmp_path, count=4):
+        for i in range(count):
+            (tmp_path / f"{i:02}.yaml").write_text(f"last: {i}\nk{i}: {i}\n")
+        return [f"{i:02}.yaml" for i in range(count)]
+
+    def test_aload_matches_load(self, tmp_path):
+        import asyncio
+
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path, merge=ConfigLoaderMergeMethod.List)
+        expected = loader.load(sources)
+        assert asyncio.run(loader.aload(sources)) == expected
+
+    def test_aload_ignore_error_and_interpolate(self, tmp_path):
+        import asyncio
+
+        sources = self._write_layers(tmp_path, count=2)
+        (tmp_path / "tpl.yaml").write_text("msg: 'last={{ last }}'\n")
+        loader = ConfigLoader(base_dir=tmp_path, ignore_error=True, interpolate=True)
+        result = asyncio.run(loader.aload(sources, "missing.yaml", "tpl.yaml"))
+        assert result.msg == "last=1"
+
+    def test_aload_raises_in_source_order(self, tmp_path):
+        import asyncio
+
+        loader = ConfigLoader(base_dir=tmp_path)
+        with pytest.raises(FileNotFoundError, match="missing-a"):
+            asyncio.run(loader.aload("missing-a.yaml", "missing-b.yaml"))
+
+    def test_commands_do_not_block_the_event_loop(self):
+        import asyncio
+        import time
+
+        command = "cmd+json://python -c \"import time; time.sleep(0.5); print('{}')\""
+        loader = ConfigLoader(merge=ConfigLoaderMergeMethod.List)
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.05)
+                    ticks += 1
+
+            task = asyncio.ensure_future(ticker())
+            started = time.perf_counter()
+            result = await loader.aload(command, command, command)
+            elapsed = time.perf_counter() - started
+            task.cancel()
+            return result, elapsed, ticks
+
+        result, elapsed, ticks = asyncio.run(main())
+        assert result == [{}, {}, {}]
+        # Three half-second commands ran side by side, and the loop kept ticking.
+        assert elapsed < 1.4
+        assert ticks >= 5
+
+    def test_command_failure(self):
+        import asyncio
+        import subprocess
+
+        loader = ConfigLoader()
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            asyncio.run(loader.aload('cmd://python -c "import sys; sys.exit(3)"'))
+        assert exc_info.value.returncode == 3
+
+    def test_aload_all_yields_in_order(self, tmp_path):
+        import asyncio
+
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path, ignore_error=True)
+
+        async def collect():
+            return [doc.last async for doc in loader.aload_all(sources, "missing.yaml")]
+
+        assert asyncio.run(collect()) == [0, 1, 2, 3]
+
+
+def _touch(path, content):
+    """Rewrite *path* and force a distinct mtime even on coarse filesystems."""
+    import os
+
+    path.write_text(content)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _touch_dir(path):
+    import os
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestIncrementalReload:
+    @staticmethod
+    def _write_layers(tmp_path, count=5):
+        for i in range(count):
+            (tmp_path / f"{i:02}.yaml").write_text(f"last: {i}\nk{i}: {i}\n")
+        return [f"{i:02}.yaml" for i in range(count)]
+
+    def test_unchanged_reload_parses_nothing(self, tmp_path):
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path)
+        handle = loader.load_handle(sources)
+        assert handle.value == loader.load(sources)
+        assert len(handle.parsed) == 5
+        assert loader.reload(handle) is handle.value
+        assert handle.parsed == []
+
+    def test_only_changed_layer_is_reparsed(self, tmp_path):
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path, merge=ConfigLoaderMergeMethod.Deep)
+        handle = loader.load_handle(sources)
+        _touch(tmp_path / "03.yaml", "last: changed\nk3: [3]\n")
+        result = loader.reload(handle)
+        assert [p.name for p in handle.parsed] == ["03.yaml"]
+        assert result == loader.load(sources)
+        assert result["last"] == 4 and result["k3"] == [3]
+
+    def test_reload_does_not_see_earlier_merge_mutations(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("db: {opts: [1]}\n")
+        (tmp_path / "b.yaml").write_text("db: {opts: [2]}\n")
+        loader = ConfigLoader(
+            base_dir=tmp_path,
+            merge=ConfigLoaderMergeMethod.Deep,
+            merge_options={"mergelists": True},
+        )
+        handle = loader.load_handle("a.yaml", "b.yaml")
+        handle.value["db"]["opts"].append(99)
+        _touch(tmp_path / "b.yaml", "db: {opts: [3]}\n")
+        assert loader.reload(handle) == loader.load("a.yaml", "b.yaml")
+
+    def test_changed_include_invalidates_its_layer(self, tmp_path):
+        sources = self._write_layers(tmp_path, count=2)
+        (tmp_path / "inc.yaml").write_text("v: 1\n")
+        (tmp_path / "02.yaml").write_text("inc: !include inc.yaml\n")
+        loader = ConfigLoader(base_dir=tmp_path)
+        handle = loader.load_handle(sources, "02.yaml")
+        _touch(tmp_path / "inc.yaml", "v: 2\n")
+        assert loader.reload(handle)["inc"] == {"v": 2}
+        assert [p.name for p in handle.parsed] == ["02.yaml"]
+
+    def test_glob_additions_and_removals(self, tmp_path):
+        conf = tmp_path / "conf.d"
+        conf.mkdir()
+        (conf / "a.yaml").write_text("a: 1\n")
+        loader = ConfigLoader(base_dir=tmp_path)
+        handle = loader.load_handle("conf.d/*.yaml")
+        (conf / "b.yaml").write_text("b: 2\n")
+        _touch_dir(conf)
+        assert loader.reload(handle) == {"a": 1, "b": 2}
+        assert [p.name for p in handle.parsed] == ["b.yaml"]
+        (conf / "a.yaml").unlink()
+        _touch_dir(conf)
+        assert loader.reload(handle) == {"b": 2}
+        assert [p.name for p in handle.sources] == ["b.yaml"]
+
+    def test_ignored_errors_stay_ignored(self, tmp_path):
+        sources = self._write_layers(tmp_path, count=2)
+        loader = ConfigLoader(base_dir=tmp_path, ignore_error=True)
+        handle = loader.load_handle(sources, "missing.yaml")
+        assert handle.value == {"last": 1, "k0": 0, "k1": 1}
+        (tmp_path / "missing.yaml").write_text("late: true\n")
+        assert loader.reload(handle)["late"] is True
+
+    def test_foreign_handle_rejected(self, tmp_path):
+        sources = self._write_layers(tmp_path, count=1)
+        handle = ConfigLoader(base_dir=tmp_path).load_handle(sources)
+        with pytest.raises(ValueError):
+            ConfigLoader(base_dir=tmp_path).reload(handle)
+
+
+class TestLazyMerge:
+    @staticmethod
+    def _write_layers(tmp_path):
+        (tmp_path / "a.yaml").write_text("db: {host: a, opts: [1]}\nname: base\n")
+        (tmp_path / "b.yaml").write_text("db: {opts: [2], port: 5432}\n")
+        return ["a.yaml", "b.yaml"]
+
+    def test_lazy_matches_deep(self, tmp_path):
+        from yaconfiglib.utils.lazy import LazyMergeView
+
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path, merge="lazy")
+        result = loader.load(sources)
+        assert isinstance(result, LazyMergeView)
+        assert result.db.port == 5432
+        eager = ConfigLoader(base_dir=tmp_path, merge="Deep").load(sources)
+        assert result.materialize() == eager
+
+    def test_lazy_with_other_semantics(self, tmp_path):
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path, merge="Simple", lazy=True)
+        assert loader.load(sources).db == {"opts": [2], "port": 5432}
+
+    def test_per_call_lazy(self, tmp_path):
+        sources = self._write_layers(tmp_path)
+        loader = ConfigLoader(base_dir=tmp_path)
+        assert loader.load(sources, merge="lazy").get("db.host") == "a"
+        assert isinstance(loader.load(sources), dict)
+
+    def test_lazy_rejects_collecting_merges(self):
+        with pytest.raises(ValueError):
+            ConfigLoader(merge="List", lazy=True)
+
+    def test_non_mapping_layers_merge_eagerly(self, tmp_path):
+        (tmp_path / "a.json").write_text("[1]")
+        (tmp_path / "b.json").write_text("[2]")
+        loader = ConfigLoader(base_dir=tmp_path, merge="lazy")
+        assert loader.load("a.json", "b.json") == [1, 2]
+
+    def test_lazy_then_interpolate(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("host: db\nurl: 'pg://{{ host }}'\n")
+        loader = ConfigLoader(base_dir=tmp_path, merge="lazy", interpolate=True)
+        assert loader.load("a.yaml").url == "pg://db"
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 
 import pytest
 
+from yaconfiglib.utils.lazy import LazyMergeView
 from yaconfiglib.utils.merge import (
     MergeMethod,
     OpaqueMerge,
@@ -210,6 +211,253 @@ class TestDeepMerge:
         result = self.m(a, b, mergelists=True)
         assert result == [{"k": 2}, {"p": 1}, {"q": 2}]
 
+    def test_merge_key_matches_by_name(self):
+        a = {"servers": [{"name": "a", "port": 80}, {"name": "b", "port": 80}]}
+        b = {"servers": [{"name": "b", "port": 8080}, {"name": "c", "port": 80}]}
+        result = MergeMethod.Deep(a, b, merge_key="name")
+        assert result["servers"] == [
+            {"name": "a", "port": 80},
+            {"name": "b", "port": 8080},
+            {"name": "c", "port": 80},
+        ]
+
+    def test_merge_key_overrides_positional_merge(self):
+        a = [{"name": "a", "v": 1}, {"name": "b", "v": 1}]
+        b = [{"name": "b", "v": 2}]
+        assert MergeMethod.Deep(a, b, mergelists=True, merge_key="name") == [
+            {"name": "a", "v": 1},
+            {"name": "b", "v": 2},
+        ]
+
+    def test_merge_key_callable_and_unkeyed_items(self):
+        a = [{"id": 1, "tags": ["x"]}, {"other": True}, "s"]
+        b = [{"id": 1, "tags": ["y"]}, {"other": False}, "s", "t", {"id": 2}]
+        result = MergeMethod.Deep(a, b, merge_key=lambda item: item.get("id"))
+        assert result == [
+            {"id": 1, "tags": ["x", "y"]},
+            {"other": True},
+            "s",
+            {"other": False},
+            "t",
+            {"id": 2},
+        ]
+
+    def test_merge_key_collapses_repeated_keys(self):
+        b = [{"name": "n", "a": 1}, {"name": "n", "b": 2}]
+        assert MergeMethod.Deep([], b, merge_key="name") == [
+            {"name": "n", "a": 1, "b": 2}
+        ]
+
+    def test_merge_key_with_structural_sharing(self):
+        a = {"s": [{"name": "a", "v": 1}, {"name": "b", "v": 1}]}
+        b = {"s": [{"name": "a", "v": 2}]}
+        result = MergeMethod.Deep(a, b, merge_key="name", structural_sharing=True)
+        assert result["s"] == [{"name": "a", "v": 2}, {"name": "b", "v": 1}]
+        assert result["s"][1] is a["s"][1]
+        assert a["s"][0] == {"name": "a", "v": 1}
+
+    def test_large_list_dedup_keeps_order(self):
+        a = list(range(0, 400, 2)) + [[1, 2], (1, 2), {"k": 1}]
+        b = list(range(400, 0, -3)) + [[1, 2], [2, 1], (1, 2), 1.0, True]
+        expected = list(a)
+        for item in b:
+            if item not in expected:
+                expected.append(item)
+        assert self.m(list(a), b) == expected
+
+    def test_large_list_dedup_uses_equality_semantics(self):
+        from collections import UserList
+
+        padding = list(range(100, 120))
+        result = self.m([1, UserList([5]), "x"] + padding, [True, 1.0, [5], b"x", "x"])
+        # True == 1.0 == 1 and [5] == UserList([5]); b"x" != "x".
+        assert result == [1, UserList([5]), "x"] + padding + [b"x"]
+
+    def test_large_list_dedup_mergelists(self):
+        a = [{"k": 1}] + list(range(30))
+        b = [{"k": 2}] + list(range(20, 40))
+        result = self.m(a, b, mergelists=True)
+        assert result == [{"k": 2}] + list(range(40))
+
+    def test_nesting_beyond_recursion_limit(self):
+        import sys
+
+        depth = sys.getrecursionlimit() * 2
+        a, b = {}, {}
+        node_a, node_b = a, b
+        for i in range(depth):
+            node_a["x"], node_b["x"] = {"a": i}, {"b": i}
+            node_a, node_b = node_a["x"], node_b["x"]
+        for method in (MergeMethod.Deep, MergeMethod.Substitute):
+            node = method(a, b)
+            for _ in range(depth):
+                node = node["x"]
+            assert node == {"a": depth - 1, "b": depth - 1}
+
+    def test_exotic_types_take_the_abc_path(self):
+        from collections import OrderedDict, UserList
+        from types import MappingProxyType
+
+        result = self.m(
+            OrderedDict(a=UserList([1]), b=MappingProxyType({"x": 1})),
+            {"a": (1, 2), "b": {"y": 2}},
+        )
+        assert isinstance(result, OrderedDict)
+        assert result["a"] == UserList([1, 2])
+        assert result["b"] == {"x": 1, "y": 2}
+
+    def test_shared_subtrees_are_merged_once(self):
+        base = {"image": "app", "ports": [{"port": 80}]}
+        overlay = {"ports": [{"port": 443}], "replicas": 2}
+        a = {f"svc{i}": base for i in range(300)}
+        b = {f"svc{i}": overlay for i in range(300)}
+        result = MergeMethod.Deep(a, b, structural_sharing=True)
+        assert result["svc0"] is result["svc299"]
+        assert result["svc0"]["ports"] == [{"port": 80}, {"port": 443}]
+        assert base["ports"] == [{"port": 80}]
+
+    def test_in_place_merge_repeats_pairs(self):
+        # In place, a changes between two merges of the same pair, so an
+        # earlier result must not be reused.
+        b = {"n": 1}
+        assert MergeMethod.Substitute({"n": 0}, [b, {"n": 2}, b]) == {"n": 1}
+        item = {"l": [{"x": 1}]}
+        for sharing in (False, True):
+            result = MergeMethod.Deep(
+                {"l": []}, [item, item], structural_sharing=sharing
+            )
+            assert result == {"l": [{"x": 1}, {"x": 1}]}
+
+    def test_shared_subtrees_stay_shared_with_structural_sharing(self):
+        base, overlay = {"x": [1]}, {"x": [2]}
+        result = MergeMethod.Deep(
+            {"a": base, "b": base},
+            {"a": overlay, "b": overlay},
+            structural_sharing=True,
+        )
+        assert result["a"] is result["b"]
+        assert result["a"] == {"x": [1, 2]} and base == {"x": [1]}
+
+    @pytest.mark.parametrize(
+        "method", [MergeMethod.Simple, MergeMethod.Deep, MergeMethod.Substitute]
+    )
+    def test_cycles_raise(self, method):
+        a, b = {"v": 1}, {"v": 2}
+        a["self"], b["self"] = a, b
+        if method is MergeMethod.Simple:
+            # Shallow: never descends, so the cycle is harmless.
+            assert method(a, b)["v"] == 2
+            return
+        with pytest.raises(ValueError, match="cyclic"):
+            method(a, b)
+
+    def test_memo_is_the_callers_identity_map(self):
+        shared = {"k": 1}
+        memo = {}
+        MergeMethod.Deep({"x": {}}, {"x": shared}, memo=memo, structural_sharing=True)
+        assert any(entry[1] is shared for entry in memo.values())
+
+
+# ---------------------------------------------------------------------------
+# structural_sharing
+# ---------------------------------------------------------------------------
+
+
+class TestStructuralSharing:
+    @pytest.mark.parametrize(
+        "method", [MergeMethod.Simple, MergeMethod.Deep, MergeMethod.Substitute]
+    )
+    def test_inputs_are_not_mutated(self, method):
+        import copy
+
+        a = {"db": {"host": "a", "opts": [1]}, "keep": {"x": [1, 2]}}
+        b = {"db": {"host": "b", "opts": [2]}, "new": {"y": 1}}
+        before_a, before_b = copy.deepcopy(a), copy.deepcopy(b)
+        shared = method(a, b, structural_sharing=True)
+        assert a == before_a and b == before_b
+        assert shared == method(before_a, before_b)
+
+    def test_unchanged_subtrees_are_reused(self):
+        a = {"db": {"host": "a", "port": 5432}, "cache": {"ttl": [1, 2]}}
+        b = {"db": {"host": "b"}, "extra": {"z": 1}}
+        result = MergeMethod.Deep(a, b, structural_sharing=True)
+        assert result is not a and result["db"] is not a["db"]
+        assert result["cache"] is a["cache"]
+        assert result["extra"] is b["extra"]
+
+    def test_no_op_merge_returns_input(self):
+        a = {"db": {"host": "a", "tags": ["x"]}, "n": 1}
+        b = {"db": {"host": "a", "tags": ["x"]}, "n": 1}
+        assert MergeMethod.Deep(a, b, structural_sharing=True) is a
+        # Substitute replaces lists wholesale, so only the spine to them is new.
+        result = MergeMethod.Substitute(a, b, structural_sharing=True)
+        assert result["db"]["tags"] is b["db"]["tags"]
+
+    def test_mergelists_positional_merge_copies_list(self):
+        a = {"items": [{"k": 1}, "s"]}
+        b = {"items": [{"k": 2}]}
+        result = MergeMethod.Deep(a, b, mergelists=True, structural_sharing=True)
+        assert result == {"items": [{"k": 2}, "s"]}
+        assert a == {"items": [{"k": 1}, "s"]}
+
+
+# ---------------------------------------------------------------------------
+# merge_many
+# ---------------------------------------------------------------------------
+
+
+def _layers():
+    return [
+        {"db": {"host": "a", "port": 1}, "tags": ["x"], "n": {"v": 1}},
+        {"db": {"port": 2, "opts": {"ssl": True}}, "tags": ["y", "x"]},
+        {"db": {"opts": {"ssl": False}}, "n": {"nested": [1]}},
+        {"db": {"host": "c"}, "n": {"nested": [2]}, "extra": (1, 2)},
+        {"tags": ["z"], "n": {"v": None}},
+    ]
+
+
+class TestMergeMany:
+    @pytest.mark.parametrize(
+        "method",
+        [MergeMethod.Simple, MergeMethod.Deep, MergeMethod.Substitute],
+    )
+    @pytest.mark.parametrize("mergelists", [False, True])
+    def test_matches_pairwise_fold(self, method, mergelists):
+        expected = None
+        for doc in _layers():
+            expected = method(expected, doc, mergelists=mergelists)
+        layers = _layers()
+        result = method.merge_many(layers, mergelists=mergelists)
+        assert result == expected
+
+    def test_structural_sharing_keeps_inputs(self):
+        import copy
+
+        layers = _layers()
+        before = copy.deepcopy(layers)
+        MergeMethod.Deep.merge_many(layers, structural_sharing=True)
+        assert layers == before
+
+    def test_error_matches_pairwise(self):
+        layers = [{"a": {"b": 1}}, {"a": {"b": {"c": 1}}}, {"a": {"b": [1]}}]
+        with pytest.raises(Exception) as pairwise:
+            MergeMethod.Deep(MergeMethod.Deep(*layers[:2]), layers[2])
+        with pytest.raises(type(pairwise.value)):
+            MergeMethod.Deep.merge_many(layers)
+
+    def test_no_refold_raises_and_keeps_inputs(self):
+        import copy
+
+        layers = [{"a": {"b": 1}}, {"a": {"b": {"c": 1}}}, {"a": {"b": [1]}}]
+        before = copy.deepcopy(layers)
+        with pytest.raises(Exception):
+            MergeMethod.Deep.merge_many(layers, refold=False)
+        assert layers == before
+
+    def test_empty_and_single(self):
+        assert MergeMethod.Deep.merge_many([]) is None
+        assert MergeMethod.Deep.merge_many([{"a": 1}]) == {"a": 1}
+
 
 # ---------------------------------------------------------------------------
 # typed_merge
@@ -409,3 +657,77 @@ class TestTypedMergeHooks:
         for name in ("OpaqueMerge", "opaque", "TypedNamespace"):
             assert name in yaconfiglib.__all__
             assert getattr(yaconfiglib, name) is not None
+
+
+class TestLazyMergeView:
+    LAYERS = [
+        {"db": {"host": "a", "opts": [1], "tls": None}, "name": "base", "n": 1},
+        None,
+        {"db": {"opts": [2], "tls": {"on": True}}, "extra": [1]},
+        {"db": {"port": 5432}, "n": None},
+    ]
+
+    @staticmethod
+    def _eager(method, layers, **options):
+        import copy
+
+        layers = copy.deepcopy(layers)
+        result = layers[0]
+        for layer in layers[1:]:
+            result = method(result, layer, **options)
+        return result
+
+    @pytest.mark.parametrize("name", ["Simple", "Deep", "Substitute"])
+    def test_matches_eager_merge(self, name):
+        method = MergeMethod[name]
+        view = LazyMergeView(self.LAYERS, method)
+        eager = self._eager(method, self.LAYERS)
+        assert view.materialize() == eager
+        assert list(view) == list(eager)
+
+    def test_resolves_on_access_and_memoizes(self):
+        view = LazyMergeView(self.LAYERS, MergeMethod.Deep)
+        assert view._resolved == {}
+        db = view["db"]
+        assert set(view._resolved) == {"db"}
+        assert view["db"] is db
+        assert db["opts"] == [1, 2]
+
+    def test_mixed_types_fold_on_copies(self):
+        a = {"k": [1]}
+        b = {"k": [2]}
+        view = LazyMergeView([a, b], MergeMethod.Deep)
+        assert view["k"] == [1, 2]
+        assert a == {"k": [1]} and b == {"k": [2]}
+
+    def test_merge_errors_surface_on_access(self):
+        view = LazyMergeView([{"k": 1}, {"k": {"x": 1}}, {"ok": 1}], MergeMethod.Deep)
+        assert view["ok"] == 1
+        with pytest.raises(TypeError):
+            view["k"]
+
+    def test_attribute_and_dotted_access(self):
+        view = LazyMergeView(self.LAYERS, MergeMethod.Deep)
+        assert view.db.tls.on is True
+        assert view.get("db.port") == 5432
+        assert view.get("db.missing", "dflt") == "dflt"
+        with pytest.raises(AttributeError):
+            view.missing
+
+    def test_read_only(self):
+        view = LazyMergeView([{"a": 1}], MergeMethod.Simple)
+        with pytest.raises(TypeError):
+            view["a"] = 2
+        with pytest.raises(TypeError):
+            view.a = 2
+
+    def test_materialize_is_independent(self):
+        layer = {"a": {"b": [1]}}
+        plain = LazyMergeView([layer], MergeMethod.Deep).materialize()
+        assert type(plain) is dict and type(plain["a"]) is dict
+        plain["a"]["b"].append(2)
+        assert layer == {"a": {"b": [1]}}
+
+    def test_rejects_unsupported_merge(self):
+        with pytest.raises(ValueError):
+            LazyMergeView([{}], merge=lambda a, b, **kw: b)
@@ -58,3 +58,35 @@ class TestStreamsThroughLoad:
 
         loader = ConfigLoader()
         assert loader.load(b"#!doc.yaml\nk: v\n") == {"k": "v"}
+
+
+class TestMemorySources:
+    def test_memory_docs_are_not_materialized(self):
+        from yaconfiglib.utils.source import MemorySource
+
+        (path,) = parse_sources(["#!conf/app.json\n{}"])
+        assert isinstance(path, MemorySource)
+        assert path.name == "app.json"
+        assert path.data == "{}"
+
+    def test_buffers_are_wrapped_without_copying(self):
+        buffer = bytearray(b"k: v\n")
+        view = memoryview(b"x: 1\n")
+        first, second = parse_sources([buffer, view])
+        assert first.data is buffer
+        assert second.data is view
+        assert first.suffix == second.suffix == ".yaml"
+
+    def test_memory_source_passes_through(self):
+        from yaconfiglib.utils.source import memory_source
+
+        source = memory_source("x: 1\n", "doc.yaml")
+        assert list(parse_sources([source])) == [source]
+        assert list(parse_sources([source]))[0] is source
+
+    def test_buffers_through_load(self):
+        from yaconfiglib import ConfigLoader, loads
+
+        assert ConfigLoader().load(memoryview(b"k: v\n")) == {"k": "v"}
+        assert loads(bytearray(b'{"k": 1}'), loader="json") == {"k": 1}
+        assert loads(memoryview(b"k: 2\n")) == {"k": 2}